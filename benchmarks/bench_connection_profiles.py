@@ -0,0 +1,68 @@
+# benchmarks/bench_connection_profiles.py
+"""
+Meet de latentie van het starten en stoppen van een werksessie onder elk
+verbindingsprofiel uit data/connection.py.
+
+Gebruik:
+    python -m benchmarks.bench_connection_profiles --iterations 200 [--dir /pad/naar/netwerkschijf]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from data.connection import CONNECTION_PROFILES
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+
+
+def _measure_profile(db_path: str, profile: str, iterations: int):
+    """Start en stopt `iterations` sessies en retourneert de latenties in milliseconden."""
+    db = Database(db_path, pragmas=CONNECTION_PROFILES[profile])
+    try:
+        project = Project(name=f"Benchmark {profile}")
+        db.add_project_to_db(project)
+        start_latencies, stop_latencies = [], []
+        for _ in range(iterations):
+            session = WorkSession(project_id=project.proj_id, start_time=datetime.now())
+            begin = time.perf_counter()
+            db.add_work_session_to_db(session)
+            start_latencies.append((time.perf_counter() - begin) * 1000)
+
+            session.end_time = datetime.now()
+            begin = time.perf_counter()
+            db.update_work_session_in_db(session)
+            stop_latencies.append((time.perf_counter() - begin) * 1000)
+        return start_latencies, stop_latencies
+    finally:
+        db.close()
+
+
+def _describe(latencies):
+    """Gemiddelde, mediaan en 95e percentiel in ms."""
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"gem {statistics.mean(ordered):7.3f}  p50 {statistics.median(ordered):7.3f}  p95 {p95:7.3f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200, help="Aantal start/stop-cycli per profiel")
+    parser.add_argument("--dir", help="Map waarin de testdatabases komen (default: tijdelijke map)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp_dir:
+        print(f"Start/stop-latentie in ms over {args.iterations} cycli ({tmp_dir})")
+        for profile in CONNECTION_PROFILES:
+            db_path = os.path.join(tmp_dir, f"bench_{profile}.db")
+            start_latencies, stop_latencies = _measure_profile(db_path, profile, args.iterations)
+            print(f"  {profile:<12} start: {_describe(start_latencies)}")
+            print(f"  {'':<12} stop:  {_describe(stop_latencies)}")
+
+
+if __name__ == "__main__":
+    main()
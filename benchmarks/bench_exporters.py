@@ -0,0 +1,100 @@
+# benchmarks/bench_exporters.py
+"""
+Vergelijkt de exportformaten uit services.exporters op één groot project:
+bestandsgrootte, schrijftijd en de tijd om het bestand volledig terug in te lezen.
+
+Gebruik:
+    python -m benchmarks.bench_exporters --sessions 200000 [--storage epoch] [--formats csv,columnar]
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import os
+import tempfile
+import time
+
+from data.database import Database
+from db_seed import generate_dataset
+from services.exporters import EXPORTERS, get_exporter, read_columnar
+
+
+def _read_csv(path: str) -> int:
+    with open(path, newline="") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+def _read_csv_gz(path: str) -> int:
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+def _read_csv_zst(path: str) -> int:
+    import zstandard
+    with open(path, "rb") as raw, zstandard.ZstdDecompressor().stream_reader(raw) as decompressed:
+        return sum(1 for _ in csv.reader(io.TextIOWrapper(decompressed, encoding="utf-8", newline=""))) - 1
+
+
+def _read_columnar(path: str) -> int:
+    _, columns = read_columnar(path)
+    return len(columns["id"])
+
+
+_READERS = {
+    "csv": _read_csv,
+    "csv.gz": _read_csv_gz,
+    "csv.zst": _read_csv_zst,
+    "columnar": _read_columnar,
+}
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200_000, help="Aantal werksessies in het project")
+    parser.add_argument("--db", help="Pad naar de benchmark-database (default: tijdelijk bestand)")
+    parser.add_argument("--storage", choices=("iso", "epoch"), default="iso", help="Opslagformaat van de tijdstippen")
+    parser.add_argument("--formats", default=",".join(EXPORTERS), help="Kommagescheiden formaten")
+    args = parser.parse_args()
+
+    formats = [name.strip() for name in args.formats.split(",") if name.strip()]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = args.db or os.path.join(tmp_dir, "bench_exporters.db")
+        db = Database(db_path, timestamp_storage=args.storage)
+        try:
+            if not db.get_all_projects_including_archived():
+                print(f"Database vullen met één project van {args.sessions} sessies...")
+                _, elapsed = _timed(generate_dataset, db, 1, args.sessions, 3.0, 0.0)
+                print(f"  klaar in {elapsed:.1f}s")
+            project = max(db.get_active_project_summaries(), key=lambda s: s.session_count).project
+
+            print(f"{'formaat':<10} {'grootte':>12} {'t.o.v. csv':>11} {'schrijven':>11} {'lezen':>10}")
+            csv_size = None
+            for name in formats:
+                exporter = get_exporter(name)
+                path = os.path.join(tmp_dir, f"export.{exporter.extension}")
+                try:
+                    rows, write_time = _timed(exporter.export, db, project, path)
+                except RuntimeError as e:
+                    print(f"{name:<10} overgeslagen: {e}")
+                    continue
+                read_rows, read_time = _timed(_READERS[name], path)
+                if read_rows != rows:
+                    raise SystemExit(f"{name}: {rows} rijen geschreven maar {read_rows} gelezen")
+
+                size = os.path.getsize(path)
+                csv_size = csv_size or (size if name == "csv" else None)
+                ratio = f"{size / csv_size:.1%}" if csv_size else "-"
+                print(f"{name:<10} {size / 1024 / 1024:>9.2f} MiB {ratio:>11} {write_time:>10.2f}s {read_time:>9.2f}s")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
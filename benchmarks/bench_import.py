@@ -0,0 +1,77 @@
+# benchmarks/bench_import.py
+"""
+Meet de doorvoer en het geheugengebruik van de CSV-import (services/csv_import.py).
+
+Er wordt een CSV-bestand in het exportformaat gegenereerd met `--rows` opeenvolgende,
+niet-overlappende sessies (plus een deel bewust overlappende rijen), dat daarna in een
+lege database geïmporteerd wordt. Het geheugengebruik (max. RSS) mag niet meegroeien
+met het aantal rijen.
+
+Gebruik:
+    python -m benchmarks.bench_import --rows 1000000 [--overlap 0.01] [--batch-size 50000]
+"""
+
+import argparse
+import csv
+import os
+import random
+import resource
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from data.database import Database
+from data.rollup import check_rollup
+from services.csv_export import FIELDNAMES
+from services.csv_import import import_sessions_from_csv
+
+
+def write_csv(file_path: str, rows: int, projects: int, overlap: float, seed: int = 42):
+    """Schrijft `rows` sessies; een fractie `overlap` start binnen de vorige sessie."""
+    rng = random.Random(seed)
+    moment = datetime(2015, 1, 1, 8, 0)
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for _ in range(rows):
+            duration = timedelta(minutes=rng.randint(5, 240))
+            start = moment - duration / 2 if rng.random() < overlap else moment
+            end = start + duration
+            project = rng.randrange(projects)
+            writer.writerow([project + 1, f"Project {project}", start.strftime("%Y-%m-%d %H:%M:%S"),
+                             end.strftime("%Y-%m-%d %H:%M:%S"), "", f"Taak {rng.randrange(1000)}"])
+            moment = max(moment, end) + timedelta(minutes=rng.randint(0, 120))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Aantal rijen in het CSV-bestand")
+    parser.add_argument("--projects", type=int, default=50, help="Aantal projecten")
+    parser.add_argument("--overlap", type=float, default=0.01, help="Fractie overlappende rijen")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Rijen per transactie")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "import.csv")
+        started = time.perf_counter()
+        write_csv(csv_path, args.rows, args.projects, args.overlap)
+        print(f"CSV met {args.rows} rijen ({os.path.getsize(csv_path) / 2**20:.1f} MiB) "
+              f"geschreven in {time.perf_counter() - started:.1f}s")
+
+        db = Database(os.path.join(tmp_dir, "import.db"))
+        try:
+            rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            result = import_sessions_from_csv(db, csv_path, batch_size=args.batch_size)
+            rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            consistent = not check_rollup(db.connection, db.timestamp_storage)
+        finally:
+            db.close()
+
+    print(f"{result.rows} rijen in {result.seconds:.2f}s ({result.rows_per_second:,.0f} rijen/s): "
+          f"{result.imported} geïmporteerd, {result.overlapping} overlappend, {result.invalid} ongeldig")
+    print(f"Max. RSS: {rss_after / 1024:.0f} MiB (+{(rss_after - rss_before) / 1024:.0f} MiB tijdens de import)")
+    print(f"Dagtotalen consistent: {'ja' if consistent else 'NEE'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_memory.py
+"""
+Meet het geheugengebruik per werksessie bij het laden van alle sessies:
+- vóór: een gewone @dataclass zonder __slots__ (de oorspronkelijke WorkSession)
+- na:   de huidige WorkSession met __slots__
+- na:   WorkSessionArray (getypeerde arrays, WorkSession-objecten enkel op aanvraag)
+
+Gebruik:
+    python -m benchmarks.bench_memory --sessions 1000000 [--db pad.db]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from data.database import Database
+from db_seed import generate_dataset
+from models.work_session import WorkSession
+
+
+@dataclass
+class _PlainWorkSession:
+    """De oorspronkelijke WorkSession: een @dataclass zonder __slots__."""
+    project_id: int
+    start_time: datetime
+    description: str = ""
+    end_time: Optional[datetime] = None
+    id: Optional[int] = None
+
+
+def _load_objects(db: Database, session_class) -> list:
+    """Laadt alle sessies als objecten, zoals get_work_sessions_for_project dat per project doet."""
+    rows = db.connection.execute("SELECT id, project_id, start_time, end_time, description FROM work_sessions")
+    return [session_class(
+        project_id=row["project_id"],
+        start_time=db._from_db(row["start_time"]),
+        description=row["description"] or "",
+        end_time=db._from_db(row["end_time"]),
+        id=row["id"]
+    ) for row in rows]
+
+
+def _measure(load: Callable[[], object]):
+    """Retourneert (resultaat, bytes die na het laden in gebruik blijven, piek, seconden)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = load()
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=1_000_000, help="Aantal werksessies (default 1M)")
+    parser.add_argument("--projects", type=int, default=200, help="Aantal projecten (default 200)")
+    parser.add_argument("--db", help="Pad naar de benchmark-database (default: tijdelijk bestand)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(args.db or os.path.join(tmp_dir, "bench_memory.db"))
+        try:
+            if not db.get_all_projects_including_archived():
+                print(f"Database vullen met {args.sessions} sessies over {args.projects} projecten...")
+                generate_dataset(db, args.projects, args.sessions // args.projects)
+
+            cases = [
+                ("dataclass zonder __slots__ (vóór)", lambda: _load_objects(db, _PlainWorkSession)),
+                ("WorkSession met __slots__", lambda: _load_objects(db, WorkSession)),
+                ("WorkSessionArray", db.get_work_session_array),
+            ]
+            print(f"{'representatie':<36} {'bytes/sessie':>13} {'totaal':>11} {'piek':>11} {'laadtijd':>9}")
+            baseline = None
+            for name, load in cases:
+                result, current, peak, elapsed = _measure(load)
+                per_session = current / max(len(result), 1)
+                baseline = baseline or per_session
+                print(f"{name:<36} {per_session:>13.1f} {current / 2**20:>7.1f} MiB {peak / 2**20:>7.1f} MiB "
+                      f"{elapsed:>8.2f}s  ({per_session / baseline:.0%})")
+                del result
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_reports.py
+"""
+Vergelijkt de rapportage in SQLite (Database.get_total_seconds_per_*) met het
+bestaande Python-pad (sessies laden en Project.total_seconds optellen).
+
+Gebruik:
+    python -m benchmarks.bench_reports --sessions 1000000 --projects 200 [--storage epoch]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections import defaultdict
+
+from data.database import Database
+from db_seed import generate_dataset
+
+
+def _python_reports(db: Database):
+    """Het bestaande pad: alle sessies als WorkSession laden en in Python optellen."""
+    per_project = {}
+    per_period = {"day": defaultdict(int), "week": defaultdict(int), "month": defaultdict(int)}
+    for project in db.get_all_projects_including_archived():
+        project.work_sessions = db.get_work_sessions_for_project(project.proj_id)
+        per_project[project.proj_id] = project.total_seconds
+        for session in project.work_sessions:
+            if session.is_active:
+                continue
+            # Per sessie afronden gebeurt niet: sommeer exact zoals Project.total_seconds.
+            seconds = session.duration.total_seconds()
+            year, week, _ = session.start_time.isocalendar()
+            per_period["day"][session.start_time.strftime("%Y-%m-%d")] += seconds
+            per_period["week"][f"{year}-W{week:02d}"] += seconds
+            per_period["month"][session.start_time.strftime("%Y-%m")] += seconds
+    return per_project, {
+        period: {key: int(value) for key, value in sorted(totals.items())}
+        for period, totals in per_period.items()
+    }
+
+
+def _sql_reports(db: Database):
+    """Het nieuwe pad: aggregatie in SQLite, enkel getallen terug naar Python."""
+    per_project = db.get_total_seconds_per_project()
+    per_period = {period: db.get_total_seconds_per_period(period) for period in ("day", "week", "month")}
+    return per_project, per_period
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=1_000_000, help="Aantal werksessies (default 1M)")
+    parser.add_argument("--projects", type=int, default=200, help="Aantal projecten (default 200)")
+    parser.add_argument("--db", help="Pad naar de benchmark-database (default: tijdelijk bestand)")
+    parser.add_argument("--storage", choices=("iso", "epoch"), default="iso",
+                        help="Opslagformaat van de tijdstippen (een bestaande ISO-database wordt omgezet)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = args.db or os.path.join(tmp_dir, "bench_reports.db")
+        db = Database(db_path, timestamp_storage=args.storage)
+        try:
+            if not db.get_all_projects_including_archived():
+                print(f"Database vullen met {args.sessions} sessies over {args.projects} projecten...")
+                _, elapsed = _timed(generate_dataset, db, args.projects, args.sessions // args.projects)
+                print(f"  klaar in {elapsed:.1f}s")
+
+            (py_projects, py_periods), py_time = _timed(_python_reports, db)
+            (sql_projects, sql_periods), sql_time = _timed(_sql_reports, db)
+        finally:
+            db.close()
+
+    print(f"Python-pad (laden + optellen): {py_time:8.3f}s")
+    print(f"SQL-pad (aggregatie):          {sql_time:8.3f}s  ({py_time / sql_time:.1f}x sneller)")
+
+    identical = py_projects == sql_projects and py_periods == sql_periods
+    print(f"Resultaten identiek: {'ja' if identical else 'NEE'}")
+    if not identical:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_startup.py
+"""
+Meet de opstarttijd van de tracker, zoals bij een aanroep vanuit een shell-prompt of hook.
+
+Elke meting is de mediaan over `--runs` verse Python-processen:
+  - opstarttijd: de wandkloktijd van het echte commando `python main.py status` op een database
+    waarvan het schema al up-to-date is, min die van een lege interpreter (`python -c pass`);
+    deze moet onder `--target` ms blijven, anders is de exitcode 1;
+  - ter info de importtijd van `config` en `data.database` alleen, gemeten binnen het proces.
+
+Gebruik:
+    python -m benchmarks.bench_startup [--runs 20] [--target 50]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = (
+    "import time; started = time.perf_counter(); import config, data.database; "
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+
+def _run(args: List[str], env: Dict[str, str]) -> float:
+    """Wandkloktijd (ms) van één proces; een mislukte aanroep breekt de meting af."""
+    started = time.perf_counter()
+    subprocess.run(args, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - started) * 1000
+
+
+def measure(runs: int, db_path: str) -> Dict[str, float]:
+    env = dict(os.environ, DB_PATH=db_path)
+    # Zonder bytecode-cache wordt elke module bij elke start opnieuw gecompileerd; dat meet iets anders.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    # Opwarmen: bytecode-cache, bestandssysteemcache en het eenmalig aanmaken van het schema.
+    _run([sys.executable, "main.py", "status"], env)
+
+    interpreter = [_run([sys.executable, "-c", "pass"], env) for _ in range(runs)]
+    status = [_run([sys.executable, "main.py", "status"], env) for _ in range(runs)]
+    imports = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], cwd=ROOT, env=env,
+                                check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout
+        imports.append(float(output))
+
+    return {
+        "interpreter_ms": statistics.median(interpreter),
+        "status_ms": statistics.median(status),
+        "startup_ms": statistics.median(status) - statistics.median(interpreter),
+        "import_ms": statistics.median(imports),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="Aantal processen per meting")
+    parser.add_argument("--target", type=float, default=50.0,
+                        help="Maximale opstarttijd van main.py status (zonder interpreter) in ms")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        result = measure(args.runs, os.path.join(tmp_dir, "startup.db"))
+
+    print(f"Lege interpreter:                {result['interpreter_ms']:6.1f} ms")
+    print(f"python main.py status:           {result['status_ms']:6.1f} ms")
+    print(f"Import config + data.database:   {result['import_ms']:6.1f} ms  (ter info)")
+    passed = result["startup_ms"] < args.target
+    print(f"Opstarttijd zonder interpreter:  {result['startup_ms']:6.1f} ms  "
+          f"{'OK' if passed else 'TE TRAAG'} (doel < {args.target:g} ms)")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# benchmarks/harness.py
+"""
+Gedeelde bouwstenen voor de benchmarks: herhaalbare tijdsmetingen, piekgeheugen,
+geseede databases per grootte en het vergelijken van resultaten met een baseline.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from data.database import Database
+from db_seed import generate_dataset
+
+# Datasetgroottes: label → (projecten, sessies per project).
+DATASET_SIZES: Dict[str, tuple] = {
+    "1k": (10, 100),
+    "100k": (100, 1_000),
+    "1M": (500, 2_000),
+}
+
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), "project_tracker_benchmarks")
+
+
+def dataset_path(size: str, storage: str, data_dir: str = DEFAULT_DATA_DIR, seed: int = 42) -> str:
+    """
+    Geeft het pad naar een geseede database van de gevraagde grootte.
+    De database wordt één keer gegenereerd en daarna hergebruikt, zodat elke run dezelfde data meet.
+    """
+    projects, sessions_per_project = DATASET_SIZES[size]
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"dataset_{size}_{storage}_seed{seed}.db")
+    if not os.path.exists(path):
+        partial_path = path + ".partial"
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        db = Database(partial_path, timestamp_storage=storage)
+        try:
+            generate_dataset(db, projects=projects, sessions_per_project=sessions_per_project,
+                             seed=seed, active_session=True)
+        finally:
+            db.close()
+        os.replace(partial_path, path)
+    return path
+
+
+def scratch_copy(path: str, scratch_dir: str) -> str:
+    """Kopieert een dataset zodat schrijf-benchmarks de gedeelde dataset niet wijzigen."""
+    target = os.path.join(scratch_dir, "scratch_" + os.path.basename(path))
+    shutil.copyfile(path, target)
+    return target
+
+
+def measure(func: Callable[[], object], repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """
+    Meet de uitvoeringstijd (in ms) over `repeat` runs, na `warmup` opwarmruns,
+    en het piekgeheugen (in KiB) tijdens één extra run onder tracemalloc.
+    Uitvoer naar stdout (bv. "succesvol geëxporteerd") wordt onderdrukt.
+    """
+    timings: List[float] = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            func()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        # Apart gemeten: tracemalloc vertraagt de uitvoering aanzienlijk.
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings), 4),
+        "min_ms": round(min(timings), 4),
+        "max_ms": round(max(timings), 4),
+        "peak_kib": round(peak / 1024, 1),
+        "runs": repeat,
+    }
+
+
+def environment_info(storage: str) -> Dict[str, str]:
+    """Metadata die bij elk resultatenbestand wordt opgeslagen."""
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "timestamp_storage": storage,
+    }
+
+
+def save_results(results: Dict, path: str):
+    """Schrijft de resultaten als JSON weg."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> Dict:
+    """Leest een eerder opgeslagen resultatenbestand."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(current: Dict, baseline: Dict, threshold: float = 0.25,
+                    min_delta_ms: float = 0.05) -> List[Dict]:
+    """
+    Vergelijkt de mediaan van elke meting met de baseline.
+    Een meting is een regressie als ze meer dan `threshold` (relatief) én meer dan
+    `min_delta_ms` (absoluut, tegen ruis op zeer snelle calls) trager is.
+
+    :return: Lijst van vergelijkingen, elk met size, case, baseline_ms, current_ms, ratio en regression.
+    """
+    comparisons = []
+    for size, cases in current.get("results", {}).items():
+        for case, metrics in cases.items():
+            base = baseline.get("results", {}).get(size, {}).get(case)
+            if not base:
+                continue
+            base_ms, current_ms = base["median_ms"], metrics["median_ms"]
+            ratio = current_ms / base_ms if base_ms else float("inf")
+            comparisons.append({
+                "size": size,
+                "case": case,
+                "baseline_ms": base_ms,
+                "current_ms": current_ms,
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1 + threshold and current_ms - base_ms > min_delta_ms,
+            })
+    return comparisons
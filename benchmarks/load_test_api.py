@@ -0,0 +1,194 @@
+# benchmarks/load_test_api.py
+"""
+Belastingstest voor de lokale API-server (ui/api_server.py) op localhost.
+
+Zonder `--url` wordt een geseede database (zie harness.py) gekopieerd en een API-server als
+apart proces gestart. `--concurrency` client-threads sturen daarna gedurende `--duration`
+seconden zo snel mogelijk verzoeken: een mix van leesverzoeken (projecten, sessiepagina's,
+tijdvensters, rapporten, de lopende sessie) en een fractie `--write-ratio` start/stop-verzoeken.
+
+Per endpoint worden het aantal verzoeken, de statuscodes en de latentie (p50/p95/p99/max)
+getoond. Exitcode 1 bij verbindingsfouten of 5xx-antwoorden.
+
+Gebruik:
+    python -m benchmarks.load_test_api --concurrency 200 --duration 10 [--size 100k] [--workers 16]
+    python -m benchmarks.load_test_api --url http://127.0.0.1:8765 --concurrency 200
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.harness import DATASET_SIZES, dataset_path, scratch_copy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (endpoint, status, latentie in s) per verzoek; status 0 = verbindingsfout.
+Sample = Tuple[str, int, float]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _request(host: str, port: int, method: str, path: str, body: Optional[Dict] = None) -> Tuple[int, Dict]:
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        data = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if data else {}
+        connection.request(method, path, body=data, headers=headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+
+def _wait_until_ready(host: str, port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _request(host, port, "GET", "/sessions/active")
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"API-server op {host}:{port} reageert niet.")
+            time.sleep(0.1)
+
+
+def _read_paths(project_ids: List[int], rng: random.Random) -> Tuple[str, str]:
+    """Een willekeurig leesverzoek als (endpoint, pad)."""
+    project_id = rng.choice(project_ids)
+    choice = rng.random()
+    if choice < 0.25:
+        return "GET /projects/<id>/sessions", f"/projects/{project_id}/sessions?limit=50"
+    if choice < 0.45:
+        return "GET /sessions/active", "/sessions/active"
+    if choice < 0.60:
+        return "GET /projects/<id>", f"/projects/{project_id}"
+    if choice < 0.75:
+        start = datetime(2022, 1, 1) + timedelta(hours=rng.randrange(3 * 365 * 24))  # periode van db_seed
+        end = start + timedelta(hours=8)
+        return "GET /sessions?from&to", f"/sessions?from={start.isoformat()}&to={end.isoformat()}"
+    if choice < 0.90:
+        return "GET /projects", "/projects"
+    period = rng.choice(("day", "week", "month"))
+    return "GET /reports?period", f"/reports?period={period}&project={project_id}"
+
+
+def _client(host: str, port: int, project_ids: List[int], deadline: float, write_ratio: float,
+            seed: int, samples: List[Sample]):
+    rng = random.Random(seed)
+    while time.monotonic() < deadline:
+        if rng.random() < write_ratio:
+            if rng.random() < 0.5:
+                endpoint, method, path, body = ("POST /sessions/start", "POST", "/sessions/start",
+                                                {"project": rng.choice(project_ids), "description": "loadtest"})
+            else:
+                endpoint, method, path, body = "POST /sessions/stop", "POST", "/sessions/stop", {}
+        else:
+            (endpoint, path), method, body = _read_paths(project_ids, rng), "GET", None
+        started = time.perf_counter()
+        try:
+            status, _ = _request(host, port, method, path, body)
+        except (OSError, http.client.HTTPException, ValueError):
+            status = 0
+        samples.append((endpoint, status, time.perf_counter() - started))
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(int(fraction * len(sorted_values)), len(sorted_values) - 1)]
+
+
+def _report(samples: List[Sample], seconds: float) -> bool:
+    """Toont de resultaten per endpoint; False bij verbindingsfouten of 5xx."""
+    per_endpoint: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    for endpoint, status, latency in samples:
+        per_endpoint[endpoint].append(latency * 1000)
+        statuses[endpoint][status] += 1
+
+    print(f"\n{len(samples)} verzoeken in {seconds:.1f}s: {len(samples) / seconds:,.0f} verzoeken/s")
+    print(f"{'endpoint':<30} {'aantal':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  statuscodes")
+    for endpoint in sorted(per_endpoint):
+        latencies = sorted(per_endpoint[endpoint])
+        codes = ", ".join(f"{code or 'fout'}×{count}" for code, count in sorted(statuses[endpoint].items()))
+        print(f"{endpoint:<30} {len(latencies):>7} {_percentile(latencies, 0.5):>6.1f}ms "
+              f"{_percentile(latencies, 0.95):>6.1f}ms {_percentile(latencies, 0.99):>6.1f}ms "
+              f"{latencies[-1]:>6.1f}ms  {codes}")
+
+    failures = sum(count for counter in statuses.values() for code, count in counter.items()
+                   if code == 0 or code >= 500)
+    print(f"Verbindingsfouten en 5xx-antwoorden: {failures}")
+    return failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Bestaande API-server (default: start er zelf één op een kopie van de dataset)")
+    parser.add_argument("--size", choices=list(DATASET_SIZES), default="100k", help="Datasetgrootte")
+    parser.add_argument("--workers", type=int, default=16, help="Worker-threads van de gestarte server")
+    parser.add_argument("--concurrency", type=int, default=200, help="Aantal gelijktijdige clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duur van de test in seconden")
+    parser.add_argument("--write-ratio", type=float, default=0.02, help="Fractie start/stop-verzoeken")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        server = None
+        if args.url:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        else:
+            db_path = scratch_copy(dataset_path(args.size, "iso"), tmp_dir)
+            host, port = "127.0.0.1", _free_port()
+            server = subprocess.Popen(
+                [sys.executable, "-m", "ui.api_server", "--host", host, "--port", str(port),
+                 "--workers", str(args.workers)],
+                cwd=ROOT, env=dict(os.environ, DB_PATH=db_path), stdout=subprocess.DEVNULL,
+            )
+            print(f"API-server gestart op {host}:{port} ({args.workers} workers, dataset {args.size})")
+        try:
+            _wait_until_ready(host, port)
+            _, projects = _request(host, port, "GET", "/projects")
+            project_ids = [p["id"] for p in projects["projects"] if not p["archived"]]
+            if not project_ids:
+                raise RuntimeError("De database bevat geen actieve projecten.")
+
+            print(f"{args.concurrency} clients, {args.duration:g}s, {args.write_ratio:.0%} schrijfverzoeken...")
+            samples: List[Sample] = []  # list.append is thread-safe
+            deadline = time.monotonic() + args.duration
+            started = time.perf_counter()
+            clients = [
+                threading.Thread(target=_client, args=(host, port, project_ids, deadline, args.write_ratio,
+                                                       seed, samples))
+                for seed in range(args.concurrency)
+            ]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            passed = _report(samples, time.perf_counter() - started)
+        finally:
+            if server is not None:
+                server.send_signal(signal.SIGINT)  # zoals Ctrl+C: de server sluit zijn verbindingen netjes
+                server.wait()
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# benchmarks/stress_single_active.py
+"""
+Concurrency-stresstest voor de regel "maximaal één lopende sessie": meerdere processen
+starten en stoppen tegelijk sessies op dezelfde database.
+
+Elk proces probeert `--iterations` keer een sessie te starten (Database.start_work_session)
+en stopt ze daarna weer (stop_active_work_session). Met `--naive` wordt het oude patroon
+gebruikt (eerst controleren, dan los toevoegen); de unieke index moet die race dan opvangen.
+Na afloop wordt gecontroleerd dat er hooguit één sessie loopt en dat geen twee sessies
+elkaar in de tijd overlappen.
+
+Gebruik:
+    python -m benchmarks.stress_single_active --processes 8 --iterations 200 [--naive]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict
+
+from data.database import Database
+from models.project import Project
+
+
+def _worker(db_path: str, worker_id: int, iterations: int, naive: bool, start_event) -> Dict[str, int]:
+    """Start en stopt sessies; telt geslaagde starts, geweigerde starts en fouten."""
+    counts = {"started": 0, "refused": 0, "stopped": 0, "errors": 0}
+    rng = random.Random(worker_id)
+    db = Database(db_path, pragmas={"journal_mode": "WAL", "busy_timeout": 30000})
+    # Elk proces heeft een eigen project, zodat het enkel zijn eigen sessies stopt.
+    project_id = sorted(p.proj_id for p in db.get_all_projects_including_archived())[worker_id]
+    start_event.wait()
+    try:
+        for _ in range(iterations):
+            try:
+                if naive:
+                    # Het oude patroon: controle en insert in aparte stappen.
+                    if db.get_active_work_session() is None:
+                        db.connection.execute("BEGIN")
+                        db.connection.execute(
+                            "INSERT INTO work_sessions (project_id, start_time, description) VALUES (?, ?, ?)",
+                            (project_id, db._to_db(datetime.now()), f"worker {worker_id}")
+                        )
+                        db.connection.commit()
+                        session = True
+                    else:
+                        session = None
+                else:
+                    session = db.start_work_session(project_id, f"worker {worker_id}")
+            except sqlite3.IntegrityError:
+                db.connection.rollback()
+                session = None
+            except sqlite3.Error:
+                db.connection.rollback()
+                counts["errors"] += 1
+                continue
+
+            if session is None:
+                counts["refused"] += 1
+            else:
+                counts["started"] += 1
+                time.sleep(rng.random() / 1000)
+                if db.stop_active_work_session(project_id) is not None:
+                    counts["stopped"] += 1
+    finally:
+        db.close()
+    return counts
+
+
+def _check_invariants(db: Database) -> list:
+    """Retourneert een lijst van schendingen (leeg = in orde)."""
+    problems = []
+    open_sessions = db.connection.execute("SELECT COUNT(*) FROM work_sessions WHERE end_time IS NULL").fetchone()[0]
+    if open_sessions > 1:
+        problems.append(f"{open_sessions} lopende sessies")
+
+    sessions = sorted(
+        (db._from_db(row[0]), db._from_db(row[1]) or datetime.max, row[2])
+        for row in db.connection.execute("SELECT start_time, end_time, id FROM work_sessions")
+    )
+    for (start_a, end_a, id_a), (start_b, _, id_b) in zip(sessions, sessions[1:]):
+        if start_b < end_a:
+            problems.append(f"sessies {id_a} en {id_b} overlappen")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=8, help="Aantal gelijktijdige processen")
+    parser.add_argument("--iterations", type=int, default=200, help="Startpogingen per proces")
+    parser.add_argument("--naive", action="store_true", help="Gebruik controle + insert zonder BEGIN IMMEDIATE")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "stress.db")
+        db = Database(db_path)
+        db.add_projects_to_db([Project(name=f"Stress {i}") for i in range(args.processes)])
+        db.close()
+
+        start_event = multiprocessing.Manager().Event()
+        started = time.perf_counter()
+        with multiprocessing.Pool(args.processes) as pool:
+            results = [pool.apply_async(_worker, (db_path, i, args.iterations, args.naive, start_event))
+                       for i in range(args.processes)]
+            start_event.set()
+            totals: Dict[str, int] = {}
+            for result in results:
+                for key, value in result.get().items():
+                    totals[key] = totals.get(key, 0) + value
+        elapsed = time.perf_counter() - started
+
+        db = Database(db_path)
+        try:
+            problems = _check_invariants(db)
+        finally:
+            db.close()
+
+    print(f"{args.processes} processen × {args.iterations} pogingen in {elapsed:.2f}s "
+          f"({'naïef' if args.naive else 'atomair'})")
+    print(f"  gestart: {totals['started']}, geweigerd: {totals['refused']}, "
+          f"gestopt: {totals['stopped']}, fouten: {totals['errors']}")
+    if problems:
+        for problem in problems[:20]:
+            print(f"  SCHENDING: {problem}")
+        raise SystemExit(1)
+    print("  Invariant gerespecteerd: hooguit één lopende sessie, geen overlappende sessies.")
+
+
+if __name__ == "__main__":
+    main()
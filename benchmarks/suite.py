@@ -0,0 +1,197 @@
+# benchmarks/suite.py
+"""
+Benchmark-suite voor alle Database-methodes en de CSV-export, op geseede
+databases van verschillende grootte. Resultaten worden als JSON opgeslagen en
+kunnen met een baseline vergeleken worden om regressies te vinden.
+
+Gebruik:
+    python -m benchmarks.suite --sizes 1k,100k,1M --output benchmarks/results/latest.json
+    python -m benchmarks.suite --sizes 1k,100k --baseline benchmarks/results/baseline.json
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.harness import (DATASET_SIZES, DEFAULT_DATA_DIR, compare_results, dataset_path,
+                                environment_info, load_results, measure, save_results, scratch_copy)
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+from services.csv_export import export_project_to_csv, stream_project_to_csv
+
+# Een case krijgt een open Database en een werkmap, en geeft de te meten functie terug.
+Case = Tuple[str, Callable[[Database, str], Callable[[], object]]]
+
+# Aantal nieuwe projecten dat archive_project kan archiveren: één per run, opwarmruns inbegrepen.
+_ARCHIVE_CANDIDATES = 1000
+
+
+def _first_project(db: Database) -> Project:
+    return db.get_all_projects_including_archived()[0]
+
+
+def _read_cases() -> List[Case]:
+    """Leesoperaties: worden op de gedeelde dataset uitgevoerd."""
+    def export_case(db: Database, work_dir: str):
+        project = _first_project(db)
+        project.work_sessions = db.get_work_sessions_for_project(project.proj_id)
+        return lambda: export_project_to_csv(project, export_path=work_dir)
+
+    return [
+        ("get_active_projects", lambda db, _: db.get_active_projects),
+        ("get_all_projects_including_archived", lambda db, _: db.get_all_projects_including_archived),
+        ("get_active_project_summaries", lambda db, _: db.get_active_project_summaries),
+        ("get_work_sessions_for_project",
+         lambda db, _: (lambda project_id=_first_project(db).proj_id: db.get_work_sessions_for_project(project_id))),
+        ("get_active_work_session", lambda db, _: db.get_active_work_session),
+        ("get_total_seconds_per_project", lambda db, _: db.get_total_seconds_per_project),
+        ("get_total_seconds_per_period[day]", lambda db, _: lambda: db.get_total_seconds_per_period("day")),
+        ("get_total_seconds_per_period[month]", lambda db, _: lambda: db.get_total_seconds_per_period("month")),
+        ("export_project_to_csv", export_case),
+        ("stream_project_to_csv",
+         lambda db, work_dir: (lambda project=_first_project(db): stream_project_to_csv(db, project, work_dir))),
+    ]
+
+
+def _write_cases() -> List[Case]:
+    """
+    Schrijfoperaties: worden op een kopie van de dataset uitgevoerd. Elke run schrijft andere
+    waarden dan de vorige, anders meet een herhaalde UPDATE enkel een no-op.
+    """
+    start = datetime(2025, 1, 2, 9, 0, 0)
+
+    def add_project(db: Database, _):
+        return lambda: db.add_project_to_db(Project(name="Benchmark", description="Benchmarkproject"))
+
+    def update_project(db: Database, _):
+        project = _first_project(db)
+        runs = itertools.count(1)
+
+        def run():
+            project.description = f"Benchmarkproject {next(runs)}"
+            db.update_project_in_db(project)
+        return run
+
+    def archive_project(db: Database, _):
+        # Elke run archiveert een ander, nog actief project; ze worden hier vooraf aangemaakt.
+        candidates = [Project(name=f"Archiefkandidaat {i}") for i in range(_ARCHIVE_CANDIDATES)]
+        db.add_projects_to_db(candidates)
+        project_ids = iter([p.proj_id for p in candidates])
+
+        def run():
+            project_id = next(project_ids, None)
+            if project_id is None:
+                raise RuntimeError(f"archive_project: meer dan {_ARCHIVE_CANDIDATES} runs.")
+            db.archive_project(project_id)
+        return run
+
+    def add_session(db: Database, _):
+        project_id = _first_project(db).proj_id
+        return lambda: db.add_work_session_to_db(WorkSession(
+            project_id=project_id, start_time=start, end_time=start + timedelta(hours=1), description="Benchmark"
+        ))
+
+    def update_session(db: Database, _):
+        session = db.get_work_sessions_for_project(_first_project(db).proj_id)[-1]
+        end_time = session.end_time or session.start_time
+        runs = itertools.count(1)
+
+        def run():
+            run_number = next(runs)
+            # Eindtijd afwisselend één seconde later: ook de dagtotalen worden echt bijgewerkt.
+            session.end_time = end_time + timedelta(seconds=run_number % 2)
+            session.description = f"Benchmark {run_number}"
+            db.update_work_session_in_db(session)
+        return run
+
+    def add_sessions_bulk(db: Database, _):
+        project_id = _first_project(db).proj_id
+        return lambda: db.add_work_sessions_to_db([
+            WorkSession(project_id=project_id, start_time=start + timedelta(minutes=i),
+                        end_time=start + timedelta(minutes=i, seconds=30), description="Benchmark")
+            for i in range(1000)
+        ])
+
+    def add_session_rows(db: Database, _):
+        project_id = _first_project(db).proj_id
+        return lambda: db.add_work_session_rows(
+            (project_id, 1_800_000_000 + i * 60, 1_800_000_000 + i * 60 + 30, "Benchmark") for i in range(10_000)
+        )
+
+    return [
+        ("add_project_to_db", add_project),
+        ("update_project_in_db", update_project),
+        ("archive_project", archive_project),
+        ("add_work_session_to_db", add_session),
+        ("update_work_session_in_db", update_session),
+        ("add_work_sessions_to_db[1000]", add_sessions_bulk),
+        ("add_work_session_rows[10000]", add_session_rows),
+    ]
+
+
+def run_suite(sizes: List[str], storage: str, repeat: int, data_dir: str) -> Dict:
+    """Voert alle cases uit voor elke grootte en retourneert het resultatenobject."""
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            print(f"== Dataset {size} ({storage}) ==")
+            path = dataset_path(size, storage, data_dir)
+            size_results = results.setdefault(size, {})
+
+            for cases, db_path in ((_read_cases(), path), (_write_cases(), scratch_copy(path, work_dir))):
+                db = Database(db_path, timestamp_storage=storage)
+                try:
+                    for name, make_func in cases:
+                        metrics = measure(make_func(db, work_dir), repeat=repeat)
+                        size_results[name] = metrics
+                        print(f"  {name:<40} {metrics['median_ms']:>10.3f} ms   piek {metrics['peak_kib']:>10.1f} KiB")
+                finally:
+                    db.close()
+
+    return {"environment": environment_info(storage), "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1k,100k,1M",
+                        help=f"Kommagescheiden datasetgroottes uit: {', '.join(DATASET_SIZES)}")
+    parser.add_argument("--storage", choices=("iso", "epoch"), default="iso", help="Opslagformaat van de tijdstippen")
+    parser.add_argument("--repeat", type=int, default=5, help="Aantal gemeten runs per case")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Map voor de (herbruikbare) geseede datasets")
+    parser.add_argument("--output", default=os.path.join("benchmarks", "results", "latest.json"),
+                        help="JSON-bestand voor de resultaten")
+    parser.add_argument("--baseline", help="JSON-baseline om mee te vergelijken")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Relatieve vertraging die als regressie geldt (default 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in DATASET_SIZES]
+    if unknown:
+        parser.error(f"Onbekende grootte(s): {', '.join(unknown)}")
+
+    results = run_suite(sizes, args.storage, args.repeat, args.data_dir)
+    save_results(results, args.output)
+    print(f"\nResultaten opgeslagen in {args.output}")
+
+    if args.baseline:
+        comparisons = compare_results(results, load_results(args.baseline), args.threshold)
+        regressions = [c for c in comparisons if c["regression"]]
+        print(f"\nVergelijking met {args.baseline} (drempel {args.threshold:.0%}):")
+        for c in comparisons:
+            mark = "REGRESSIE" if c["regression"] else ""
+            print(f"  {c['size']:>5} {c['case']:<40} {c['baseline_ms']:>10.3f} → {c['current_ms']:>10.3f} ms"
+                  f"  x{c['ratio']:<6} {mark}")
+        if regressions:
+            print(f"\n{len(regressions)} regressie(s) gevonden.")
+            sys.exit(1)
+        print("\nGeen regressies gevonden.")
+
+
+if __name__ == "__main__":
+    main()
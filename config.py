@@ -1,10 +1,100 @@
-from environs import Env
+import os
+import sys
+from typing import Optional
 
-env = Env()
-try:
-    env.read_env('.env')
-except FileNotFoundError as e:
-    print(f"Waarschuwing: .env bestand niet gevonden. (Fallback to default)({e})")
+# Lichte .env-lezer (vervangt environs/python-dotenv, die samen ~70 ms importtijd kostten).
+# Zoals voorheen wordt .env gezocht vanaf de huidige map naar boven toe, en overschrijft
+# het bestand geen variabelen die al in de omgeving staan.
+_TRUE_VALUES = {"1", "true", "t", "yes", "y", "on"}
+_FALSE_VALUES = {"0", "false", "f", "no", "n", "off", ""}
 
-DB_PATH = env.str("DB_PATH", "database/project_tracker.db")
-EXPORT_PATH = env.str("EXPORT_PATH", "export")
\ No newline at end of file
+
+def _find_env_file(name: str = ".env") -> Optional[str]:
+    directory = os.getcwd()
+    while True:
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def read_env(path: str):
+    """Leest KEY=waarde-regels (met optionele 'export ', aanhalingstekens en #-commentaar) in os.environ."""
+    with open(path, encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.strip()
+            if key.startswith("export "):
+                key = key[len("export "):].strip()
+            value = value.strip()
+            if value[:1] in ("'", '"') and value[-1:] == value[:1] and len(value) > 1:
+                value = value[1:-1]
+            elif " #" in value:
+                value = value.split(" #", 1)[0].rstrip()
+            os.environ.setdefault(key, value)
+
+
+def _str(name: str, default: Optional[str]) -> Optional[str]:
+    return os.environ.get(name, default)
+
+
+def _int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Omgevingsvariabele {name} moet een geheel getal zijn, niet '{value}'.")
+
+
+def _bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    if value.strip().lower() in _TRUE_VALUES:
+        return True
+    if value.strip().lower() in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Omgevingsvariabele {name} moet true of false zijn, niet '{value}'.")
+
+
+_env_file = _find_env_file()
+if _env_file:
+    read_env(_env_file)
+else:
+    # Naar stderr: de subcommando's van main.py schrijven enkel JSON naar stdout.
+    print("Waarschuwing: .env bestand niet gevonden. (Fallback to default)", file=sys.stderr)
+
+DB_PATH = _str("DB_PATH", "database/project_tracker.db")
+EXPORT_PATH = _str("EXPORT_PATH", "export")
+
+# Opslagformaat voor tijdstippen van werksessies: "iso" (tekst) of "epoch" (integer seconden).
+# Met "epoch" wordt een bestaande database bij het openen eenmalig omgezet.
+TIMESTAMP_STORAGE = _str("TIMESTAMP_STORAGE", "iso")
+
+# Verbindingsprofiel voor SQLite: "default", "wal" of "performance" (zie data/connection.py).
+# De losse DB_*-waarden overschrijven de instelling uit het gekozen profiel.
+DB_PROFILE = _str("DB_PROFILE", "default")
+DB_JOURNAL_MODE = _str("DB_JOURNAL_MODE", None)
+DB_SYNCHRONOUS = _str("DB_SYNCHRONOUS", None)
+DB_MMAP_SIZE = _int("DB_MMAP_SIZE", None)
+DB_CACHE_SIZE = _int("DB_CACHE_SIZE", None)
+DB_TEMP_STORE = _str("DB_TEMP_STORE", None)
+DB_BUSY_TIMEOUT = _int("DB_BUSY_TIMEOUT", None)
+
+# Instrumentatie van Database (zie data/instrumentation.py): aanroepen, latentie, rijen en SQL
+# per methode, bij het afsluiten als JSON weggeschreven naar DB_INSTRUMENTATION_FILE.
+DB_INSTRUMENTATION = _bool("DB_INSTRUMENTATION", False)
+DB_INSTRUMENTATION_FILE = _str("DB_INSTRUMENTATION_FILE", "database/instrumentation.json")
+
+# Lokale API-server (python -m ui.api_server): adres en aantal worker-threads.
+API_HOST = _str("API_HOST", "127.0.0.1")
+API_PORT = _int("API_PORT", 8765)
+API_WORKERS = _int("API_WORKERS", 16)
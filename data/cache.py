@@ -0,0 +1,116 @@
+# data/cache.py
+
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+
+# Schrijfmethodes van Database die de cache ongeldig maken.
+_WRITE_PREFIXES = ("add_", "update_", "archive_", "start_", "stop_")
+
+_MISSING = object()
+
+
+class CachedDatabase:
+    """
+    Read-through cache vóór een Database, voor de gegevens die de menu's na elke actie
+    opnieuw opvragen: de projecten (zonder sessies) en de actieve werksessie.
+
+    Schrijfmethodes (add_*, update_*, archive_*, start_*, stop_*) worden doorgegeven en maken
+    enkel de betrokken gegevens ongeldig: methodes met 'project' in de naam de projecten,
+    methodes met 'session' in de naam de actieve sessie. Wijzigingen door andere verbindingen worden
+    opgemerkt via PRAGMA data_version. Alle andere attributen worden doorgegeven aan de Database.
+    """
+    def __init__(self, db: Database):
+        self.db = db
+        self.hits = 0
+        self.misses = 0
+        self._projects: Optional[Dict[int, Project]] = None
+        self._active_session = _MISSING
+        self._data_version = self._read_data_version()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.db, name)
+        if callable(attribute) and name.startswith(_WRITE_PREFIXES):
+            return self._invalidating(name, attribute)
+        return attribute
+
+    def _invalidating(self, name: str, method: Callable) -> Callable:
+        """Omhult een schrijfmethode zodat de betrokken cache-items vervallen."""
+        projects = "project" in name or "session" not in name
+        session = "session" in name or "project" not in name
+
+        def write(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if projects:
+                    self._projects = None
+                if session:
+                    self._active_session = _MISSING
+        return write
+
+    # === CACHEBEHEER ===
+    def _read_data_version(self) -> int:
+        return self.db.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _check_external_changes(self):
+        """data_version wijzigt wanneer een andere verbinding een commit doet."""
+        version = self._read_data_version()
+        if version != self._data_version:
+            self._data_version = version
+            self.invalidate()
+
+    def invalidate(self):
+        """Maakt de volledige cache ongeldig."""
+        self._projects = None
+        self._active_session = _MISSING
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss-tellers van de cache."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator["CachedDatabase"]:
+        """Zoals Database.transaction(); na afloop (commit of rollback) wordt de cache gewist."""
+        try:
+            with self.db.transaction(immediate):
+                yield self
+        finally:
+            self.invalidate()
+
+    # === GECACHETE LEESMETHODES ===
+    def _load_projects(self) -> Dict[int, Project]:
+        self._check_external_changes()
+        if self._projects is None:
+            self.misses += 1
+            self._projects = {p.proj_id: p for p in self.db.get_all_projects_including_archived()}
+        else:
+            self.hits += 1
+        return self._projects
+
+    @staticmethod
+    def _copy_project(project: Project) -> Project:
+        # Kopieën: de aanroeper mag het object (en zijn sessielijst) vrij aanpassen.
+        return project.copy()
+
+    def get_project(self, project_id: int) -> Optional[Project]:
+        project = self._load_projects().get(project_id)
+        return self._copy_project(project) if project else None
+
+    def get_active_projects(self) -> List[Project]:
+        return [self._copy_project(p) for p in self._load_projects().values() if not p.archived]
+
+    def get_all_projects_including_archived(self) -> List[Project]:
+        return [self._copy_project(p) for p in self._load_projects().values()]
+
+    def get_active_work_session(self) -> Optional[WorkSession]:
+        self._check_external_changes()
+        if self._active_session is _MISSING:
+            self.misses += 1
+            self._active_session = self.db.get_active_work_session()
+        else:
+            self.hits += 1
+        return self._active_session.copy() if self._active_session else None
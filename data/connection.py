@@ -0,0 +1,79 @@
+# data/connection.py
+
+import sqlite3
+from typing import Dict, Optional, Union
+
+from config import (DB_BUSY_TIMEOUT, DB_CACHE_SIZE, DB_JOURNAL_MODE, DB_MMAP_SIZE,
+                    DB_PROFILE, DB_SYNCHRONOUS, DB_TEMP_STORE)
+
+PragmaValue = Union[str, int]
+
+# Voorgedefinieerde verbindingsprofielen. "default" laat de standaardinstellingen van SQLite ongemoeid.
+CONNECTION_PROFILES: Dict[str, Dict[str, PragmaValue]] = {
+    "default": {},
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+    },
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # negatief = in KiB, dus 64 MiB
+        "temp_store": "MEMORY",
+    },
+}
+
+# PRAGMA's laten geen parameters toe, dus tekstwaarden worden tegen een vaste lijst gecontroleerd.
+_ALLOWED_VALUES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+_INTEGER_PRAGMAS = {"busy_timeout", "mmap_size", "cache_size"}
+
+# journal_mode eerst: de andere instellingen gelden binnen het gekozen journal.
+_PRAGMA_ORDER = ("journal_mode", "synchronous", "busy_timeout", "mmap_size", "cache_size", "temp_store")
+
+
+def get_connection_pragmas(profile: str = DB_PROFILE,
+                           overrides: Optional[Dict[str, Optional[PragmaValue]]] = None) -> Dict[str, PragmaValue]:
+    """
+    Bouwt de PRAGMA-instellingen op uit een profiel, aangevuld met losse overrides.
+    Zonder expliciete overrides worden de DB_*-waarden uit config.py gebruikt.
+    """
+    if profile not in CONNECTION_PROFILES:
+        raise ValueError(f"Onbekend verbindingsprofiel '{profile}', kies uit: {', '.join(CONNECTION_PROFILES)}.")
+    if overrides is None:
+        overrides = {
+            "journal_mode": DB_JOURNAL_MODE,
+            "synchronous": DB_SYNCHRONOUS,
+            "busy_timeout": DB_BUSY_TIMEOUT,
+            "mmap_size": DB_MMAP_SIZE,
+            "cache_size": DB_CACHE_SIZE,
+            "temp_store": DB_TEMP_STORE,
+        }
+    pragmas = dict(CONNECTION_PROFILES[profile])
+    pragmas.update({name: value for name, value in overrides.items() if value is not None})
+    return pragmas
+
+
+def apply_connection_pragmas(connection: sqlite3.Connection, pragmas: Dict[str, PragmaValue]):
+    """Past de PRAGMA-instellingen toe op een open verbinding."""
+    unknown = set(pragmas) - set(_PRAGMA_ORDER)
+    if unknown:
+        raise ValueError(f"Onbekende PRAGMA-instelling(en): {', '.join(sorted(unknown))}.")
+
+    for name in _PRAGMA_ORDER:
+        if name not in pragmas:
+            continue
+        value = pragmas[name]
+        if name in _INTEGER_PRAGMAS:
+            value = int(value)
+        else:
+            value = str(value).upper()
+            if value not in _ALLOWED_VALUES[name]:
+                raise ValueError(f"Ongeldige waarde '{value}' voor PRAGMA {name}.")
+        connection.execute(f"PRAGMA {name} = {value}")
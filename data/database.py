@@ -1,23 +1,115 @@
 # data/database.py
 
 import sqlite3
-from datetime import datetime
-from typing import List, Optional
-from config import DB_PATH
+import sys
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from config import DB_INSTRUMENTATION, DB_PATH, TIMESTAMP_STORAGE
+from data.connection import apply_connection_pragmas, get_connection_pragmas
+from data.migrations import (SCHEMA_VERSION, apply_migrations, convert_timestamps_to_epoch, get_schema_version,
+                             get_timestamp_storage, rebuild_indexes, suspend_index_triggers)
+from data.rollup import apply_to_rollup, rebuild_rollup
+from data.timestamps import SECONDS_PER_DAY, from_epoch, to_epoch
 
 from models.project import Project
+from models.project_summary import ProjectSummary
+from models.search_result import SearchResult
+from models.session_array import WorkSessionArray
 from models.work_session import WorkSession
 
 
+# Exacte duur van een afgesloten sessie in microseconden, per opslagformaat.
+# isoformat() schrijft de microseconden (indien aanwezig) altijd als 6 cijfers vanaf positie 21.
+_DURATION_US_SQL = {
+    "iso": ("((strftime('%s', end_time) - strftime('%s', start_time)) * 1000000"
+            " + CAST(substr(end_time, 21) AS INTEGER) - CAST(substr(start_time, 21) AS INTEGER))"),
+    "epoch": "((end_time - start_time) * 1000000)",
+}
+
+# Startdag van een sessie: de datum uit de ISO-tekst, of het dagnummer sinds 1970.
+_START_DAY_SQL = {
+    "iso": "substr(start_time, 1, 10)",
+    "epoch": f"(start_time / {SECONDS_PER_DAY})",
+}
+
+# Een tijdstip als epoch-seconden, per opslagformaat.
+_EPOCH_SECONDS_SQL = {
+    "iso": "CAST(strftime('%s', {column}) AS INTEGER)",
+    "epoch": "{column}",
+}
+
+_EPOCH_DATE = date(1970, 1, 1)
+
+# Rapportageperiodes; de SQL-query groepeert per startdag, week en maand volgen daaruit.
+_REPORT_PERIODS = ("day", "week", "month")
+
+
+# Maximaal aantal (meest recente) treffers dat op relevantie gerangschikt wordt.
+_RANK_WINDOW = 5000
+
+
+def _fts_query(text: str) -> str:
+    """
+    Zet vrije zoektekst om naar een FTS5-query: elk woord wordt letterlijk gezocht
+    (tussen aanhalingstekens, zodat operatoren en leestekens geen syntaxfout geven)
+    en het laatste woord ook als prefix, zodat 'refact' 'refactoring' vindt.
+    """
+    words = ['"' + word.replace('"', '""') + '"' for word in text.split()]
+    if words:
+        words[-1] += "*"
+    return " ".join(words)
+
+
+def _period_key(day: date, period: str) -> str:
+    """Zet een dag om naar de sleutel van zijn dag (2024-01-31), ISO-week (2024-W05) of maand (2024-01)."""
+    if period == "week":
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == "month":
+        return day.strftime("%Y-%m")
+    return day.isoformat()
+
+
 class Database:
     """Creëert en beheert de SQLite database voor projecten en werksessies."""
-    def __init__(self):
-        self.connection = sqlite3.connect(DB_PATH)
+    def __init__(self, db_path: str = DB_PATH, timestamp_storage: str = TIMESTAMP_STORAGE,
+                 pragmas: Optional[Dict[str, Union[str, int]]] = None, check_same_thread: bool = True):
+        """
+        :param db_path: Pad naar het databasebestand.
+        :param timestamp_storage: Gewenst opslagformaat voor tijdstippen ("iso" of "epoch").
+        :param pragmas: PRAGMA-instellingen voor de verbinding; standaard het profiel uit config.py.
+        :param check_same_thread: False laat gebruik vanuit andere threads toe; de aanroeper moet
+                                  dan zelf zorgen dat er nooit twee threads tegelijk gebruik van maken
+                                  (zie data/pool.py).
+        """
+        if timestamp_storage not in _DURATION_US_SQL:
+            raise ValueError(f"Onbekend opslagformaat '{timestamp_storage}', kies 'iso' of 'epoch'.")
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path, check_same_thread=check_same_thread)
         self.connection.row_factory = sqlite3.Row  # ← dict-achtige rows
+        apply_connection_pragmas(self.connection, get_connection_pragmas() if pragmas is None else pragmas)
+        self.timestamp_storage = timestamp_storage
+        self._transaction_depth = 0
+        self._bulk_loading = False
         self.create_tables()
+        # De instrumentatie pas importeren als ze aan kan staan: via .env, of na enable(),
+        # waarvoor de module al geïmporteerd moet zijn. Zo kost ze niets bij het opstarten.
+        if DB_INSTRUMENTATION or "data.instrumentation" in sys.modules:
+            from data.instrumentation import instrument_if_enabled
+            instrument_if_enabled(self)
 
     def create_tables(self):
-        """Maakt de benodigde tabellen aan als ze nog niet bestaan."""
+        """
+        Maakt de benodigde tabellen aan als ze nog niet bestaan en
+        brengt het schema (indexen, ...) via de migraties op de laatste versie.
+        Staat user_version al op de laatste versie, dan wordt er niets aangemaakt of gecommit:
+        enkel het opslagformaat van de tijdstippen wordt bepaald.
+        """
+        if get_schema_version(self.connection) == SCHEMA_VERSION:
+            self._resolve_timestamp_storage()
+            return
+
         cursor = self.connection.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS projects (
@@ -38,6 +130,118 @@ class Database:
             )
         ''')
         self.connection.commit()
+        apply_migrations(self.connection)
+        self._resolve_timestamp_storage()
+
+    def _resolve_timestamp_storage(self):
+        """Het werkelijke formaat volgt uit het schema; "epoch" in de config zet ISO eenmalig om."""
+        storage = get_timestamp_storage(self.connection)
+        if storage == "iso" and self.timestamp_storage == "epoch":
+            convert_timestamps_to_epoch(self.connection)
+            # De omzetting laat microseconden vallen: dagtotalen opnieuw berekenen.
+            rebuild_rollup(self.connection, "epoch")
+            storage = "epoch"
+        self.timestamp_storage = storage
+
+    # === TIJDSTIPPEN ===
+    def _to_db(self, moment: Optional[datetime]) -> Union[str, int, None]:
+        """Zet een datetime om naar het opslagformaat van deze database."""
+        if moment is None:
+            return None
+        return to_epoch(moment) if self.timestamp_storage == "epoch" else moment.isoformat()
+
+    def _from_db(self, value: Union[str, int, None]) -> Optional[datetime]:
+        """Zet een opgeslagen tijdstip terug om naar een datetime."""
+        if value is None:
+            return None
+        return from_epoch(value) if self.timestamp_storage == "epoch" else datetime.fromisoformat(value)
+
+    def _day_from_db(self, value: Union[str, int]) -> date:
+        """Zet een startdag uit _START_DAY_SQL om naar een date."""
+        if self.timestamp_storage == "epoch":
+            return _EPOCH_DATE + timedelta(days=value)
+        return date.fromisoformat(value)
+
+    # === TRANSACTIES ===
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator["Database"]:
+        """
+        Groepeert meerdere schrijfoperaties in één transactie en dus één commit.
+        Bij een fout wordt alles teruggedraaid. Geneste blokken sluiten aan bij het buitenste blok.
+
+            with db.transaction():
+                db.add_project_to_db(project)
+                db.add_work_sessions_to_db(sessions)
+
+        :param immediate: Neem de schrijflock meteen bij het begin (BEGIN IMMEDIATE), zodat een
+                          controle gevolgd door een schrijfoperatie niet door een ander proces
+                          onderbroken kan worden. Enkel van toepassing op het buitenste blok.
+        """
+        if self._transaction_depth == 0 and not self.connection.in_transaction:
+            self.connection.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.connection.rollback()
+            raise
+        else:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.connection.commit()
+
+    @contextmanager
+    def bulk_load(self) -> Iterator["Database"]:
+        """
+        Transactie voor het in één keer laden van zeer veel sessies (bv. db_seed.py --generate).
+        Binnen het blok worden de FTS5- en R*Tree-indexen en de dagtotalen niet per rij bijgewerkt;
+        op het einde worden ze in één keer herbouwd uit de tabellen, wat bij miljoenen rijen veel
+        sneller is. Die herbouw kost tijd naar de grootte van de hele database, niet van de lading.
+
+            with db.bulk_load():
+                db.add_projects_to_db(projects)
+                db.add_work_session_rows(rows)
+        """
+        with self.transaction():
+            cursor = self.connection.cursor()
+            trigger_sql = suspend_index_triggers(cursor)
+            self._bulk_loading = True
+            try:
+                yield self
+            finally:
+                self._bulk_loading = False
+            rebuild_indexes(cursor, trigger_sql)
+            cursor.execute("DELETE FROM daily_project_totals")
+            apply_to_rollup(cursor, self.timestamp_storage, "1", {})
+
+    def _commit(self):
+        """Commit, tenzij de schrijfoperatie deel uitmaakt van een lopende transaction()."""
+        if self._transaction_depth == 0:
+            self.connection.commit()
+
+    def _report_error(self, message: str, error: sqlite3.Error):
+        """
+        Meldt een opgevangen databasefout. Eén plek voor alle except-blokken, zodat de
+        instrumentatie (data/instrumentation.py) ook de fouten kan tellen die niet doorgegeven worden.
+        """
+        print(f"{message}:", error)
+
+    def _reraise_in_transaction(self):
+        """Binnen een transaction() moet een fout doorgegeven worden, zodat het hele blok teruggedraaid wordt."""
+        if self._transaction_depth:
+            raise
+
+    def _assign_inserted_ids(self, items: list, attribute: str):
+        """
+        Vult de id's in na een executemany. Binnen één transactie krijgen de rijen van een
+        AUTOINCREMENT-tabel opeenvolgende id's, eindigend op last_insert_rowid().
+        """
+        last_id = self.connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+        first_id = last_id - len(items) + 1
+        for offset, item in enumerate(items):
+            setattr(item, attribute, first_id + offset)
 
     # === PROJECTS ===
     def add_project_to_db(self, project: Project):
@@ -49,9 +253,26 @@ class Database:
                 (project.name, project.description or "", 0)
             )
             project.proj_id = cursor.lastrowid
-            self.connection.commit()
+            self._commit()
+        except sqlite3.Error as e:
+            self._report_error("Fout bij toevoegen project aan database", e)
+            self._reraise_in_transaction()
+
+    def add_projects_to_db(self, projects: List[Project]):
+        """Voegt meerdere projecten in één keer toe en vult hun proj_id in."""
+        if not projects:
+            return
+        try:
+            with self.transaction():
+                cursor = self.connection.cursor()
+                cursor.executemany(
+                    "INSERT INTO projects (name, description, archived) VALUES (?, ?, ?)",
+                    [(p.name, p.description or "", int(p.archived)) for p in projects]
+                )
+                self._assign_inserted_ids(projects, "proj_id")
         except sqlite3.Error as e:
-            print("Fout bij toevoegen project aan database:", e)
+            self._report_error("Fout bij toevoegen projecten aan database", e)
+            self._reraise_in_transaction()
 
     def update_project_in_db(self, project: Project):
         """Wijzigt een bestaand project in de database."""
@@ -61,18 +282,20 @@ class Database:
                 "UPDATE projects SET name = ?, description = ?, archived = ? WHERE id = ?",
                 (project.name, project.description or "", int(project.archived), project.proj_id)
             )
-            self.connection.commit()
+            self._commit()
         except sqlite3.Error as e:
-            print("Fout bij bijwerken project in database:", e)
+            self._report_error("Fout bij bijwerken project in database", e)
+            self._reraise_in_transaction()
 
     def archive_project(self, project_id: int):
         """Zet archived = 1 → project verdwijnt uit 'actieve' lijst"""
         try:
             cursor = self.connection.cursor()
             cursor.execute("UPDATE projects SET archived = 1 WHERE id = ?", (project_id,))
-            self.connection.commit()
+            self._commit()
         except sqlite3.Error as e:
-            print("Fout bij archiveren project in database:", e)
+            self._report_error("Fout bij archiveren project in database", e)
+            self._reraise_in_transaction()
 
     def get_active_projects(self) -> List[Project]:
         """Alleen niet-gearchiveerde projecten"""
@@ -87,7 +310,70 @@ class Database:
                 archived=bool(row["archived"])
             ) for row in rows]
         except sqlite3.Error as e:
-            print("Fout bij ophalen actieve projecten uit database:", e)
+            self._report_error("Fout bij ophalen actieve projecten uit database", e)
+            return []
+
+    def get_project(self, project_id: int) -> Optional[Project]:
+        """Eén project op id, ook als het gearchiveerd is."""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT id, name, description, archived FROM projects WHERE id = ?", (project_id,))
+            row = cursor.fetchone()
+            if row:
+                return Project(
+                    proj_id=row["id"],
+                    name=row["name"],
+                    description=row["description"] or "",
+                    archived=bool(row["archived"])
+                )
+            return None
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen project uit database", e)
+            return None
+
+    def get_active_project_summaries(self) -> List[ProjectSummary]:
+        """
+        Niet-gearchiveerde projecten met aantal sessies, totale duur van de
+        afgesloten sessies (in seconden) en tijdstip van de laatste activiteit.
+        Alles komt uit één query in plaats van één query per project; de totale duur
+        komt, zoals in get_total_seconds_per_project, uit de dagtotalen (daily_project_totals).
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT p.id, p.name, p.description, p.archived,
+                       COALESCE(sessions.session_count, 0) AS session_count,
+                       COALESCE(totals.duration_us, 0) / 1000000 AS total_seconds,
+                       sessions.last_activity
+                FROM projects p
+                LEFT JOIN (
+                    SELECT project_id, COUNT(*) AS session_count,
+                           MAX(COALESCE(end_time, start_time)) AS last_activity
+                    FROM work_sessions
+                    GROUP BY project_id
+                ) sessions ON sessions.project_id = p.id
+                LEFT JOIN (
+                    SELECT project_id, SUM(total_us) AS duration_us
+                    FROM daily_project_totals
+                    GROUP BY project_id
+                ) totals ON totals.project_id = p.id
+                WHERE p.archived = 0
+                ORDER BY p.id
+            """)
+            rows = cursor.fetchall()
+            return [ProjectSummary(
+                project=Project(
+                    proj_id=row["id"],
+                    name=row["name"],
+                    description=row["description"] or "",
+                    archived=bool(row["archived"])
+                ),
+                session_count=row["session_count"],
+                total_seconds=row["total_seconds"],
+                last_activity=self._from_db(row["last_activity"])
+            ) for row in rows]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen projectoverzicht uit database", e)
             return []
 
     def get_all_projects_including_archived(self) -> List[Project]:
@@ -103,7 +389,7 @@ class Database:
                 archived=bool(row["archived"])
             ) for row in rows]
         except sqlite3.Error as e:
-            print("Fout bij ophalen projecten uit database:", e)
+            self._report_error("Fout bij ophalen projecten uit database", e)
             return []
 
     # === WORK SESSIONS ===
@@ -117,40 +403,174 @@ class Database:
                    VALUES (?, ?, ?, ?)""",
                 (
                     session.project_id,
-                    session.start_time.isoformat(),
-                    session.end_time.isoformat() if session.end_time else None,
+                    self._to_db(session.start_time),
+                    self._to_db(session.end_time),
                     session.description or ""
                 )
             )
             session.id = cursor.lastrowid
-            self.connection.commit()
+            apply_to_rollup(cursor, self.timestamp_storage, "id = :id", {"id": session.id})
+            self._commit()
+        except sqlite3.Error as e:
+            self._report_error("Fout bij toevoegen werksessie aan database", e)
+            self._reraise_in_transaction()
+            self.connection.rollback()  # sessie en dagtotalen samen, of geen van beide
+
+    def add_work_sessions_to_db(self, sessions: List[WorkSession]):
+        """Voegt meerdere werksessies in één keer toe en vult hun id in."""
+        if not sessions:
+            return
+        try:
+            with self.transaction():
+                cursor = self.connection.cursor()
+                cursor.executemany(
+                    """INSERT INTO work_sessions
+                       (project_id, start_time, end_time, description)
+                       VALUES (?, ?, ?, ?)""",
+                    [(
+                        s.project_id,
+                        self._to_db(s.start_time),
+                        self._to_db(s.end_time),
+                        s.description or ""
+                    ) for s in sessions]
+                )
+                self._assign_inserted_ids(sessions, "id")
+                apply_to_rollup(cursor, self.timestamp_storage, "id BETWEEN :first AND :last",
+                                {"first": sessions[0].id, "last": sessions[-1].id})
+        except sqlite3.Error as e:
+            self._report_error("Fout bij toevoegen werksessies aan database", e)
+            self._reraise_in_transaction()
+
+    def add_work_session_rows(self, rows: Iterable[Tuple[int, int, Optional[int], str]]) -> int:
+        """
+        Snelle bulk-insert van ruwe rijen (project_id, start, einde, beschrijving) met tijdstippen
+        in epoch-seconden (zie data/timestamps.py), zonder WorkSession-objecten aan te maken.
+        De omzetting naar het opslagformaat gebeurt in SQLite; `rows` mag een generator zijn.
+
+        De rijen gaan eerst naar een tijdelijke tabel en dan met één INSERT ... SELECT naar
+        work_sessions: FTS5 schrijft zijn index bij elke statement-savepoint weg, dus één
+        statement voor alle rijen is vele malen sneller dan een INSERT per rij.
+
+        :return: Het aantal toegevoegde rijen.
+        """
+        if self.timestamp_storage == "epoch":
+            start_sql, end_sql = "start_s", "end_s"
+        else:
+            # Zelfde tekst als datetime.isoformat() voor hele seconden.
+            start_sql = "strftime('%Y-%m-%dT%H:%M:%S', start_s, 'unixepoch')"
+            end_sql = "strftime('%Y-%m-%dT%H:%M:%S', end_s, 'unixepoch')"
+        try:
+            with self.transaction():
+                cursor = self.connection.cursor()
+                cursor.execute("""CREATE TEMP TABLE IF NOT EXISTS work_session_rows
+                                  (project_id INTEGER, start_s INTEGER, end_s INTEGER, description TEXT)""")
+                cursor.execute("DELETE FROM temp.work_session_rows")
+                cursor.executemany("INSERT INTO temp.work_session_rows VALUES (?, ?, ?, ?)", rows)
+                cursor.execute(
+                    f"""INSERT INTO work_sessions
+                        (project_id, start_time, end_time, description)
+                        SELECT project_id, {start_sql}, {end_sql}, description
+                        FROM temp.work_session_rows
+                        ORDER BY rowid"""
+                )
+                count = cursor.rowcount
+                if count > 0 and not self._bulk_loading:
+                    last_id = self.connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+                    apply_to_rollup(cursor, self.timestamp_storage, "id BETWEEN :first AND :last",
+                                    {"first": last_id - count + 1, "last": last_id})
+                cursor.execute("DELETE FROM temp.work_session_rows")
+                return count
         except sqlite3.Error as e:
-            print("Fout bij toevoegen werksessie aan database:", e)
+            self._report_error("Fout bij toevoegen werksessies aan database", e)
+            self._reraise_in_transaction()
+            return 0
 
     def update_work_session_in_db(self, session: WorkSession):
-        """Wijzigt een bestaande werksessie in de database."""
+        """
+        Wijzigt een bestaande werksessie in de database. De dagtotalen worden in dezelfde
+        transactie bijgewerkt: eerst de oude bijdrage van de sessie eraf, dan de nieuwe erbij.
+        """
         try:
             cursor = self.connection.cursor()
+            apply_to_rollup(cursor, self.timestamp_storage, "id = :id", {"id": session.id}, sign=-1)
             cursor.execute(
                 """UPDATE work_sessions 
                    SET end_time = ?, description = ? 
                    WHERE id = ?""",
                 (
-                    session.end_time.isoformat() if session.end_time else None,
+                    self._to_db(session.end_time),
                     session.description or "",
                     session.id
                 )
             )
-            self.connection.commit()
+            apply_to_rollup(cursor, self.timestamp_storage, "id = :id", {"id": session.id})
+            self._commit()
+        except sqlite3.Error as e:
+            self._report_error("Fout bij bijwerken werksessie in database", e)
+            self._reraise_in_transaction()
+            self.connection.rollback()  # sessie en dagtotalen samen, of geen van beide
+
+    def start_work_session(self, project_id: int, description: str = "",
+                           start_time: Optional[datetime] = None) -> Optional[WorkSession]:
+        """
+        Start atomair een nieuwe werksessie: de controle op een lopende sessie en de insert
+        gebeuren in één BEGIN IMMEDIATE-transactie, zodat twee processen niet allebei een sessie
+        kunnen starten. De unieke index idx_work_sessions_single_open vangt de rest op.
+
+        :return: De gestarte sessie, of None als er al een sessie loopt.
+        """
+        try:
+            with self.transaction(immediate=True):
+                cursor = self.connection.cursor()
+                cursor.execute("SELECT 1 FROM work_sessions WHERE end_time IS NULL LIMIT 1")
+                if cursor.fetchone():
+                    return None
+                # Het tijdstip pas nemen met de lock in handen: nooit vóór het einde van de vorige sessie.
+                session = WorkSession(project_id=project_id, start_time=start_time or datetime.now(),
+                                      description=description or "")
+                # Een lopende sessie telt nog niet mee in de dagtotalen.
+                cursor.execute(
+                    "INSERT INTO work_sessions (project_id, start_time, end_time, description) VALUES (?, ?, NULL, ?)",
+                    (session.project_id, self._to_db(session.start_time), session.description)
+                )
+                session.id = cursor.lastrowid
+            return session
+        except sqlite3.IntegrityError:
+            return None
+        except sqlite3.Error as e:
+            self._report_error("Fout bij starten werksessie", e)
+            self._reraise_in_transaction()
+            return None
+
+    def stop_active_work_session(self, project_id: Optional[int] = None,
+                                 end_time: Optional[datetime] = None) -> Optional[WorkSession]:
+        """
+        Stopt atomair de lopende werksessie (in één BEGIN IMMEDIATE-transactie).
+
+        :param project_id: Stop enkel als de lopende sessie bij dit project hoort (optioneel).
+        :return: De gestopte sessie, of None als er (voor dit project) geen sessie liep.
+        """
+        try:
+            with self.transaction(immediate=True):
+                active = self.get_active_work_session()
+                if active is None or (project_id is not None and active.project_id != project_id):
+                    return None
+                active.end_time = end_time or datetime.now()
+                self.update_work_session_in_db(active)
+            return active
         except sqlite3.Error as e:
-            print("Fout bij bijwerken werksessie in database:", e)
+            self._report_error("Fout bij stoppen werksessie", e)
+            self._reraise_in_transaction()
+            return None
 
     def get_work_sessions_for_project(self, project_id: int) -> List[WorkSession]:
         """Retourneert alle werksessies voor een specifiek project."""
         try:
             cursor = self.connection.cursor()
             cursor.execute(
-                "SELECT id, project_id, start_time, end_time, description FROM work_sessions WHERE project_id = ?",
+                """SELECT id, project_id, start_time, end_time, description FROM work_sessions
+                   WHERE project_id = ?
+                   ORDER BY start_time, id""",
                 (project_id,)
             )
             rows = cursor.fetchall()
@@ -158,19 +578,344 @@ class Database:
             for row in rows:
                 ws = WorkSession(
                     project_id=row["project_id"],
-                    start_time=datetime.fromisoformat(row["start_time"]),
+                    start_time=self._from_db(row["start_time"]),
                     description=row["description"] or "",
-                    end_time=datetime.fromisoformat(row["end_time"]) if row["end_time"] else None,
+                    end_time=self._from_db(row["end_time"]),
                     id=row["id"]
                 )
                 sessions.append(ws)
             return sessions
         except sqlite3.Error as e:
-            print("Fout bij ophalen werksessies uit database:", e)
+            self._report_error("Fout bij ophalen werksessies uit database", e)
+            return []
+
+    def count_work_sessions(self, project_id: int) -> int:
+        """Aantal werksessies van een project (via de index, zonder ze te laden)."""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT COUNT(*) FROM work_sessions WHERE project_id = ?", (project_id,))
+            return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij tellen werksessies in database", e)
+            return 0
+
+    def get_work_sessions_page(self, project_id: int, limit: int = 20,
+                               position: Optional[Tuple[datetime, int]] = None, older: bool = True,
+                               start: Optional[datetime] = None,
+                               end: Optional[datetime] = None) -> List[WorkSession]:
+        """
+        Eén pagina werksessies van een project, nieuwste eerst, met keyset-paginering op
+        (start_time, id): er wordt nooit over voorgaande pagina's heen geteld (geen OFFSET).
+
+        :param limit: Maximaal aantal sessies op de pagina.
+        :param position: (start_time, id) van de sessie waarnaast de pagina begint; None = de nieuwste.
+        :param older: True = de sessies ouder dan `position`, False = de sessies nieuwer dan `position`.
+        :param start: Enkel sessies gestart vanaf dit tijdstip (optioneel).
+        :param end: Enkel sessies gestart vóór dit tijdstip (optioneel).
+        :return: De sessies van de pagina, altijd van nieuw naar oud gesorteerd.
+        """
+        conditions = ["project_id = ?"]
+        params: list = [project_id]
+        if position is not None:
+            conditions.append(f"(start_time, id) {'<' if older else '>'} (?, ?)")
+            params.extend((self._to_db(position[0]), position[1]))
+        if start is not None:
+            conditions.append("start_time >= ?")
+            params.append(self._to_db(start))
+        if end is not None:
+            conditions.append("start_time < ?")
+            params.append(self._to_db(end))
+        order = "DESC" if older else "ASC"
+        params.append(limit)
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"""SELECT id, project_id, start_time, end_time, description FROM work_sessions
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY start_time {order}, id {order}
+                    LIMIT ?""",
+                params
+            )
+            sessions = [WorkSession(
+                project_id=row["project_id"],
+                start_time=self._from_db(row["start_time"]),
+                description=row["description"] or "",
+                end_time=self._from_db(row["end_time"]),
+                id=row["id"]
+            ) for row in cursor.fetchall()]
+            return sessions if older else sessions[::-1]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen werksessies uit database", e)
             return []
 
+    def iter_work_session_rows(self, project_id: int, chunk_size: int = 1000
+                               ) -> Iterator[Tuple[int, datetime, Optional[datetime], str]]:
+        """
+        Overloopt de werksessies van een project als (id, start, einde, beschrijving),
+        in dezelfde volgorde als get_work_sessions_for_project. De rijen worden per
+        `chunk_size` opgehaald en er worden geen WorkSession-objecten aangemaakt,
+        zodat het geheugengebruik niet groeit met de grootte van het project.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """SELECT id, start_time, end_time, description FROM work_sessions
+                   WHERE project_id = ?
+                   ORDER BY start_time, id""",
+                (project_id,)
+            )
+            from_db = self._from_db
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield row[0], from_db(row[1]), from_db(row[2]), row[3] or ""
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen werksessies uit database", e)
+
+    def get_work_session_array(self, project_id: Optional[int] = None,
+                               chunk_size: int = 10000) -> WorkSessionArray:
+        """
+        Laadt de werksessies (van één project, of alle) in een compacte WorkSessionArray.
+        SQLite levert de tijdstippen rechtstreeks als epoch-seconden, zodat er onderweg
+        geen datetime- of WorkSession-objecten aangemaakt worden.
+        """
+        epoch_sql = _EPOCH_SECONDS_SQL[self.timestamp_storage]
+        sessions = WorkSessionArray()
+        where, params = ("WHERE project_id = ?", (project_id,)) if project_id is not None else ("", ())
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None  # gewone tuples: sneller dan sqlite3.Row
+            cursor.execute(
+                f"""SELECT id, project_id, {epoch_sql.format(column='start_time')},
+                           {epoch_sql.format(column='end_time')}, description
+                    FROM work_sessions
+                    {where}
+                    ORDER BY {'start_time, id' if project_id is not None else 'id'}""",
+                params
+            )
+            append = sessions.append
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return sessions
+                for row in rows:
+                    append(row[0], row[1], row[2], row[3], row[4] or "")
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen werksessies uit database", e)
+            return sessions
+
+    # === TIJDSINTERVALLEN ===
+    # work_session_intervals (R*Tree, zie migrations._v6_session_intervals) vindt de kandidaten in
+    # logaritmische tijd; omdat de R*Tree naar buiten afrondt, volgt een exacte filter op work_sessions.
+    # Zoekgrenzen in hele epoch-seconden worden inclusief vergeleken, zodat er geen treffer wegvalt.
+    def _work_session_from_row(self, row: sqlite3.Row, prefix: str = "") -> WorkSession:
+        return WorkSession(
+            project_id=row[f"{prefix}project_id"],
+            start_time=self._from_db(row[f"{prefix}start_time"]),
+            description=row[f"{prefix}description"] or "",
+            end_time=self._from_db(row[f"{prefix}end_time"]),
+            id=row[f"{prefix}id"]
+        )
+
+    def iter_work_session_intervals(self, start: int, end: int, chunk_size: int = 10000
+                                    ) -> Iterator[Tuple[int, int, Optional[int]]]:
+        """
+        Overloopt alle sessies (over alle projecten) die het interval [start, end) raken als
+        (id, start, einde) in epoch-seconden, oplopend op starttijd. Een lopende sessie heeft
+        einde None. Bedoeld voor een sort-and-sweep over de tijdlijn, bv. bij een import.
+        """
+        epoch_sql = _EPOCH_SECONDS_SQL[self.timestamp_storage]
+        start_sql = epoch_sql.format(column="ws.start_time")
+        end_sql = epoch_sql.format(column="ws.end_time")
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                f"""SELECT ws.id, {start_sql} AS start_s, {end_sql} AS end_s
+                    FROM work_session_intervals r
+                    JOIN work_sessions ws ON ws.id = r.id
+                    WHERE r.start_s <= :end AND r.end_s >= :start
+                      AND ws.start_time < :end_db AND (ws.end_time IS NULL OR ws.end_time > :start_db)
+                    ORDER BY start_s, ws.id""",
+                {"start": start, "end": end,
+                 "start_db": self._to_db(from_epoch(start)), "end_db": self._to_db(from_epoch(end))}
+            )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield from rows
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen sessie-intervallen uit database", e)
+
+    def get_work_sessions_overlapping(self, start: datetime, end: datetime) -> List[WorkSession]:
+        """
+        Retourneert de sessies (over alle projecten) die overlappen met het interval [start, end),
+        oplopend op starttijd. Een lopende sessie loopt tot in het oneindige.
+        """
+        end_db = self._to_db(end)
+        if self.timestamp_storage == "epoch" and end.microsecond:
+            end_db += 1  # hele seconden: start < end  <=>  start < end naar boven afgerond
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """SELECT ws.id, ws.project_id, ws.start_time, ws.end_time, ws.description
+                   FROM work_session_intervals r
+                   JOIN work_sessions ws ON ws.id = r.id
+                   WHERE r.start_s <= :end AND r.end_s >= :start
+                     AND ws.start_time < :end_db AND (ws.end_time IS NULL OR ws.end_time > :start_db)
+                   ORDER BY ws.start_time, ws.id""",
+                {"start": to_epoch(start), "end": to_epoch(end),
+                 "start_db": self._to_db(start), "end_db": end_db}
+            )
+            return [self._work_session_from_row(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen overlappende werksessies uit database", e)
+            return []
+
+    def get_work_sessions_at(self, moment: datetime) -> List[WorkSession]:
+        """
+        Retourneert de sessie(s) die op `moment` liepen (start <= moment < einde, of nog lopend).
+        Zonder overlappende sessies is dat er hooguit één.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """SELECT ws.id, ws.project_id, ws.start_time, ws.end_time, ws.description
+                   FROM work_session_intervals r
+                   JOIN work_sessions ws ON ws.id = r.id
+                   WHERE r.start_s <= :moment AND r.end_s >= :moment
+                     AND ws.start_time <= :moment_db AND (ws.end_time IS NULL OR ws.end_time > :moment_db)
+                   ORDER BY ws.start_time, ws.id""",
+                {"moment": to_epoch(moment), "moment_db": self._to_db(moment)}
+            )
+            return [self._work_session_from_row(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen werksessies op tijdstip uit database", e)
+            return []
+
+    def get_overlapping_session_pairs(self, limit: Optional[int] = None) -> List[Tuple[WorkSession, WorkSession]]:
+        """
+        Auditrapport: alle paren sessies (over alle projecten) die elkaar in de tijd overlappen,
+        als (eerste, tweede) met eerste.id < tweede.id, oplopend op de starttijd van de eerste.
+        Voor elke sessie zoekt de R*Tree de overlappende sessies op, dus geen vergelijking van
+        alle paren.
+
+        :param limit: Maximaal aantal paren (optioneel).
+        """
+        columns = ", ".join(f"{alias}.{column} AS {alias}_{column}"
+                            for alias in ("a", "b")
+                            for column in ("id", "project_id", "start_time", "end_time", "description"))
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"""SELECT {columns}
+                    FROM work_session_intervals ra
+                    JOIN work_session_intervals rb
+                      ON rb.start_s <= ra.end_s AND rb.end_s >= ra.start_s AND rb.id > ra.id
+                    JOIN work_sessions a ON a.id = ra.id
+                    JOIN work_sessions b ON b.id = rb.id
+                    WHERE (a.end_time IS NULL OR b.start_time < a.end_time)
+                      AND (b.end_time IS NULL OR b.end_time > a.start_time)
+                    ORDER BY a.start_time, a.id, b.start_time, b.id
+                    LIMIT ?""",
+                (-1 if limit is None else limit,)
+            )
+            return [(self._work_session_from_row(row, "a_"), self._work_session_from_row(row, "b_"))
+                    for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij zoeken naar overlappende werksessies", e)
+            return []
+
+    # === INCREMENTELE EXPORT ===
+    def get_change_marks(self) -> Tuple[int, int]:
+        """
+        Retourneert (hoogste sessie-id, hoogste revisie): het punt tot waar een export
+        op dit moment alle nieuwe en gewijzigde sessies kan meenemen.
+        """
+        try:
+            row = self.connection.execute(
+                """SELECT (SELECT COALESCE(MAX(id), 0) FROM work_sessions),
+                          (SELECT COALESCE(MAX(revision), 0) FROM work_sessions WHERE revision IS NOT NULL)"""
+            ).fetchone()
+            return row[0], row[1]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen wijzigingsmarkeringen uit database", e)
+            return 0, 0
+
+    def iter_changed_work_session_rows(self, project_id: int, after_id: int, after_revision: int,
+                                       upto_id: int, upto_revision: int, chunk_size: int = 1000
+                                       ) -> Iterator[Tuple[int, datetime, Optional[datetime], str]]:
+        """
+        Overloopt de sessies van een project die na de markeringen (after_id, after_revision)
+        toegevoegd of gewijzigd zijn, tot en met (upto_id, upto_revision), gesorteerd op id.
+        Beide deelqueries lopen via een index op id of revisie, zodat de kost afhangt
+        van het aantal wijzigingen en niet van de volledige historiek.
+        """
+        try:
+            if after_id == 0:
+                # Eerste export: de volledige historiek van het project, via de projectindex.
+                sql = """SELECT id, start_time, end_time, description FROM work_sessions
+                         WHERE project_id = :project_id AND id <= :upto_id
+                         ORDER BY id"""
+            else:
+                sql = """SELECT id, start_time, end_time, description FROM work_sessions
+                         WHERE id > :after_id AND id <= :upto_id AND +project_id = :project_id
+                         UNION ALL
+                         SELECT id, start_time, end_time, description FROM work_sessions
+                         WHERE revision > :after_revision AND revision <= :upto_revision
+                           AND id <= :after_id AND +project_id = :project_id
+                         ORDER BY id"""
+            cursor = self.connection.cursor()
+            cursor.execute(
+                sql,
+                {"project_id": project_id, "after_id": after_id, "upto_id": upto_id,
+                 "after_revision": after_revision, "upto_revision": upto_revision}
+            )
+            from_db = self._from_db
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield row[0], from_db(row[1]), from_db(row[2]), row[3] or ""
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen gewijzigde werksessies uit database", e)
+
+    def get_export_state(self, project_id: int) -> Optional[Tuple[int, int, str]]:
+        """Retourneert (laatste sessie-id, laatste revisie, bestandspad) van de vorige incrementele export."""
+        try:
+            row = self.connection.execute(
+                "SELECT last_session_id, last_revision, file_path FROM export_state WHERE project_id = ?",
+                (project_id,)
+            ).fetchone()
+            return (row[0], row[1], row[2]) if row else None
+        except sqlite3.Error as e:
+            self._report_error("Fout bij ophalen exportstatus uit database", e)
+            return None
+
+    def save_export_state(self, project_id: int, last_session_id: int, last_revision: int, file_path: str):
+        """Bewaart de markeringen van een geslaagde incrementele export."""
+        try:
+            self.connection.execute(
+                """INSERT INTO export_state (project_id, last_session_id, last_revision, file_path, exported_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(project_id) DO UPDATE SET
+                       last_session_id = excluded.last_session_id,
+                       last_revision = excluded.last_revision,
+                       file_path = excluded.file_path,
+                       exported_at = excluded.exported_at""",
+                (project_id, last_session_id, last_revision, file_path, datetime.now().isoformat())
+            )
+            self._commit()
+        except sqlite3.Error as e:
+            self._report_error("Fout bij opslaan exportstatus in database", e)
+            self._reraise_in_transaction()
+
     def get_active_work_session(self) -> Optional[WorkSession]:
-        """Return één actieve sessie (max. 1 tegelijk toegestaan)"""
+        """Return de actieve sessie (de unieke index laat er maximaal 1 toe)"""
         try:
             cursor = self.connection.cursor()
             cursor.execute("""
@@ -184,14 +929,223 @@ class Database:
             if row:
                 return WorkSession(
                     project_id=row["project_id"],
-                    start_time=datetime.fromisoformat(row["start_time"]),
+                    start_time=self._from_db(row["start_time"]),
                     description=row["description"],
                     id=row["id"]
                 )
             return None
         except sqlite3.Error as e:
-            print("Fout bij ophalen actieve werksessie uit database:", e)
+            self._report_error("Fout bij ophalen actieve werksessie uit database", e)
             return None
 
+    # === ZOEKEN ===
+    def search_work_sessions(self, text: str, limit: int = 20) -> List[SearchResult]:
+        """
+        Zoekt werksessies op hun beschrijving via de FTS5-index, gesorteerd op relevantie (bm25).
+        Er wordt niet door de tabel gescand: enkel de index levert kandidaten. Bij meer dan
+        _RANK_WINDOW treffers wordt gerangschikt binnen de meest recent toegevoegde.
+        """
+        query = _fts_query(text)
+        if not query:
+            return []
+        try:
+            cursor = self.connection.cursor()
+            # bm25 moet elke treffer scoren; voor zeer algemene termen beperken we dat tot de
+            # _RANK_WINDOW meest recente treffers (FTS5 loopt de rowids aflopend af en stopt daar).
+            cursor.execute(
+                f"""SELECT MIN(rowid) FROM (
+                        SELECT rowid FROM work_sessions_fts
+                        WHERE work_sessions_fts MATCH :query
+                        ORDER BY rowid DESC
+                        LIMIT {_RANK_WINDOW}
+                    )""",
+                {"query": query}
+            )
+            min_rowid = cursor.fetchone()[0] or 0
+            cursor.execute(f"""
+                SELECT ws.id, ws.project_id, ws.start_time, ws.end_time, ws.description,
+                       p.name, p.description AS project_description, p.archived,
+                       snippet(work_sessions_fts, 0, '[', ']', '…', 12) AS snippet,
+                       work_sessions_fts.rank AS rank
+                FROM work_sessions_fts
+                JOIN work_sessions ws ON ws.id = work_sessions_fts.rowid
+                JOIN projects p ON p.id = ws.project_id
+                WHERE work_sessions_fts MATCH :query AND work_sessions_fts.rowid >= :min_rowid
+                ORDER BY work_sessions_fts.rank
+                LIMIT :limit
+            """, {"query": query, "limit": limit, "min_rowid": min_rowid})
+            return [SearchResult(
+                project=Project(
+                    proj_id=row["project_id"],
+                    name=row["name"],
+                    description=row["project_description"] or "",
+                    archived=bool(row["archived"])
+                ),
+                session=WorkSession(
+                    project_id=row["project_id"],
+                    start_time=self._from_db(row["start_time"]),
+                    description=row["description"] or "",
+                    end_time=self._from_db(row["end_time"]),
+                    id=row["id"]
+                ),
+                snippet=row["snippet"],
+                rank=row["rank"]
+            ) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij zoeken in werksessies", e)
+            return []
+
+    def search_projects(self, text: str, limit: int = 10) -> List[SearchResult]:
+        """Zoekt projecten op naam en beschrijving via de FTS5-index, gesorteerd op relevantie."""
+        query = _fts_query(text)
+        if not query:
+            return []
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT p.id, p.name, p.description, p.archived,
+                       snippet(projects_fts, -1, '[', ']', '…', 12) AS snippet,
+                       projects_fts.rank AS rank
+                FROM projects_fts
+                JOIN projects p ON p.id = projects_fts.rowid
+                WHERE projects_fts MATCH ?
+                ORDER BY projects_fts.rank
+                LIMIT ?
+            """, (query, limit))
+            return [SearchResult(
+                project=Project(
+                    proj_id=row["id"],
+                    name=row["name"],
+                    description=row["description"] or "",
+                    archived=bool(row["archived"])
+                ),
+                snippet=row["snippet"],
+                rank=row["rank"]
+            ) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            self._report_error("Fout bij zoeken in projecten", e)
+            return []
+
+    # === RAPPORTEN ===
+    def get_total_seconds_per_project(self, include_archived: bool = True) -> Dict[int, int]:
+        """
+        Totale duur (in seconden) van de afgesloten sessies per project, berekend in SQLite
+        uit de dagtotalen (daily_project_totals). Projecten zonder afgesloten sessies krijgen 0.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"""
+                SELECT p.id AS project_id,
+                       COALESCE(totals.duration_us, 0) / 1000000 AS total_seconds
+                FROM projects p
+                LEFT JOIN (
+                    SELECT project_id, SUM(total_us) AS duration_us
+                    FROM daily_project_totals
+                    GROUP BY project_id
+                ) totals ON totals.project_id = p.id
+                {"" if include_archived else "WHERE p.archived = 0"}
+                ORDER BY p.id
+            """)
+            return {row["project_id"]: row["total_seconds"] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            self._report_error("Fout bij berekenen totalen per project", e)
+            return {}
+
+    def get_worked_seconds_per_period(self, period: str, project_id: Optional[int] = None,
+                                      start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, int]:
+        """
+        Gewerkte tijd (in seconden) per dag, ISO-week of maand, gelezen uit de dagtotalen.
+        Anders dan get_total_seconds_per_period wordt een sessie over middernacht
+        over de betrokken dagen verdeeld.
+
+        :param period: "day" (2024-01-31), "week" (2024-W05) of "month" (2024-01).
+        :param project_id: Beperk tot één project (optioneel).
+        :param start: Eerste dag (inbegrepen, optioneel).
+        :param end: Laatste dag (niet inbegrepen, optioneel).
+        :return: Dict van periode naar seconden, oplopend gesorteerd.
+        """
+        if period not in _REPORT_PERIODS:
+            raise ValueError(f"Onbekende periode '{period}', kies uit: {', '.join(_REPORT_PERIODS)}.")
+
+        conditions = ["1"]
+        params = []
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if start is not None:
+            conditions.append("day >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            conditions.append("day < ?")
+            params.append(end.isoformat())
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"""
+                SELECT day, SUM(total_us) AS duration_us
+                FROM daily_project_totals
+                WHERE {" AND ".join(conditions)}
+                GROUP BY day
+                ORDER BY day
+            """, params)
+            totals_us: Dict[str, int] = {}
+            for row in cursor.fetchall():
+                key = _period_key(date.fromisoformat(row["day"]), period)
+                totals_us[key] = totals_us.get(key, 0) + row["duration_us"]
+            return {key: value // 1000000 for key, value in totals_us.items() if value}
+        except sqlite3.Error as e:
+            self._report_error("Fout bij berekenen gewerkte tijd per periode", e)
+            return {}
+
+    def get_total_seconds_per_period(self, period: str, project_id: Optional[int] = None,
+                                     start: Optional[datetime] = None,
+                                     end: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Totale duur (in seconden) van de afgesloten sessies per dag, ISO-week of maand.
+        Een sessie telt mee in de periode waarin ze gestart is.
+
+        :param period: "day" (2024-01-31), "week" (2024-W05) of "month" (2024-01).
+        :param project_id: Beperk tot één project (optioneel).
+        :param start: Enkel sessies gestart vanaf dit tijdstip (optioneel).
+        :param end: Enkel sessies gestart vóór dit tijdstip (optioneel).
+        :return: Dict van periode naar seconden, oplopend gesorteerd.
+        """
+        if period not in _REPORT_PERIODS:
+            raise ValueError(f"Onbekende periode '{period}', kies uit: {', '.join(_REPORT_PERIODS)}.")
+
+        conditions = ["end_time IS NOT NULL"]
+        params = []
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if start is not None:
+            conditions.append("start_time >= ?")
+            params.append(self._to_db(start))
+        if end is not None:
+            conditions.append("start_time < ?")
+            params.append(self._to_db(end))
+
+        duration_sql = _DURATION_US_SQL[self.timestamp_storage]
+        day_sql = _START_DAY_SQL[self.timestamp_storage]
+        try:
+            cursor = self.connection.cursor()
+            # SQLite groepeert per startdag; de hooguit enkele duizenden dagen
+            # worden daarna in Python per week/maand samengeteld.
+            cursor.execute(f"""
+                SELECT {day_sql} AS day,
+                       SUM({duration_sql}) AS duration_us
+                FROM work_sessions
+                WHERE {" AND ".join(conditions)}
+                GROUP BY day
+                ORDER BY day
+            """, params)
+            totals_us: Dict[str, int] = {}
+            for row in cursor.fetchall():
+                key = _period_key(self._day_from_db(row["day"]), period)
+                totals_us[key] = totals_us.get(key, 0) + row["duration_us"]
+            return {key: value // 1000000 for key, value in totals_us.items()}
+        except sqlite3.Error as e:
+            self._report_error("Fout bij berekenen totalen per periode", e)
+            return {}
+
     def close(self):
         self.connection.close()
\ No newline at end of file
@@ -0,0 +1,284 @@
+# data/instrumentation.py
+"""
+Opt-in instrumentatie van Database: per methode het aantal aanroepen, een latentiehistogram,
+het aantal teruggegeven rijen, fouten (ook de databasefouten die de methode zelf opvangt) en de
+uitgevoerde SQL (via sqlite3.set_trace_callback).
+
+Aanzetten met DB_INSTRUMENTATION=true in .env (of enable()); elke Database die daarna geopend
+wordt, wordt geïnstrumenteerd. Bij het afsluiten van het programma worden de metingen als JSON
+weggeschreven naar DB_INSTRUMENTATION_FILE. `python main.py --profile` toont daarnaast de
+traagste methodes na een sessie in het menu.
+"""
+
+import atexit
+import functools
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+from config import DB_INSTRUMENTATION, DB_INSTRUMENTATION_FILE
+
+# Bovengrenzen (in ms) van de klassen van het latentiehistogram; de laatste klasse is open.
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+# Methodes die niet gemeten worden: transaction() is een contextmanager, close() beëindigt de verbinding.
+_SKIPPED_METHODS = {"transaction", "close"}
+
+# Maximaal aantal verschillende SQL-statements dat per methode bijgehouden wordt.
+_MAX_STATEMENTS = 200
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Vervangt letterlijke waarden door ? en comprimeert witruimte, zodat gelijke queries samenvallen."""
+    return _WHITESPACE.sub(" ", _LITERALS.sub("?", sql)).strip()[:300]
+
+
+def _bucket_label(index: int) -> str:
+    if index == len(LATENCY_BUCKETS_MS):
+        return f">={LATENCY_BUCKETS_MS[-1]:g}ms"
+    return f"<{LATENCY_BUCKETS_MS[index]:g}ms"
+
+
+def _count_rows(result) -> int:
+    """Aantal rijen in een resultaat: lengte van een lijst/dict/array, anders 1 (of 0 voor None)."""
+    if result is None or isinstance(result, bool):
+        return 0
+    if isinstance(result, (str, bytes, int, float, tuple)):
+        return 1
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+class MethodStats:
+    """Metingen van één Database-methode."""
+    __slots__ = ("calls", "errors", "rows", "total_s", "max_s", "histogram", "statements")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.statements: Dict[str, int] = {}
+
+    def record(self, seconds: float, rows: int, failed: bool):
+        self.calls += 1
+        self.errors += failed
+        self.rows += rows
+        self.total_s += seconds
+        self.max_s = max(self.max_s, seconds)
+        milliseconds = seconds * 1000
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if milliseconds < bound),
+                     len(LATENCY_BUCKETS_MS))
+        self.histogram[index] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": round(self.total_s * 1000, 3),
+            "mean_ms": round(self.total_s * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_s * 1000, 3),
+            "histogram": {_bucket_label(i): count for i, count in enumerate(self.histogram) if count},
+            "sql": dict(sorted(self.statements.items(), key=lambda item: -item[1])),
+        }
+
+
+class Profiler:
+    """
+    Verzamelt metingen van alle geïnstrumenteerde Database-verbindingen (thread-safe).
+    SQL en opgevangen fouten worden toegeschreven aan de binnenste Database-methode die op dat
+    moment loopt; per thread houdt een stapel van [naam, mislukt] bij welke methodes lopen.
+    """
+    def __init__(self):
+        self.methods: Dict[str, MethodStats] = {}
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[list]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _stats(self, name: str) -> MethodStats:
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = MethodStats()
+        return stats
+
+    def trace(self, sql: str):
+        """Callback voor sqlite3.Connection.set_trace_callback."""
+        stack = self._stack()
+        name = stack[-1][0] if stack else "(buiten Database-methodes)"
+        statement = normalize_sql(sql)
+        with self._lock:
+            statements = self._stats(name).statements
+            if statement in statements or len(statements) < _MAX_STATEMENTS:
+                statements[statement] = statements.get(statement, 0) + 1
+
+    def record(self, name: str, seconds: float, rows: int, failed: bool):
+        with self._lock:
+            self._stats(name).record(seconds, rows, failed)
+
+    def report_error(self, report: Callable) -> Callable:
+        """Omhult Database._report_error: een opgevangen fout markeert de lopende methode als mislukt."""
+        profiler = self
+
+        @functools.wraps(report)
+        def wrapper(message, error):
+            stack = profiler._stack()
+            if stack:
+                stack[-1][1] = True
+            return report(message, error)
+        return wrapper
+
+    def wrap(self, name: str, method: Callable) -> Callable:
+        """Omhult een methode met een tijdsmeting; generators worden gemeten tot ze uitgeput zijn."""
+        import inspect  # pas nodig als de instrumentatie aan staat (scheelt ~10 ms bij het opstarten)
+
+        profiler = self
+
+        if inspect.isgeneratorfunction(getattr(method, "__func__", method)):
+            @functools.wraps(method)
+            def generator_wrapper(*args, **kwargs) -> Iterator:
+                # Enkel de tijd in de generator zelf telt, niet die van de aanroeper tussen twee rijen.
+                iterator = method(*args, **kwargs)
+                rows, elapsed, failed = 0, 0.0, False
+                try:
+                    while True:
+                        stack = profiler._stack()
+                        frame = [name, False]
+                        stack.append(frame)
+                        started = time.perf_counter()
+                        try:
+                            item = next(iterator)
+                        except StopIteration:
+                            return
+                        except Exception:
+                            failed = True
+                            raise
+                        finally:
+                            elapsed += time.perf_counter() - started
+                            stack.pop()
+                            failed = failed or frame[1]
+                        rows += 1
+                        yield item
+                finally:
+                    profiler.record(name, elapsed, rows, failed)
+            return generator_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            stack = profiler._stack()
+            frame = [name, False]
+            stack.append(frame)
+            failed = True
+            result = None
+            started = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+                failed = frame[1]
+                return result
+            finally:
+                elapsed = time.perf_counter() - started
+                stack.pop()
+                profiler.record(name, elapsed, _count_rows(result), failed)
+        return wrapper
+
+    def instrument(self, db) -> None:
+        """Instrumenteert één Database-object: publieke methodes en de SQL-trace van de verbinding."""
+        import inspect
+        for name, method in inspect.getmembers(db, inspect.ismethod):
+            if name.startswith("_") or name in _SKIPPED_METHODS:
+                continue
+            setattr(db, name, self.wrap(name, method))
+        db._report_error = self.report_error(db._report_error)
+        db.connection.set_trace_callback(self.trace)
+
+    # === RAPPORTERING ===
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+                "pid": os.getpid(),
+                "methods": {
+                    name: stats.to_dict()
+                    for name, stats in sorted(self.methods.items(), key=lambda item: -item[1].total_s)
+                },
+            }
+
+    def dump(self, file_path: str = DB_INSTRUMENTATION_FILE) -> str:
+        """Schrijft de metingen als JSON weg en geeft het pad terug."""
+        import json
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return file_path
+
+    def print_report(self, top: int = 10, out: Optional[TextIO] = None):
+        """Toont de methodes met de meeste totale tijd, met hun vaakst uitgevoerde SQL."""
+        out = out or sys.stdout
+        data = self.to_dict()["methods"]
+        ranked = [(name, stats) for name, stats in data.items() if stats["calls"]][:top]
+        print(f"\n=== Database-profiel: top {len(ranked)} methodes op totale tijd ===", file=out)
+        print(f"{'methode':<36} {'calls':>7} {'totaal':>10} {'gem.':>9} {'max':>9} {'rijen':>9} {'fout':>5}",
+              file=out)
+        for name, stats in ranked:
+            print(f"{name:<36} {stats['calls']:>7} {stats['total_ms']:>8.1f}ms {stats['mean_ms']:>7.2f}ms "
+                  f"{stats['max_ms']:>7.1f}ms {stats['rows']:>9} {stats['errors']:>5}", file=out)
+            for statement, count in list(stats["sql"].items())[:2]:
+                print(f"    {count:>6}× {statement[:100]}", file=out)
+
+
+_profiler: Optional[Profiler] = None
+_enabled = DB_INSTRUMENTATION
+
+
+def enable():
+    """Zet de instrumentatie aan voor alle Database-objecten die hierna geopend worden."""
+    global _enabled
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def get_profiler() -> Profiler:
+    """De gedeelde profiler; bij de eerste aanroep wordt de JSON-dump bij afsluiten geregistreerd."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+        atexit.register(_dump_at_exit, _profiler, os.getpid())
+    return _profiler
+
+
+def _dump_at_exit(profiler: Profiler, pid: int):
+    # Enkel in het proces dat de profiler aanmaakte, niet in geforkte workers.
+    if os.getpid() != pid or not profiler.methods:
+        return
+    try:
+        file_path = profiler.dump()
+        print(f"Instrumentatie weggeschreven naar {file_path}", file=sys.stderr)
+    except OSError as e:
+        print(f"Fout bij wegschrijven instrumentatie: {e}", file=sys.stderr)
+
+
+def instrument_if_enabled(db):
+    """Wordt door Database.__init__ aangeroepen; doet niets als de instrumentatie uit staat."""
+    if _enabled:
+        get_profiler().instrument(db)
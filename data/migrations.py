@@ -0,0 +1,299 @@
+# data/migrations.py
+
+import re
+import sqlite3
+from typing import Callable, List
+
+from data.rollup import CREATE_TABLE_SQL as _ROLLUP_TABLE_SQL, apply_to_rollup
+
+
+def _v1_work_session_indexes(cursor: sqlite3.Cursor):
+    """Indexen voor het opzoeken van sessies per project en van de lopende sessie."""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_work_sessions_project_start
+        ON work_sessions (project_id, start_time)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_work_sessions_open
+        ON work_sessions (start_time)
+        WHERE end_time IS NULL
+    ''')
+
+
+def _v2_change_tracking(cursor: sqlite3.Cursor):
+    """
+    Wijzigingsregistratie voor incrementele exports. Nieuwe sessies zijn herkenbaar aan hun
+    (oplopende) id; een trigger geeft elke gewijzigde sessie een nieuw, globaal oplopend
+    revisienummer. export_state bewaart per project tot waar al geëxporteerd werd.
+    """
+    cursor.execute("ALTER TABLE work_sessions ADD COLUMN revision INTEGER")
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_work_sessions_revision
+        ON work_sessions (revision)
+        WHERE revision IS NOT NULL
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS work_sessions_revision
+        AFTER UPDATE OF project_id, start_time, end_time, description ON work_sessions
+        WHEN OLD.project_id IS NOT NEW.project_id OR OLD.start_time IS NOT NEW.start_time
+             OR OLD.end_time IS NOT NEW.end_time OR OLD.description IS NOT NEW.description
+        BEGIN
+            UPDATE work_sessions
+            SET revision = (SELECT COALESCE(MAX(revision), 0) + 1 FROM work_sessions WHERE revision IS NOT NULL)
+            WHERE id = NEW.id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS export_state (
+            project_id INTEGER PRIMARY KEY,
+            last_session_id INTEGER NOT NULL,
+            last_revision INTEGER NOT NULL,
+            file_path TEXT NOT NULL,
+            exported_at TEXT NOT NULL,
+            FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
+        )
+    ''')
+
+
+def _v3_daily_rollup(cursor: sqlite3.Cursor):
+    """Dagtotalen per project (data/rollup.py), meteen gevuld met de bestaande sessies."""
+    cursor.execute(_ROLLUP_TABLE_SQL)
+    apply_to_rollup(cursor, get_timestamp_storage(cursor.connection), "1", {})
+
+
+def _v4_full_text_search(cursor: sqlite3.Cursor):
+    """
+    FTS5-indexen op de beschrijving van werksessies en op naam/beschrijving van projecten.
+    Het zijn external-content tabellen (de tekst staat enkel in de gewone tabel);
+    triggers houden de index synchroon en 'rebuild' indexeert de bestaande rijen.
+    """
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS work_sessions_fts USING fts5(
+            description, content='work_sessions', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+    ''')
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+            name, description, content='projects', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+    ''')
+    for table, columns in (("work_sessions", ("description",)), ("projects", ("name", "description"))):
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"NEW.{column}" for column in columns)
+        old_values = ", ".join(f"OLD.{column}" for column in columns)
+        delete_old = (f"INSERT INTO {table}_fts ({table}_fts, rowid, {column_list}) "
+                      f"VALUES ('delete', OLD.id, {old_values});")
+        insert_new = f"INSERT INTO {table}_fts (rowid, {column_list}) VALUES (NEW.id, {new_values});"
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} "
+                       f"BEGIN {insert_new} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} "
+                       f"BEGIN {delete_old} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_update AFTER UPDATE OF {column_list} ON {table} "
+                       f"BEGIN {delete_old} {insert_new} END")
+        cursor.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
+
+
+def _v5_single_open_session(cursor: sqlite3.Cursor):
+    """
+    Hooguit één lopende sessie, afgedwongen door de database: een unieke partiële index
+    waarin elke lopende sessie dezelfde sleutel heeft. Bestaande dubbele lopende sessies
+    worden eerst afgesloten met duur 0 (einde = begin), zodat de migratie geen uren toevoegt
+    die niemand geregistreerd heeft; de nieuwste blijft lopen. De betrokken sessies worden gemeld.
+    """
+    open_sessions = cursor.execute(
+        "SELECT id FROM work_sessions WHERE end_time IS NULL ORDER BY start_time, id"
+    ).fetchall()
+    closed_ids = [row[0] for row in open_sessions[:-1]]
+    if closed_ids:
+        storage = get_timestamp_storage(cursor.connection)
+        for session_id in closed_ids:
+            params = {"id": session_id}
+            cursor.execute("UPDATE work_sessions SET end_time = start_time WHERE id = :id", params)
+            apply_to_rollup(cursor, storage, "id = :id", params)
+        print(f"Migratie: {len(closed_ids)} extra lopende sessie(s) afgesloten met duur 0, "
+              f"vul hun eindtijd zelf aan: sessie-id's {', '.join(map(str, closed_ids))}.")
+    cursor.execute("DROP INDEX IF EXISTS idx_work_sessions_open")
+    cursor.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_work_sessions_single_open
+        ON work_sessions ((end_time IS NULL))
+        WHERE end_time IS NULL
+    ''')
+
+
+# Einde van een lopende sessie in work_session_intervals (9999-12-31 23:59:59).
+OPEN_INTERVAL_END = 253402300799
+
+# Epoch-seconden van een tijdstip, ongeacht het opslagformaat: zo blijven de triggers
+# geldig wanneer convert_timestamps_to_epoch de tabel omzet.
+_ANY_EPOCH_SQL = "(CASE typeof({value}) WHEN 'integer' THEN {value} ELSE CAST(strftime('%s', {value}) AS INTEGER) END)"
+
+
+def _interval_values_sql(row: str) -> str:
+    """(id, start, einde) van een sessie voor work_session_intervals; `row` is NEW of een tabelnaam."""
+    start = _ANY_EPOCH_SQL.format(value=f"{row}.start_time")
+    end = f"COALESCE({_ANY_EPOCH_SQL.format(value=f'{row}.end_time')}, {OPEN_INTERVAL_END})"
+    # MAX: een R*Tree weigert een interval met het einde vóór het begin.
+    return f"{row}.id, {start}, MAX({start}, {end})"
+
+
+def _v6_session_intervals(cursor: sqlite3.Cursor):
+    """
+    R*Tree-index op het tijdsinterval [start, einde] van elke werksessie, voor overlap- en
+    tijdstipvragen in logaritmische tijd. De R*Tree bewaart 32-bit floats en rondt elk
+    interval naar buiten af; queries filteren daarna nog exact op work_sessions.
+    """
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS work_session_intervals USING rtree(id, start_s, end_s)
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS work_session_intervals_insert AFTER INSERT ON work_sessions
+        BEGIN
+            INSERT INTO work_session_intervals (id, start_s, end_s) VALUES ({_interval_values_sql("NEW")});
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS work_session_intervals_update AFTER UPDATE OF start_time, end_time ON work_sessions
+        BEGIN
+            INSERT OR REPLACE INTO work_session_intervals (id, start_s, end_s) VALUES ({_interval_values_sql("NEW")});
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS work_session_intervals_delete AFTER DELETE ON work_sessions
+        BEGIN
+            DELETE FROM work_session_intervals WHERE id = OLD.id;
+        END
+    ''')
+    cursor.execute(f'''
+        INSERT OR REPLACE INTO work_session_intervals (id, start_s, end_s)
+        SELECT {_interval_values_sql("work_sessions")} FROM work_sessions
+    ''')
+
+
+# Triggers die per rij een secundaire index bijwerken: de FTS5-indexen (v4) en de R*Tree (v6).
+_INDEX_TRIGGERS_SQL = """
+    SELECT name, sql FROM sqlite_master
+    WHERE type = 'trigger' AND (name GLOB '*_fts_*' OR name GLOB 'work_session_intervals_*')
+"""
+
+
+def suspend_index_triggers(cursor: sqlite3.Cursor) -> List[str]:
+    """
+    Verwijdert de FTS5- en R*Tree-triggers voor een bulk-load, binnen de lopende transactie.
+    Geeft hun CREATE-statements terug voor rebuild_indexes.
+    """
+    triggers = cursor.execute(_INDEX_TRIGGERS_SQL).fetchall()
+    for name, _ in triggers:
+        cursor.execute(f"DROP TRIGGER {name}")
+    return [sql for _, sql in triggers]
+
+
+def rebuild_indexes(cursor: sqlite3.Cursor, trigger_sql: List[str]):
+    """
+    Na een bulk-load: herbouwt de FTS5-indexen ('rebuild') en de R*Tree in één keer uit de
+    tabellen, en zet de triggers van suspend_index_triggers terug.
+    """
+    cursor.execute("INSERT INTO work_sessions_fts (work_sessions_fts) VALUES ('rebuild')")
+    cursor.execute("INSERT INTO projects_fts (projects_fts) VALUES ('rebuild')")
+    cursor.execute("DELETE FROM work_session_intervals")
+    cursor.execute(f'''
+        INSERT INTO work_session_intervals (id, start_s, end_s)
+        SELECT {_interval_values_sql("work_sessions")} FROM work_sessions
+    ''')
+    for sql in trigger_sql:
+        cursor.execute(sql)
+
+
+# Volgorde is belangrijk: migratie op index i brengt de database naar versie i + 1.
+MIGRATIONS: List[Callable[[sqlite3.Cursor], None]] = [
+    _v1_work_session_indexes,
+    _v2_change_tracking,
+    _v3_daily_rollup,
+    _v4_full_text_search,
+    _v5_single_open_session,
+    _v6_session_intervals,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Leest de schemaversie uit PRAGMA user_version."""
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(connection: sqlite3.Connection) -> int:
+    """
+    Voert alle openstaande migraties uit op een bestaande database.
+    Elke migratie wordt samen met de nieuwe user_version in één transactie gecommit,
+    zodat een onderbroken upgrade bij de volgende start gewoon verder gaat.
+
+    :return: De schemaversie na het uitvoeren van de migraties.
+    """
+    version = get_schema_version(connection)
+    for index in range(version, SCHEMA_VERSION):
+        cursor = connection.cursor()
+        # DDL start geen impliciete transactie in sqlite3, dus expliciet openen.
+        cursor.execute("BEGIN")
+        try:
+            MIGRATIONS[index](cursor)
+            cursor.execute(f"PRAGMA user_version = {index + 1}")
+            connection.commit()
+        except sqlite3.Error:
+            connection.rollback()
+            raise
+        version = index + 1
+    return version
+
+
+def get_timestamp_storage(connection: sqlite3.Connection) -> str:
+    """Bepaalt aan de hand van het kolomtype hoe work_sessions tijdstippen opslaat ("iso" of "epoch")."""
+    column_types = {row[1]: row[2].upper() for row in connection.execute("PRAGMA table_info(work_sessions)")}
+    return "epoch" if column_types.get("start_time") == "INTEGER" else "iso"
+
+
+def convert_timestamps_to_epoch(connection: sqlite3.Connection):
+    """
+    Zet start_time/end_time van work_sessions in place om van ISO-tekst naar epoch-seconden.
+    SQLite kan het type van een kolom niet wijzigen, dus de tabel wordt opnieuw opgebouwd
+    (alle kolommen, id's, indexen en triggers blijven behouden) in één transactie.
+    """
+    table_sql = connection.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'work_sessions'"
+    ).fetchone()[0]
+    new_table_sql = re.sub(r"\b(start_time|end_time)\s+TEXT\b", r"\1 INTEGER", table_sql)
+    new_table_sql = re.sub(r"^CREATE TABLE\s+(IF NOT EXISTS\s+)?\"?work_sessions\"?",
+                           "CREATE TABLE work_sessions_epoch", new_table_sql, flags=re.IGNORECASE)
+    dependent_sql = [row[0] for row in connection.execute(
+        "SELECT sql FROM sqlite_master "
+        "WHERE tbl_name = 'work_sessions' AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+    )]
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(work_sessions)")]
+    # strftime('%s') leest de tekst als UTC, wat overeenkomt met timestamps.to_epoch.
+    select_list = ", ".join(
+        f"CAST(strftime('%s', {column}) AS INTEGER)" if column in ("start_time", "end_time") else column
+        for column in columns
+    )
+    sequence = connection.execute("SELECT seq FROM sqlite_sequence WHERE name = 'work_sessions'").fetchone()
+
+    cursor = connection.cursor()
+    # Zonder legacy_alter_table valideert RENAME het hele schema terwijl de tabel even ontbreekt.
+    cursor.execute("PRAGMA legacy_alter_table = ON")
+    cursor.execute("BEGIN")
+    try:
+        cursor.execute(new_table_sql)
+        cursor.execute(f"INSERT INTO work_sessions_epoch ({', '.join(columns)}) "
+                       f"SELECT {select_list} FROM work_sessions")
+        cursor.execute("DROP TABLE work_sessions")
+        cursor.execute("ALTER TABLE work_sessions_epoch RENAME TO work_sessions")
+        for sql in dependent_sql:
+            cursor.execute(sql)
+        if sequence:
+            cursor.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = 'work_sessions'", (sequence[0],))
+        connection.commit()
+    except sqlite3.Error:
+        connection.rollback()
+        raise
+    finally:
+        cursor.execute("PRAGMA legacy_alter_table = OFF")
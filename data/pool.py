@@ -0,0 +1,88 @@
+# data/pool.py
+"""
+Verbindingspool voor gebruik vanuit meerdere threads, zoals de API-server (ui/api_server.py).
+
+Een sqlite3-verbinding mag niet door meerdere threads tegelijk gebruikt worden, daarom:
+  - krijgt elke thread bij zijn eerste leesoperatie een eigen Database (alleen-lezen via
+    PRAGMA query_only), die hij daarna blijft hergebruiken;
+  - gaan alle schrijfoperaties via één gedeelde Database, achter een lock.
+
+De pool opent de database minstens met het "wal"-profiel: in WAL-modus lezen de lezers een
+consistente momentopname zonder op de schrijver te wachten, en omgekeerd. De pool is bedoeld
+voor een vaste set threads (een threadpool); de verbinding van een thread blijft open tot close().
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+
+from config import DB_PATH, TIMESTAMP_STORAGE
+from data.connection import CONNECTION_PROFILES, get_connection_pragmas
+from data.database import Database
+
+
+class DatabasePool:
+    """Eén leesverbinding per thread en één gedeelde, geserialiseerde schrijfverbinding."""
+    def __init__(self, db_path: str = DB_PATH, timestamp_storage: str = TIMESTAMP_STORAGE,
+                 pragmas: Optional[Dict[str, Union[str, int]]] = None):
+        """
+        :param db_path: Pad naar het databasebestand.
+        :param timestamp_storage: Gewenst opslagformaat voor tijdstippen ("iso" of "epoch").
+        :param pragmas: PRAGMA-instellingen; standaard het profiel uit config.py, aangevuld met het
+                        "wal"-profiel voor wat daar niet ingesteld is.
+        """
+        self.db_path = db_path
+        base = get_connection_pragmas() if pragmas is None else pragmas
+        self.pragmas = {**CONNECTION_PROFILES["wal"], **base}
+        # De schrijver opent eerst: hij voert eventuele migraties en de omzetting naar epoch uit,
+        # zodat de lezers een up-to-date schema vinden en zelf niets hoeven te schrijven.
+        self._writer = Database(db_path, timestamp_storage, self.pragmas, check_same_thread=False)
+        self.timestamp_storage = self._writer.timestamp_storage
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: List[Database] = []
+        self._readers_lock = threading.Lock()
+        self._closed = False
+
+    def reader(self) -> Database:
+        """De leesverbinding van de huidige thread; wordt bij het eerste gebruik geopend."""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            if self._closed:
+                raise RuntimeError("De verbindingspool is gesloten.")
+            # check_same_thread=False enkel zodat close() ze vanuit een andere thread kan sluiten.
+            db = Database(self.db_path, self.timestamp_storage, self.pragmas, check_same_thread=False)
+            db.connection.execute("PRAGMA query_only = ON")
+            with self._readers_lock:
+                self._readers.append(db)
+            self._local.db = db
+        return db
+
+    @contextmanager
+    def writer(self) -> Iterator[Database]:
+        """
+        Geeft de gedeelde schrijfverbinding, met de lock in handen zolang het blok loopt:
+
+            with pool.writer() as db:
+                db.start_work_session(project_id)
+        """
+        with self._write_lock:
+            if self._closed:
+                raise RuntimeError("De verbindingspool is gesloten.")
+            yield self._writer
+
+    @property
+    def reader_count(self) -> int:
+        """Aantal geopende leesverbindingen (één per thread die al gelezen heeft)."""
+        with self._readers_lock:
+            return len(self._readers)
+
+    def close(self):
+        """Sluit de schrijfverbinding en alle leesverbindingen; enkel aanroepen als geen thread ze nog gebruikt."""
+        with self._write_lock:
+            self._closed = True
+            self._writer.close()
+        with self._readers_lock:
+            for db in self._readers:
+                db.close()
+            self._readers.clear()
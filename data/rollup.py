@@ -0,0 +1,157 @@
+# data/rollup.py
+
+import sqlite3
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from data.timestamps import SECONDS_PER_DAY, from_epoch
+
+# daily_project_totals: per project en kalenderdag de totale duur (in microseconden) van de
+# afgesloten sessies. Een sessie over middernacht telt voor elk deel bij de juiste dag.
+
+_MICROSECONDS_PER_DAY = SECONDS_PER_DAY * 1_000_000
+
+# Tijdstip als microseconden sinds 1970, per opslagformaat (zie database._DURATION_US_SQL).
+_EPOCH_US_SQL = {
+    "iso": "(strftime('%s', {column}) * 1000000 + CAST(substr({column}, 21) AS INTEGER))",
+    "epoch": "({column} * 1000000)",
+}
+
+CREATE_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS daily_project_totals (
+        project_id INTEGER NOT NULL,
+        day TEXT NOT NULL,
+        total_us INTEGER NOT NULL,
+        PRIMARY KEY (project_id, day)
+    ) WITHOUT ROWID
+'''
+
+
+def _rollup_select_sql(storage: str, where: str) -> str:
+    """
+    SELECT die de afgesloten sessies die aan `where` voldoen per dag opsplitst en
+    (project_id, dag, microseconden) teruggeeft. :sign = -1 trekt hun bijdrage af.
+    """
+    start_us = _EPOCH_US_SQL[storage].format(column="start_time")
+    end_us = _EPOCH_US_SQL[storage].format(column="end_time")
+    day = _MICROSECONDS_PER_DAY
+    return f"""
+        WITH RECURSIVE pieces(project_id, piece_start, session_end) AS (
+            SELECT project_id, {start_us}, {end_us}
+            FROM work_sessions
+            WHERE end_time IS NOT NULL AND ({where})
+            UNION ALL
+            SELECT project_id, (piece_start / {day} + 1) * {day}, session_end
+            FROM pieces
+            WHERE (piece_start / {day} + 1) * {day} < session_end
+        )
+        SELECT project_id,
+               date(piece_start / {day} * {SECONDS_PER_DAY}, 'unixepoch') AS day,
+               :sign * SUM(MIN(session_end, (piece_start / {day} + 1) * {day}) - piece_start) AS total_us
+        FROM pieces
+        WHERE session_end > piece_start
+        GROUP BY project_id, day
+    """
+
+
+def apply_to_rollup(cursor: sqlite3.Cursor, storage: str, where: str, params: Dict, sign: int = 1):
+    """
+    Telt de sessies die aan `where` voldoen op (sign=1) of af (sign=-1) in daily_project_totals.
+    Moet in dezelfde transactie lopen als de wijziging aan work_sessions.
+    """
+    cursor.execute(
+        f"""INSERT INTO daily_project_totals (project_id, day, total_us)
+            {_rollup_select_sql(storage, where)}
+            ON CONFLICT(project_id, day) DO UPDATE SET total_us = total_us + excluded.total_us""",
+        dict(params, sign=sign)
+    )
+
+
+def rebuild_rollup(connection: sqlite3.Connection, storage: str):
+    """Berekent daily_project_totals volledig opnieuw uit de ruwe werksessies (in één transactie)."""
+    cursor = connection.cursor()
+    cursor.execute("BEGIN")
+    try:
+        cursor.execute("DELETE FROM daily_project_totals")
+        apply_to_rollup(cursor, storage, "1", {})
+        connection.commit()
+    except sqlite3.Error:
+        connection.rollback()
+        raise
+
+
+def split_by_day(start: datetime, end: datetime) -> List[Tuple[date, timedelta]]:
+    """Splitst het interval [start, end) op middernacht in (dag, duur)-delen."""
+    pieces = []
+    while start < end:
+        midnight = datetime.combine(start.date() + timedelta(days=1), datetime.min.time())
+        piece_end = min(end, midnight)
+        pieces.append((start.date(), piece_end - start))
+        start = piece_end
+    return pieces
+
+
+def check_rollup(connection: sqlite3.Connection, storage: str,
+                 project_id: Optional[int] = None) -> List[Tuple[int, str, int, int]]:
+    """
+    Vergelijkt daily_project_totals met een onafhankelijke herberekening in Python.
+
+    :return: Lijst van afwijkingen als (project_id, dag, verwacht, opgeslagen) in microseconden; leeg = consistent.
+    """
+    def parse(value):
+        return from_epoch(value) if storage == "epoch" else datetime.fromisoformat(value)
+
+    where, params = ("WHERE project_id = ?", (project_id,)) if project_id is not None else ("", ())
+    expected: Dict[Tuple[int, str], int] = defaultdict(int)
+    rows = connection.execute(
+        f"SELECT project_id, start_time, end_time FROM work_sessions {where}", params
+    )
+    for row_project_id, start_time, end_time in rows:
+        if end_time is None:
+            continue
+        for day, duration in split_by_day(parse(start_time), parse(end_time)):
+            expected[(row_project_id, day.isoformat())] += duration // timedelta(microseconds=1)
+
+    stored = {
+        (row[0], row[1]): row[2]
+        for row in connection.execute(f"SELECT project_id, day, total_us FROM daily_project_totals {where}", params)
+    }
+    differences = []
+    for key in sorted(set(expected) | set(stored)):
+        if expected.get(key, 0) != stored.get(key, 0):
+            differences.append((key[0], key[1], expected.get(key, 0), stored.get(key, 0)))
+    return differences
+
+
+def main():
+    import argparse  # enkel nodig voor de opdrachtregel, niet bij het importeren door Database
+    from data.database import Database  # Database importeert deze module
+
+    parser = argparse.ArgumentParser(description="Beheer van de dagtotalen (daily_project_totals).")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--rebuild", action="store_true", help="Herbereken de dagtotalen uit de ruwe sessies")
+    action.add_argument("--check", action="store_true", help="Controleer de dagtotalen tegen de ruwe sessies")
+    parser.add_argument("--db", help="Pad naar de database (default: DB_PATH uit de configuratie)")
+    args = parser.parse_args()
+
+    db = Database(args.db) if args.db else Database()
+    try:
+        if args.rebuild:
+            rebuild_rollup(db.connection, db.timestamp_storage)
+            count = db.connection.execute("SELECT COUNT(*) FROM daily_project_totals").fetchone()[0]
+            print(f"Dagtotalen herberekend: {count} rij(en).")
+        else:
+            differences = check_rollup(db.connection, db.timestamp_storage)
+            for project_id, day, expected, stored in differences[:20]:
+                print(f"  project {project_id}, {day}: verwacht {expected} µs, opgeslagen {stored} µs")
+            if differences:
+                print(f"{len(differences)} afwijking(en) gevonden; herstel met --rebuild.")
+                raise SystemExit(1)
+            print("Dagtotalen zijn consistent.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
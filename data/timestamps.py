@@ -0,0 +1,21 @@
+# data/timestamps.py
+
+from datetime import datetime, timedelta
+
+# Tijdstippen zijn naïeve lokale tijden (datetime.now()). Als epoch-getal slaan we
+# de "wandkloktijd" op alsof die UTC is: zo blijft het verschil tussen twee getallen
+# gelijk aan het verschil tussen de datetimes, en valt een dag samen met // 86400.
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+SECONDS_PER_DAY = 86400
+
+
+def to_epoch(moment: datetime) -> int:
+    """Zet een naïeve datetime om naar epoch-seconden (microseconden vallen weg)."""
+    return (moment - _EPOCH) // _ONE_SECOND
+
+
+def from_epoch(seconds: int) -> datetime:
+    """Zet epoch-seconden terug om naar een naïeve datetime."""
+    return _EPOCH + timedelta(seconds=seconds)
@@ -1,9 +1,25 @@
 
+import argparse
+import random
+import time
 from datetime import datetime, timedelta
+from typing import Tuple
+
+from config import DB_PATH, TIMESTAMP_STORAGE
 from data.database import Database
+from data.timestamps import to_epoch
 from models.project import Project
 from models.work_session import WorkSession
 
+# Fixed end of the generated history, so the same seed always yields the same data set.
+DEFAULT_HISTORY_END = datetime(2025, 1, 1)
+
+_ACTIVITIES = ["Research on", "Implemented", "Refactored", "Reviewed", "Tested", "Documented",
+               "Meeting about", "Debugged", "Designed", "Deployed"]
+_SUBJECTS = ["the API endpoints", "the database layer", "the front-end components", "the CSV export",
+             "machine learning models", "the billing run", "the project planning", "the test suite",
+             "performance issues", "the customer feedback"]
+
 def seed_database():
     """Populates the database with sample data for manual testing."""
     db = Database()
@@ -13,9 +29,7 @@ def seed_database():
     project2 = Project(name="Project Beta", description="Project Web Development.")
     project3 = Project(name="Project Gamma", description="Een gearchiveerd project.", archived=True)
 
-    db.add_project_to_db(project1)
-    db.add_project_to_db(project2)
-    db.add_project_to_db(project3)
+    db.add_projects_to_db([project1, project2, project3])
 
     # Create work sessions for Project Alpha
     session1_p1 = WorkSession(
@@ -30,8 +44,6 @@ def seed_database():
         end_time=datetime.now() - timedelta(days=1, hours=2),
         description="Implemented a neural network."
     )
-    db.add_work_session_to_db(session1_p1)
-    db.add_work_session_to_db(session2_p1)
 
     # Create work sessions for Project Beta
     session1_p2 = WorkSession(
@@ -46,12 +58,125 @@ def seed_database():
         start_time=datetime.now() - timedelta(minutes=30),
         description="Testing the API endpoints."
     )
-    db.add_work_session_to_db(session1_p2)
-    db.add_work_session_to_db(session2_p2)
+    db.add_work_sessions_to_db([session1_p1, session2_p1, session1_p2, session2_p2])
     
     print("Database seeded with sample data.")
     print("Projects created: 3")
     print("Work sessions created: 4")
 
+def generate_dataset(db: Database, projects: int = 100, sessions_per_project: int = 1000,
+                     years: float = 3.0, archived_ratio: float = 0.2, seed: int = 42,
+                     history_end: datetime = DEFAULT_HISTORY_END,
+                     active_session: bool = False) -> Tuple[int, int]:
+    """
+    Generates a reproducible synthetic history for load testing.
+
+    Sessions are spread evenly over `years` of history ending at `history_end` and never
+    overlap, just like sessions tracked one at a time. Timestamps are whole seconds.
+
+    :param db: Database to fill (usually empty).
+    :param projects: Number of projects.
+    :param sessions_per_project: Number of work sessions per project.
+    :param years: Length of the history in years.
+    :param archived_ratio: Fraction of the projects that is archived.
+    :param seed: Seed for the random generator; the same parameters give the same data.
+    :param history_end: End of the generated history.
+    :param active_session: Leave the most recent session open (active).
+    :return: Tuple (projects created, work sessions created).
+    """
+    rng = random.Random(seed)
+    # rng.random() is a lot cheaper than randrange()/choice() for millions of draws.
+    descriptions = [f"{activity} {subject}." for activity in _ACTIVITIES for subject in _SUBJECTS]
+
+    archived = set(rng.sample(range(projects), round(projects * archived_ratio)))
+    project_list = [
+        Project(name=f"Project {i + 1:05d}", description=f"Generated project {i + 1}.", archived=i in archived)
+        for i in range(projects)
+    ]
+
+    total_sessions = projects * sessions_per_project
+
+    history_end_epoch = to_epoch(history_end)
+    history_start_epoch = history_end_epoch - int(years * 365 * 86400)
+    slot = (history_end_epoch - history_start_epoch) / max(total_sessions, 1)
+
+    def session_rows(project_ids):
+        # Every project gets exactly sessions_per_project sessions, in random order over time.
+        # Owners are drawn while streaming from the projects that still have room (swap-remove
+        # when full), so memory is O(projects) instead of one entry per session.
+        remaining = [sessions_per_project] * projects
+        open_projects = list(range(projects))
+        random_ = rng.random  # bound once: this loop runs millions of times
+        slot_length = max(int(slot), 2)
+        description_count = len(descriptions)
+        last_index = total_sessions - 1
+        for index in range(total_sessions):
+            position = int(random_() * len(open_projects))
+            owner = open_projects[position]
+            remaining[owner] -= 1
+            if not remaining[owner]:
+                open_projects[position] = open_projects[-1]
+                open_projects.pop()
+            # Each session lives in its own time slot, which guarantees there is no overlap.
+            slot_start = history_start_epoch + int(index * slot)
+            start = slot_start + int(random_() * (slot_length // 4 + 1))
+            # Same draw as rng.uniform(0.3, 0.95), without the method call.
+            length = max(1, int((slot_start + slot_length - start) * (0.3 + (0.95 - 0.3) * random_())))
+            yield (
+                project_ids[owner],
+                start,
+                None if active_session and index == last_index else start + length,
+                descriptions[int(random_() * description_count)]
+            )
+
+    # bulk_load: FTS5, R*Tree and the daily totals are rebuilt once at the end instead of per row.
+    with db.bulk_load():
+        db.add_projects_to_db(project_list)
+        # Raw epoch rows straight into executemany: no WorkSession objects, memory stays flat.
+        db.add_work_session_rows(session_rows([p.proj_id for p in project_list]))
+
+    return projects, total_sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Seed the database with sample data, or generate a large synthetic data set (--generate)."
+    )
+    parser.add_argument("--generate", action="store_true", help="Generate a synthetic data set for load testing")
+    parser.add_argument("--db", default=DB_PATH, help=f"Database file (default: {DB_PATH})")
+    parser.add_argument("--storage", choices=("iso", "epoch"), default=TIMESTAMP_STORAGE,
+                        help="Timestamp storage format")
+    parser.add_argument("--projects", type=int, default=100, help="Number of projects")
+    parser.add_argument("--sessions-per-project", type=int, default=1000, help="Work sessions per project")
+    parser.add_argument("--years", type=float, default=3.0, help="Years of history")
+    parser.add_argument("--archived-ratio", type=float, default=0.2, help="Fraction of archived projects")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--active-session", action="store_true", help="Leave the most recent session open")
+    args = parser.parse_args()
+
+    if not args.generate:
+        seed_database()
+        return
+
+    db = Database(args.db, timestamp_storage=args.storage)
+    try:
+        started = time.perf_counter()
+        project_count, session_count = generate_dataset(
+            db,
+            projects=args.projects,
+            sessions_per_project=args.sessions_per_project,
+            years=args.years,
+            archived_ratio=args.archived_ratio,
+            seed=args.seed,
+            active_session=args.active_session,
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    print(f"Generated {project_count} projects and {session_count} work sessions in {elapsed:.1f}s "
+          f"({session_count / elapsed:,.0f} sessions/s).")
+
+
 if __name__ == "__main__":
-    seed_database()
+    main()
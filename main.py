@@ -4,15 +4,33 @@ import sys
 import os
 
 from config import DB_PATH
-from data.database import Database
-from ui.main_menu import MainMenu
 
 if __name__ == "__main__":
 
+    # --profile: instrumenteer de database en toon na afloop de traagste methodes.
+    profile = "--profile" in sys.argv[1:]
+    if profile:
+        sys.argv.remove("--profile")
+        # Enkel hier importeren: zonder --profile hoeft de instrumentatie niet geladen te worden.
+        from data import instrumentation
+        instrumentation.enable()
+
+    if len(sys.argv) > 1:
+        # Subcommando's (start, stop, status, report, export): één bewerking, JSON-uitvoer, geen menu.
+        from ui.cli import main as cli_main
+        exit_code = cli_main(sys.argv[1:])
+        if profile:
+            instrumentation.get_profiler().print_report(out=sys.stderr)  # stdout bevat enkel JSON
+        sys.exit(exit_code)
+
+    # Het menu en de cache pas hier importeren: subcommando's hebben ze niet nodig.
+    from data.cache import CachedDatabase
+    from data.database import Database
+
     try:
         # Controleer of de benodigde mappen bestaan, anders aanmaken
         os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
-        db = Database()
+        db = CachedDatabase(Database())
     except sqlite3.Error as e:
         print(f"Fout bij het initialiseren van de database: {e}")
         sys.exit(1)
@@ -20,6 +38,8 @@ if __name__ == "__main__":
         print("Fout: Geen toestemming om de database te maken of te openen.")
         sys.exit(1)
 
+    from ui.main_menu import MainMenu
+
     try:
         menu = MainMenu(db)
         menu.run()
@@ -27,4 +47,6 @@ if __name__ == "__main__":
         print("\nProgramma beëindigd door gebruiker.")
         sys.exit(0)
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+        if profile:
+            instrumentation.get_profiler().print_report()
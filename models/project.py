@@ -1,26 +1,37 @@
 # models/project.py
 
-from dataclasses import dataclass, field
 from typing import List, Optional
-from models.work_session import WorkSession
+from models.work_session import WorkSession, format_duration
 
 
-@dataclass
 class Project:
     """
     Representeert een project met naam, beschrijving, werksessies en archiefstatus.
     Wordt gebruikt in combinatie met SQLite en een command-line interface.
+    Net als WorkSession geen dataclass, om `dataclasses` (en `inspect`) niet bij het opstarten te laden.
     """
-    name: str
-    description: str = ""
-    proj_id: Optional[int] = None
-    archived: bool = False
-    work_sessions: List[WorkSession] = field(default_factory=list)
+    __slots__ = ("name", "description", "proj_id", "archived", "work_sessions")
 
-    def __post_init__(self):
-        """Zorgt dat work_sessions altijd een lege lijst is als None wordt meegegeven."""
-        if self.work_sessions is None:
-            self.work_sessions = []
+    def __init__(self, name: str, description: str = "", proj_id: Optional[int] = None,
+                 archived: bool = False, work_sessions: Optional[List[WorkSession]] = None):
+        self.name = name
+        self.description = description
+        self.proj_id = proj_id
+        self.archived = archived
+        # work_sessions is altijd een (eigen) lijst, ook als None wordt meegegeven.
+        self.work_sessions = [] if work_sessions is None else work_sessions
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.name, self.description, self.proj_id, self.archived, self.work_sessions)
+                == (other.name, other.description, other.proj_id, other.archived, other.work_sessions))
+
+    __hash__ = None  # veranderlijk, zoals een dataclass met eq=True
+
+    def copy(self, work_sessions: Optional[List[WorkSession]] = None) -> "Project":
+        """Een kopie van het project, met de opgegeven (standaard: geen) werksessies."""
+        return Project(self.name, self.description, self.proj_id, self.archived, work_sessions)
 
     @property
     def is_archived(self) -> bool:
@@ -28,22 +39,17 @@ class Project:
         return self.archived
 
     @property
-    def total_duration(self) -> str:
-        """Totale tijd van alle afgesloten sessies (als leesbare string)."""
-        total_seconds = sum(
+    def total_seconds(self) -> int:
+        """Totale tijd van alle afgesloten sessies in seconden."""
+        return int(sum(
             (s.duration.total_seconds() for s in self.work_sessions if not s.is_active),
             0
-        )
-        hours, remainder = divmod(int(total_seconds), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        parts = []
-        if hours:
-            parts.append(f"{hours}u")
-        if minutes:
-            parts.append(f"{minutes}m")
-        if seconds or not parts:
-            parts.append(f"{seconds}s")
-        return " ".join(parts) if parts else "0s"
+        ))
+
+    @property
+    def total_duration(self) -> str:
+        """Totale tijd van alle afgesloten sessies (als leesbare string)."""
+        return format_duration(self.total_seconds)
 
     @property
     def active_session(self) -> Optional[WorkSession]:
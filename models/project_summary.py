@@ -0,0 +1,32 @@
+# models/project_summary.py
+
+from datetime import datetime
+from typing import Optional
+from models.project import Project
+
+
+class ProjectSummary:
+    """
+    Een project samen met de kerncijfers van zijn werksessies.
+    Wordt in één gegroepeerde query opgebouwd, zonder de sessies zelf te laden.
+    """
+    __slots__ = ("project", "session_count", "total_seconds", "last_activity")
+
+    def __init__(self, project: Project, session_count: int = 0, total_seconds: int = 0,
+                 last_activity: Optional[datetime] = None):
+        self.project = project
+        self.session_count = session_count
+        self.total_seconds = total_seconds
+        self.last_activity = last_activity
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.project, self.session_count, self.total_seconds, self.last_activity)
+                == (other.project, other.session_count, other.total_seconds, other.last_activity))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"ProjectSummary(project={self.project!r}, session_count={self.session_count}, "
+                f"total_seconds={self.total_seconds}, last_activity={self.last_activity!r})")
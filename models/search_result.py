@@ -0,0 +1,33 @@
+# models/search_result.py
+
+from typing import Optional
+from models.project import Project
+from models.work_session import WorkSession
+
+
+class SearchResult:
+    """
+    Eén zoekresultaat uit de full-text index: een werksessie (met haar project)
+    of, als session None is, een project. `snippet` toont de gevonden woorden tussen
+    [haakjes]; een lagere `rank` (bm25) betekent een betere overeenkomst.
+    """
+    __slots__ = ("project", "session", "snippet", "rank")
+
+    def __init__(self, project: Project, session: Optional[WorkSession] = None, snippet: str = "",
+                 rank: float = 0.0):
+        self.project = project
+        self.session = session
+        self.snippet = snippet
+        self.rank = rank
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.project, self.session, self.snippet, self.rank)
+                == (other.project, other.session, other.snippet, other.rank))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"SearchResult(project={self.project!r}, session={self.session!r}, "
+                f"snippet={self.snippet!r}, rank={self.rank})")
@@ -0,0 +1,87 @@
+# models/session_array.py
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Union
+
+from data.timestamps import from_epoch
+from models.work_session import WorkSession
+
+# Eindtijd van een lopende sessie in de ends-array.
+OPEN_END = -2 ** 63
+
+
+class WorkSessionArray:
+    """
+    Compacte verzameling werksessies voor rapporten over grote aantallen sessies.
+    Id's, project-id's en start-/eindtijden (epoch-seconden, zie data/timestamps.py) staan
+    in getypeerde arrays van 8 bytes per waarde; beschrijvingen worden één keer bewaard en
+    per sessie met een index aangeduid. WorkSession-objecten worden pas aangemaakt bij
+    indexeren of itereren, en zijn losse kopieën: wijzigingen worden niet teruggeschreven.
+    """
+    __slots__ = ("ids", "project_ids", "starts", "ends", "description_ids", "_descriptions", "_description_index")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.project_ids = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.description_ids = array("i")
+        self._descriptions: List[str] = []
+        self._description_index: Dict[str, int] = {}
+
+    def append(self, session_id: int, project_id: int, start: int, end: Optional[int], description: str = ""):
+        """Voegt een sessie toe met start en einde in epoch-seconden (einde None = lopend)."""
+        self.ids.append(session_id)
+        self.project_ids.append(project_id)
+        self.starts.append(start)
+        self.ends.append(OPEN_END if end is None else end)
+        index = self._description_index.get(description)
+        if index is None:
+            index = self._description_index[description] = len(self._descriptions)
+            self._descriptions.append(description)
+        self.description_ids.append(index)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[WorkSession, List[WorkSession]]:
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("WorkSessionArray index buiten bereik")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[WorkSession]:
+        for index in range(len(self)):
+            yield self._view(index)
+
+    def _view(self, index: int) -> WorkSession:
+        end = self.ends[index]
+        return WorkSession(
+            project_id=self.project_ids[index],
+            start_time=from_epoch(self.starts[index]),
+            description=self._descriptions[self.description_ids[index]],
+            end_time=None if end == OPEN_END else from_epoch(end),
+            id=self.ids[index]
+        )
+
+    def is_active(self, index: int) -> bool:
+        """True als de sessie op `index` nog loopt."""
+        return self.ends[index] == OPEN_END
+
+    def total_seconds(self, project_id: Optional[int] = None) -> int:
+        """Totale duur van de afgesloten sessies (van één project), zonder WorkSession-objecten."""
+        if project_id is None:
+            return sum(end - start for start, end in zip(self.starts, self.ends) if end != OPEN_END)
+        return sum(
+            end - start
+            for pid, start, end in zip(self.project_ids, self.starts, self.ends)
+            if pid == project_id and end != OPEN_END
+        )
+
+    def nbytes(self) -> int:
+        """Geheugen van de arrays zelf (zonder de gedeelde beschrijvingen)."""
+        return sum(values.itemsize * len(values)
+                   for values in (self.ids, self.project_ids, self.starts, self.ends, self.description_ids))
@@ -1,21 +1,65 @@
 # models/work_session.py
 
-from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
 
-@dataclass
+def format_duration(total_seconds: int) -> str:
+    """
+    Zet een aantal seconden om naar een leesbare string.
+    Bijv: "2u 34m 12s" of "45m 8s" of "1u 5m"
+    """
+    hours, remainder = divmod(int(total_seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    parts = []
+    if hours:
+        parts.append(f"{hours}u")
+    if minutes:
+        parts.append(f"{minutes}m")
+    if seconds or not parts:  # toon seconden als enige of als 0
+        parts.append(f"{seconds}s")
+
+    return " ".join(parts)
+
+
+def duration_seconds(start_time: datetime, end_time: datetime) -> int:
+    """
+    Duur in hele seconden, afgekapt van de exacte duur (inclusief microseconden).
+    Alle exportformaten gebruiken deze berekening, zodat hun duur overeenkomt.
+    """
+    return int((end_time - start_time).total_seconds())
+
+
 class WorkSession:
     """
     Representeert een werksessie met start- en eindtijd, beschrijving en project-ID.
     Bevat methoden om de status en duur van de sessie te bepalen.
+
+    Een gewone klasse met __slots__ in plaats van een dataclass: `dataclasses` importeert
+    `inspect`, wat ~15 ms kost bij elke start van `main.py` (zie benchmarks/bench_startup.py).
     """
-    project_id: int
-    start_time: datetime
-    description: str = ""
-    end_time: Optional[datetime] = None
-    id: Optional[int] = None
+    __slots__ = ("project_id", "start_time", "description", "end_time", "id")
+
+    def __init__(self, project_id: int, start_time: datetime, description: str = "",
+                 end_time: Optional[datetime] = None, id: Optional[int] = None):
+        self.project_id = project_id
+        self.start_time = start_time
+        self.description = description
+        self.end_time = end_time
+        self.id = id
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.project_id, self.start_time, self.description, self.end_time, self.id)
+                == (other.project_id, other.start_time, other.description, other.end_time, other.id))
+
+    __hash__ = None  # veranderlijk, zoals een dataclass met eq=True
+
+    def copy(self) -> "WorkSession":
+        """Een losse kopie (de tijdstippen zelf zijn onveranderlijk)."""
+        return WorkSession(self.project_id, self.start_time, self.description, self.end_time, self.id)
 
     @property
     def is_active(self) -> bool:
@@ -33,19 +77,7 @@ class WorkSession:
         Geeft een leesbare string terug van de duur.
         Bijv: "2u 34m 12s" of "45m 8s" of "1u 5m"
         """
-        total_seconds = int(self.duration.total_seconds())
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        parts = []
-        if hours:
-            parts.append(f"{hours}u")
-        if minutes:
-            parts.append(f"{minutes}m")
-        if seconds or not parts:  # toon seconden als enige of als 0
-            parts.append(f"{seconds}s")
-
-        return " ".join(parts)
+        return format_duration(duration_seconds(self.start_time, self.end_time or datetime.now()))
 
     def end(self) -> None:
         """Stop de sessie door end_time in te stellen."""
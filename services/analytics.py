@@ -0,0 +1,206 @@
+# services/analytics.py
+
+import argparse
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data.database import Database
+from data.timestamps import SECONDS_PER_DAY, to_epoch
+from models.session_array import OPEN_END
+
+SECONDS_PER_HOUR = 3600
+_EPOCH_DAY = np.datetime64("1970-01-01", "D")
+# 1 januari 1970 was een donderdag (weekday() == 3).
+_EPOCH_WEEKDAY = 3
+
+# Standaardklassen voor het histogram van sessieduur, in seconden.
+DEFAULT_LENGTH_BINS = (0, 15 * 60, 30 * 60, 3600, 2 * 3600, 4 * 3600, 8 * 3600, np.iinfo(np.int64).max)
+
+
+@dataclass
+class SessionFrame:
+    """
+    Werksessies als NumPy-kolommen (epoch-seconden, zie data/timestamps.py).
+    Alle berekeningen in deze module werken op hele kolommen tegelijk.
+    """
+    ids: np.ndarray
+    project_ids: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self.ends - self.starts
+
+
+@dataclass
+class DailyTotals:
+    """Totale duur in seconden per (project, dag); sessies over middernacht worden gesplitst."""
+    project_ids: np.ndarray
+    days: np.ndarray  # datetime64[D]
+    seconds: np.ndarray
+
+    def to_dict(self) -> Dict[Tuple[int, date], int]:
+        return {
+            (int(project_id), day.item()): int(seconds)
+            for project_id, day, seconds in zip(self.project_ids, self.days, self.seconds)
+        }
+
+
+def load_sessions(db: Database, project_id: Optional[int] = None, include_active: bool = False,
+                  now: Optional[datetime] = None) -> SessionFrame:
+    """
+    Laadt de sessies in één keer via Database.get_work_session_array; de arrays worden
+    zonder kopie als NumPy-array gelezen.
+
+    :param include_active: Neem de lopende sessie mee, met `now` als eindtijd.
+    """
+    sessions = db.get_work_session_array(project_id)
+    ids, project_ids, starts, ends = (
+        np.frombuffer(values, dtype=np.int64)
+        for values in (sessions.ids, sessions.project_ids, sessions.starts, sessions.ends)
+    )
+
+    active = ends == OPEN_END
+    if include_active:
+        ends = np.where(active, to_epoch(now or datetime.now()), ends)
+        keep = ends >= starts
+    else:
+        # Ook hier geen sessies met een eindtijd vóór de starttijd: split_into_buckets zou voor
+        # zo'n sessie een negatief aantal stukken krijgen.
+        keep = ~active & (ends >= starts)
+    return SessionFrame(ids[keep], project_ids[keep], starts[keep], ends[keep])
+
+
+def split_into_buckets(starts: np.ndarray, ends: np.ndarray, bucket_seconds: int
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Splitst elk interval [start, end) in stukken per tijdvak van `bucket_seconds` (bv. dag of uur).
+
+    :return: (index van de sessie, nummer van het tijdvak sinds 1970, seconden in dat tijdvak)
+    """
+    first = starts // bucket_seconds
+    # Een sessie van 0 seconden telt als één (leeg) stuk in haar startvak.
+    last = np.maximum(ends - 1, starts) // bucket_seconds
+    counts = last - first + 1
+    session_index = np.repeat(np.arange(len(starts)), counts)
+    # Volgnummer van elk stuk binnen zijn sessie: 0, 1, 2, ...
+    offsets = np.arange(len(session_index)) - np.repeat(np.cumsum(counts) - counts, counts)
+    buckets = first[session_index] + offsets
+    piece_starts = np.maximum(starts[session_index], buckets * bucket_seconds)
+    piece_ends = np.minimum(ends[session_index], (buckets + 1) * bucket_seconds)
+    return session_index, buckets, piece_ends - piece_starts
+
+
+def daily_totals(frame: SessionFrame) -> DailyTotals:
+    """Totale duur per project en per kalenderdag."""
+    session_index, days, seconds = split_into_buckets(frame.starts, frame.ends, SECONDS_PER_DAY)
+    project_ids = frame.project_ids[session_index]
+    order = np.lexsort((days, project_ids))
+    project_ids, days, seconds = project_ids[order], days[order], seconds[order]
+    if not len(order):
+        return DailyTotals(project_ids, _EPOCH_DAY + days, seconds)
+    boundaries = np.flatnonzero((np.diff(project_ids) != 0) | (np.diff(days) != 0)) + 1
+    group_starts = np.concatenate(([0], boundaries))
+    return DailyTotals(
+        project_ids=project_ids[group_starts],
+        days=_EPOCH_DAY + days[group_starts],
+        seconds=np.add.reduceat(seconds, group_starts),
+    )
+
+
+def session_length_histogram(frame: SessionFrame, bins: Sequence[int] = DEFAULT_LENGTH_BINS
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Aantal sessies per duurklasse.
+
+    :return: (aantallen, klassegrenzen in seconden); klasse i is [grens i, grens i+1).
+             Sessies korter dan de eerste grens of vanaf de laatste grens tellen niet mee.
+    """
+    edges = np.asarray(bins, dtype=np.int64)
+    durations = frame.durations
+    # Onder de eerste grens zou searchsorted index -1 geven, wat bincount weigert.
+    durations = durations[durations >= edges[0]]
+    # searchsorted i.p.v. np.histogram: exacte gehele grenzen, ook voor de open laatste klasse.
+    counts = np.bincount(np.searchsorted(edges, durations, side="right") - 1, minlength=len(edges))
+    return counts[:len(edges) - 1], edges
+
+
+def hour_heatmap(frame: SessionFrame) -> np.ndarray:
+    """
+    Gewerkte seconden per weekdag (rij 0 = maandag) en uur van de dag (kolom 0-23).
+    Een sessie van 9:40 tot 11:10 telt 20 min in uur 9, 60 min in uur 10 en 10 min in uur 11.
+    """
+    _, hours, seconds = split_into_buckets(frame.starts, frame.ends, SECONDS_PER_HOUR)
+    weekdays = (hours // 24 + _EPOCH_WEEKDAY) % 7
+    cells = weekdays * 24 + hours % 24
+    return np.bincount(cells, weights=seconds, minlength=7 * 24).astype(np.int64).reshape(7, 24)
+
+
+def rolling_weekly_hours(frame: SessionFrame, window_days: int = 7,
+                         project_id: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Voortschrijdend totaal in uren over de laatste `window_days` dagen, voor elke dag
+    tussen de eerste en de laatste gewerkte dag (dagen zonder werk tellen mee als 0).
+
+    :return: (dagen als datetime64[D], uren)
+    """
+    if project_id is not None:
+        mask = frame.project_ids == project_id
+        frame = SessionFrame(frame.ids[mask], frame.project_ids[mask], frame.starts[mask], frame.ends[mask])
+    _, days, seconds = split_into_buckets(frame.starts, frame.ends, SECONDS_PER_DAY)
+    if not len(days):
+        return np.empty(0, dtype="datetime64[D]"), np.empty(0)
+    first_day = days.min()
+    per_day = np.bincount(days - first_day, weights=seconds)
+    cumulative = np.concatenate(([0.0], np.cumsum(per_day)))
+    window = cumulative[1:] - cumulative[np.maximum(np.arange(1, len(cumulative)) - window_days, 0)]
+    return _EPOCH_DAY + first_day + np.arange(len(per_day)), window / SECONDS_PER_HOUR
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tijdsanalyse over alle werksessies (NumPy).")
+    parser.add_argument("--project", type=int, help="Beperk tot één project-ID")
+    parser.add_argument("--include-active", action="store_true", help="Neem de lopende sessie mee tot nu")
+    args = parser.parse_args()
+
+    db = Database()
+    try:
+        started = time.perf_counter()
+        frame = load_sessions(db, args.project, args.include_active)
+        loaded = time.perf_counter()
+        totals = daily_totals(frame)
+        counts, edges = session_length_histogram(frame)
+        heatmap = hour_heatmap(frame)
+        days, hours = rolling_weekly_hours(frame)
+        finished = time.perf_counter()
+    finally:
+        db.close()
+
+    print(f"{len(frame)} sessie(s) geladen in {loaded - started:.3f}s, geanalyseerd in {finished - loaded:.3f}s")
+    print(f"{len(totals.seconds)} (project, dag)-totalen")
+
+    print("\nSessieduur:")
+    for count, low, high in zip(counts, edges[:-1], edges[1:]):
+        label = f"≥ {timedelta(seconds=int(low))}" if high == edges[-1] else \
+            f"{timedelta(seconds=int(low))} – {timedelta(seconds=int(high))}"
+        print(f"  {label:<22} {count}")
+
+    print("\nUren per weekdag en uur:")
+    print("     " + "".join(f"{hour:>4}" for hour in range(24)))
+    for name, row in zip(("ma", "di", "wo", "do", "vr", "za", "zo"), heatmap):
+        print(f"  {name} " + "".join(f"{seconds / SECONDS_PER_HOUR:>4.0f}" for seconds in row))
+
+    if len(days):
+        print(f"\nUren in de laatste 7 dagen op {days[-1]}: {hours[-1]:.1f} (max {hours.max():.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# services/bulk_export.py
+
+import argparse
+import csv
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from config import EXPORT_PATH
+from data.database import Database
+from models.project import Project
+from services.csv_export import FIELDNAMES, write_project_csv
+from services.exporters import EXPORTERS, get_exporter
+
+# Callback voor voortgang: (aantal klaar, totaal, project, aantal rijen van dat project).
+ProgressCallback = Callable[[int, int, Project, int], None]
+
+
+@dataclass
+class BulkExportResult:
+    """Resultaat van een export van meerdere projecten."""
+    files: List[str] = field(default_factory=list)
+    projects: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Doorvoer over de hele export."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _export_project(db_path: str, timestamp_storage: str, project: Project,
+                    file_path: str, format_name: Optional[str]) -> Tuple[str, int]:
+    """
+    Worker: exporteert de sessies van één project naar `file_path`.
+    Zonder formaat wordt een CSV-deelbestand zonder kopregel geschreven (gecombineerde export).
+    Elke taak opent en sluit haar eigen leesverbinding (~0,5 ms): een verbinding per thread
+    of proces zou na afloop van de pool open blijven.
+    """
+    db = Database(db_path, timestamp_storage=timestamp_storage)
+    try:
+        if format_name is None:
+            with open(file_path, "w", newline="") as csvfile:
+                rows = write_project_csv(db, project, csvfile, header=False)
+        else:
+            rows = get_exporter(format_name).export(db, project, file_path)
+    finally:
+        db.close()
+    return file_path, rows
+
+
+def _print_progress(done: int, total: int, project: Project, rows: int):
+    print(f"  [{done}/{total}] {project.name} – {rows} sessie(s)")
+
+
+def export_all_projects(db: Database, export_path: str = EXPORT_PATH, workers: int = 4,
+                        executor: str = "thread", combined: bool = False, format_name: str = "csv",
+                        progress: Optional[ProgressCallback] = _print_progress) -> BulkExportResult:
+    """
+    Exporteert alle projecten, ook de gearchiveerde, parallel naar CSV.
+
+    :param db: De database; workers openen elk een eigen verbinding naar hetzelfde bestand.
+    :param export_path: De map voor de exportbestanden.
+    :param workers: Aantal threads of processen.
+    :param executor: "thread" of "process". Processen schalen beter omdat het formatteren
+                     van de CSV-rijen in Python gebeurt (GIL).
+    :param combined: Schrijf één gecombineerd bestand in plaats van één bestand per project.
+    :param format_name: Exportformaat uit services.exporters; gecombineerd kan enkel met "csv".
+    :param progress: Callback die na elk afgewerkt project wordt aangeroepen (None = stil).
+    :return: BulkExportResult met bestanden, aantal rijen en doorvoer.
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Onbekende executor '{executor}', kies 'thread' of 'process'.")
+    exporter = get_exporter(format_name)
+    if combined and exporter.name != "csv":
+        raise ValueError("Een gecombineerde export kan enkel als CSV.")
+    # Vóór er iets geschreven wordt: een ontbrekend optioneel pakket laat geen halve export achter.
+    exporter.check_available()
+
+    projects = db.get_all_projects_including_archived()
+    os.makedirs(export_path, exist_ok=True)
+    result = BulkExportResult(projects=len(projects))
+    pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    started = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(dir=export_path) as parts_dir, pool_class(max_workers=workers) as pool:
+        futures = {}
+        for project in projects:
+            if combined:
+                # Deelbestanden zonder kopregel, achteraf in projectvolgorde samengevoegd.
+                file_path = os.path.join(parts_dir, f"project_{project.proj_id}.part")
+            else:
+                file_path = os.path.join(export_path, f"project_{project.proj_id}_export_{timestamp}.{exporter.extension}")
+            future = pool.submit(_export_project, db.db_path, db.timestamp_storage,
+                                 project, file_path, None if combined else exporter.name)
+            futures[future] = project
+
+        outputs = {}
+        for done, future in enumerate(as_completed(futures), start=1):
+            project = futures[future]
+            path, rows = future.result()
+            outputs[project.proj_id] = path
+            result.rows += rows
+            if progress:
+                progress(done, len(projects), project, rows)
+
+        if combined:
+            combined_path = os.path.join(export_path, f"all_projects_export_{timestamp}.csv")
+            _concatenate_parts(combined_path, [outputs[p.proj_id] for p in projects])
+            result.files = [combined_path]
+        else:
+            result.files = [outputs[p.proj_id] for p in projects]
+
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _concatenate_parts(combined_path: str, part_paths: List[str]):
+    """Voegt de deelbestanden in projectvolgorde samen onder één kopregel."""
+    with open(combined_path, "w", newline="") as combined_file:
+        csv.writer(combined_file).writerow(FIELDNAMES)
+        for part_path in part_paths:
+            with open(part_path, newline="") as part_file:
+                shutil.copyfileobj(part_file, combined_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporteer alle projecten (ook gearchiveerde) parallel.")
+    parser.add_argument("--export-path", default=EXPORT_PATH, help=f"Doelmap (default: {EXPORT_PATH})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Aantal workers")
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread", help="Soort worker-pool")
+    parser.add_argument("--combined", action="store_true", help="Eén gecombineerd bestand i.p.v. één per project")
+    parser.add_argument("--format", choices=tuple(EXPORTERS), default="csv", help="Exportformaat")
+    args = parser.parse_args()
+
+    db = Database()
+    try:
+        result = export_all_projects(db, args.export_path, args.workers, args.executor, args.combined,
+                                     args.format)
+    finally:
+        db.close()
+    print(f"{result.projects} project(en), {result.rows} sessie(s) geëxporteerd in {result.seconds:.2f}s "
+          f"({result.rows_per_second:,.0f} rijen/s) naar {len(result.files)} bestand(en).")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,53 +3,106 @@
 import csv
 import os
 from datetime import datetime
+from typing import IO, List, Optional
 
 from config import EXPORT_PATH
+from data.database import Database
 from models.project import Project
+from models.work_session import duration_seconds, format_duration
 
-def export_project_to_csv(project: Project) -> str:
+# Kolommen voor de CSV
+FIELDNAMES = [
+    "Project ID",
+    "Projectnaam",
+    "Starttijd",
+    "Eindtijd",
+    "Duur",
+    "Beschrijving"
+]
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _export_file_path(project: Project, export_path: str, extension: str = "csv") -> str:
+    """Genereert het pad van het exportbestand op basis van project ID, huidige datum/tijd en extensie."""
+    # Zorg dat de export directory bestaat.
+    os.makedirs(export_path, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    file_name = f"project_{project.proj_id}_export_{timestamp}.{extension}"
+    return os.path.join(export_path, file_name)
+
+
+def _csv_row(project: Project, start_time: datetime, end_time: Optional[datetime], description: str) -> List:
+    """Formatteert één werksessie als CSV-rij (in de volgorde van FIELDNAMES)."""
+    return [
+        project.proj_id,
+        project.name,
+        start_time.strftime(_TIME_FORMAT),
+        end_time.strftime(_TIME_FORMAT) if end_time else "",
+        format_duration(duration_seconds(start_time, end_time)) if end_time else "Lopend",
+        description
+    ]
+
+
+def export_project_to_csv(project: Project, export_path: str = EXPORT_PATH) -> str:
     """
     Exporteert alle werksessies van een project naar een CSV-bestand.
-    Locatie van het bestand wordt bepaald door EXPORT_PATH in config.py.
+    Locatie van het bestand wordt standaard bepaald door EXPORT_PATH in config.py.
 
     :param project: Het Project-object waarvan de sessies geëxporteerd moeten worden.
+    :param export_path: De map waarin het bestand wordt aangemaakt.
     :return: Het pad naar het geëxporteerde CSV-bestand.
     """
-    # Zorg dat de export directory bestaat.
-    os.makedirs(EXPORT_PATH, exist_ok=True)
-
-    # Genereer bestandsnaam op basis van project ID en huidige datum/tijd.
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    file_name = f"project_{project.proj_id}_export_{timestamp}.csv"
-    file_path = os.path.join(EXPORT_PATH, file_name)
-
-    # Kolommen voor de CSV
-    fieldnames = [
-        "Project ID",
-        "Projectnaam",
-        "Starttijd",
-        "Eindtijd",
-        "Duur",
-        "Beschrijving"
-    ]
+    file_path = _export_file_path(project, export_path)
 
     # Schrijf de data naar het CSV-bestand.
     try:
         with open(file_path, "w", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(csvfile)
+            writer.writerow(FIELDNAMES)
 
             for session in project.work_sessions:
-                writer.writerow({
-                    "Project ID": project.proj_id,
-                    "Projectnaam": project.name,
-                    "Starttijd": session.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "Eindtijd": session.end_time.strftime("%Y-%m-%d %H:%M:%S") if session.end_time else "",
-                    "Duur": session.duration_str() if not session.is_active else "Lopend",
-                    "Beschrijving": session.description
-                })
+                writer.writerow(_csv_row(project, session.start_time, session.end_time, session.description))
             print(f"Project '{project.name}' succesvol geëxporteerd naar {file_path}")
             return file_path
 
     except Exception as e:
         raise RuntimeError(f"Fout bij exporteren naar CSV: {e}")
+
+
+def write_project_csv(db: Database, project: Project, csvfile: IO[str], header: bool = True) -> int:
+    """
+    Schrijft de werksessies van een project rechtstreeks vanuit een databasecursor naar `csvfile`.
+    Er wordt telkens maar één chunk rijen in het geheugen gehouden.
+
+    :param header: Schrijf de kolomnamen als eerste rij.
+    :return: Het aantal geschreven sessies.
+    """
+    writer = csv.writer(csvfile)
+    if header:
+        writer.writerow(FIELDNAMES)
+    count = 0
+    for _, start_time, end_time, description in db.iter_work_session_rows(project.proj_id):
+        writer.writerow(_csv_row(project, start_time, end_time, description))
+        count += 1
+    return count
+
+
+def stream_project_to_csv(db: Database, project: Project, export_path: str = EXPORT_PATH) -> str:
+    """
+    Exporteert alle werksessies van een project naar CSV zonder ze eerst als
+    Project.work_sessions te laden. De uitvoer is identiek aan export_project_to_csv.
+
+    :param db: De database waaruit de sessies gelezen worden.
+    :param project: Het project dat geëxporteerd wordt.
+    :param export_path: De map waarin het bestand wordt aangemaakt.
+    :return: Het pad naar het geëxporteerde CSV-bestand.
+    """
+    file_path = _export_file_path(project, export_path)
+    try:
+        with open(file_path, "w", newline="") as csvfile:
+            write_project_csv(db, project, csvfile)
+        print(f"Project '{project.name}' succesvol geëxporteerd naar {file_path}")
+        return file_path
+    except Exception as e:
+        raise RuntimeError(f"Fout bij exporteren naar CSV: {e}")
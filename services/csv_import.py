@@ -0,0 +1,316 @@
+# services/csv_import.py
+
+import argparse
+import csv
+import heapq
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from data.database import Database
+from data.timestamps import to_epoch
+from models.project import Project
+from services.csv_export import FIELDNAMES
+
+# Kolommen die een import nodig heeft; "Project ID" en "Duur" worden genegeerd (het project
+# wordt op naam gezocht, de duur volgt uit start en einde). Extra kolommen, zoals "Sessie ID"
+# in een incrementele export, mogen.
+_REQUIRED_COLUMNS = ("Projectnaam", "Starttijd", "Eindtijd", "Beschrijving")
+
+# Maximaal aantal foutmeldingen dat bewaard wordt; geteld worden ze allemaal.
+_MAX_MESSAGES = 100
+
+# Tijdelijke tabel (enkel zichtbaar voor deze verbinding) met de gevalideerde rijen.
+# SQLite sorteert ze voor de overlapcontrole, zodat het bestand nooit in het geheugen staat.
+_STAGING_TABLE = "temp.import_staging"
+
+# Bron van een interval in de sweep: bestaande sessies eerst bij gelijke starttijd.
+_EXISTING, _IMPORTED = 0, 1
+
+
+@dataclass
+class ImportResult:
+    """Resultaat van een CSV-import."""
+    rows: int = 0
+    imported: int = 0
+    invalid: int = 0
+    overlapping: int = 0
+    projects_created: int = 0
+    seconds: float = 0.0
+    messages: List[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Doorvoer over de hele import (gelezen rijen)."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def report(self, message: str):
+        if len(self.messages) < _MAX_MESSAGES:
+            self.messages.append(message)
+
+
+def _parse_time(text: str) -> datetime:
+    # fromisoformat leest "2024-01-31 09:15:00" (het exportformaat) en is veel sneller dan strptime.
+    return datetime.fromisoformat(text)
+
+
+def _create_staging_table(connection: sqlite3.Connection):
+    connection.execute(f"DROP TABLE IF EXISTS {_STAGING_TABLE}")
+    connection.execute(f"""
+        CREATE TABLE {_STAGING_TABLE} (
+            line INTEGER PRIMARY KEY,
+            project_id INTEGER NOT NULL,
+            start_s INTEGER NOT NULL,
+            end_s INTEGER NOT NULL,
+            description TEXT NOT NULL,
+            rejected INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+
+def _stage_rows(db: Database, file_path: str, result: ImportResult, create_projects: bool,
+                dry_run: bool, batch_size: int):
+    """Leest en valideert het bestand rij per rij en schrijft de geldige rijen per batch weg."""
+    projects: Dict[str, int] = {p.name: p.proj_id for p in db.get_all_projects_including_archived()}
+    connection = db.connection
+    insert_sql = f"INSERT INTO {_STAGING_TABLE} (line, project_id, start_s, end_s, description) VALUES (?, ?, ?, ?, ?)"
+
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"{file_path} is leeg.")
+        missing = [column for column in _REQUIRED_COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"Ontbrekende kolom(men) {', '.join(missing)}; verwacht: {', '.join(FIELDNAMES)}.")
+        name_col, start_col, end_col, desc_col = (header.index(column) for column in _REQUIRED_COLUMNS)
+        width = max(name_col, start_col, end_col, desc_col) + 1
+
+        batch: List[Tuple[int, int, int, int, str]] = []
+        for line, row in enumerate(reader, start=2):
+            result.rows += 1
+            if len(row) < width:
+                result.invalid += 1
+                result.report(f"Regel {line}: te weinig kolommen.")
+                continue
+            name = row[name_col].strip()
+            try:
+                start = _parse_time(row[start_col])
+                end = _parse_time(row[end_col]) if row[end_col] else None
+            except ValueError:
+                result.invalid += 1
+                result.report(f"Regel {line}: ongeldig tijdstip '{row[start_col]}' / '{row[end_col]}'.")
+                continue
+            if not name:
+                problem = "geen projectnaam"
+            elif start.tzinfo is not None or (end is not None and end.tzinfo is not None):
+                problem = "tijdstip met tijdzone (bv. +02:00) wordt niet ondersteund, gebruik lokale tijd"
+            elif end is None:
+                problem = "lopende sessie (geen eindtijd) wordt niet geïmporteerd"
+            elif end < start:
+                problem = "eindtijd ligt vóór de starttijd"
+            else:
+                problem = None
+            if problem:
+                result.invalid += 1
+                result.report(f"Regel {line}: {problem}.")
+                continue
+
+            project_id = projects.get(name)
+            if project_id is None:
+                if not create_projects:
+                    result.invalid += 1
+                    result.report(f"Regel {line}: onbekend project '{name}'.")
+                    continue
+                if dry_run:
+                    project_id = -(len(projects) + 1)  # voorlopig id, er wordt niets aangemaakt
+                else:
+                    project = Project(name=name)
+                    db.add_project_to_db(project)
+                    project_id = project.proj_id
+                projects[name] = project_id
+                result.projects_created += 1
+
+            batch.append((line, project_id, to_epoch(start), to_epoch(end), row[desc_col]))
+            if len(batch) >= batch_size:
+                connection.executemany(insert_sql, batch)
+                batch.clear()
+        if batch:
+            connection.executemany(insert_sql, batch)
+    connection.execute("CREATE INDEX temp.idx_import_staging_start ON import_staging (start_s, line)")
+    connection.commit()
+
+
+def _iter_staged(connection: sqlite3.Connection, chunk_size: int) -> Iterator[Tuple[int, int, int, int]]:
+    """Nog niet afgekeurde rijen als (start, bron, einde, regelnummer), oplopend op starttijd."""
+    cursor = connection.cursor()
+    cursor.row_factory = None
+    cursor.execute(f"""SELECT start_s, {_IMPORTED}, end_s, line FROM {_STAGING_TABLE}
+                       WHERE NOT rejected ORDER BY start_s, line""")
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _sweep_existing(db: Database, result: ImportResult, chunk_size: int):
+    """
+    Eerste sweep: keurt elke geïmporteerde rij af die overlapt met een bestaande sessie.
+    Van de bestaande sessies wordt enkel de verste eindtijd bijgehouden; van de geïmporteerde
+    rijen enkel die nog lopen (een heap op eindtijd), want een bestaande sessie die binnen zo'n
+    rij start, raakt ze allemaal.
+    """
+    connection = db.connection
+    bounds = connection.execute(f"SELECT MIN(start_s), MAX(end_s) FROM {_STAGING_TABLE}").fetchone()
+    if bounds[0] is None:
+        return
+    existing = (
+        (start, _EXISTING, float("inf") if end is None else end, session_id)
+        for session_id, start, end in db.iter_work_session_intervals(bounds[0], bounds[1], chunk_size)
+    )
+
+    rejected: List[Tuple[int]] = []
+    existing_reach: Optional[Tuple[float, int]] = None  # (einde, sessie-id)
+    open_rows: List[Tuple[int, int]] = []  # (einde, regelnummer) van de lopende geïmporteerde rijen
+    for start, source, end, key in heapq.merge(existing, _iter_staged(connection, chunk_size)):
+        if source == _IMPORTED:
+            if existing_reach is not None and start < existing_reach[0]:
+                rejected.append((key,))
+                result.report(f"Regel {key}: overlapt met sessie {existing_reach[1]}.")
+            else:
+                heapq.heappush(open_rows, (end, key))
+        else:
+            while open_rows and open_rows[0][0] <= start:
+                heapq.heappop(open_rows)
+            for _, line in open_rows:
+                rejected.append((line,))
+                result.report(f"Regel {line}: overlapt met sessie {key}.")
+            open_rows.clear()
+            if existing_reach is None or end > existing_reach[0]:
+                existing_reach = (end, key)
+        if len(rejected) >= chunk_size:
+            _mark_rejected(connection, rejected)
+    _mark_rejected(connection, rejected)
+
+
+def _sweep_imported(connection: sqlite3.Connection, result: ImportResult, chunk_size: int):
+    """
+    Tweede sweep, over de rijen die de eerste overleefden: een rij die overlapt met een
+    eerdere geïmporteerde rij wordt afgekeurd. Enkel de rij die het verst reikt, staat in het geheugen.
+    """
+    rejected: List[Tuple[int]] = []
+    reach: Optional[Tuple[int, int]] = None  # (einde, regelnummer)
+    for start, _, end, line in _iter_staged(connection, chunk_size):
+        if reach is not None and start < reach[0]:
+            rejected.append((line,))
+            result.report(f"Regel {line}: overlapt met regel {reach[1]}.")
+            if len(rejected) >= chunk_size:
+                _mark_rejected(connection, rejected)
+            continue
+        if reach is None or end > reach[0]:
+            reach = (end, line)
+    _mark_rejected(connection, rejected)
+
+
+def _sweep_overlaps(db: Database, result: ImportResult, chunk_size: int) -> int:
+    """
+    Sort-and-sweep over de gesorteerde geïmporteerde en bestaande sessies, in twee stappen.
+    Eerst worden de rijen afgekeurd die overlappen met een bestaande sessie: die afkeuring
+    is definitief. Pas daarna worden de overige rijen onderling vergeleken, zodat een rij die
+    zelf afgekeurd wordt geen latere, geldige rijen meer kan wegdrukken.
+
+    :return: Aantal afgekeurde rijen.
+    """
+    connection = db.connection
+    _sweep_existing(db, result, chunk_size)
+    _sweep_imported(connection, result, chunk_size)
+    connection.commit()
+    return connection.execute(f"SELECT COUNT(*) FROM {_STAGING_TABLE} WHERE rejected").fetchone()[0]
+
+
+def _mark_rejected(connection: sqlite3.Connection, lines: List[Tuple[int]]):
+    connection.executemany(f"UPDATE {_STAGING_TABLE} SET rejected = 1 WHERE line = ?", lines)
+    lines.clear()
+
+
+def _insert_accepted(db: Database, batch_size: int) -> int:
+    """Voegt de goedgekeurde rijen in volgorde van starttijd toe, één transactie per batch."""
+    cursor = db.connection.cursor()
+    cursor.row_factory = None
+    position = (-1, -1)
+    imported = 0
+    while True:
+        # Keyset-paginering: elke batch is een korte query, ook terwijl er gecommit wordt.
+        rows = cursor.execute(
+            f"""SELECT start_s, line, project_id, end_s, description FROM {_STAGING_TABLE}
+                WHERE (start_s, line) > (?, ?) AND NOT rejected
+                ORDER BY start_s, line
+                LIMIT ?""",
+            (*position, batch_size)
+        ).fetchall()
+        if not rows:
+            return imported
+        imported += db.add_work_session_rows((row[2], row[0], row[3], row[4]) for row in rows)
+        position = (rows[-1][0], rows[-1][1])
+
+
+def import_sessions_from_csv(db: Database, file_path: str, create_projects: bool = True,
+                             dry_run: bool = False, batch_size: int = 50000) -> ImportResult:
+    """
+    Importeert werksessies uit een CSV-bestand in het formaat van export_project_to_csv.
+
+    Verloop: (1) het bestand wordt als stroom gelezen en gevalideerd, geldige rijen gaan per
+    batch naar een tijdelijke tabel; (2) een sort-and-sweep over die rijen en de bestaande
+    sessies keurt eerst de rijen af die met een bestaande sessie overlappen, en daarna de rijen
+    die met een eerdere geïmporteerde rij overlappen; (3) de overige rijen worden per `batch_size` in één
+    transactie toegevoegd, via add_work_session_rows zodat de dagtotalen mee bijgewerkt worden.
+    Het geheugengebruik hangt niet af van de grootte van het bestand.
+
+    :param create_projects: Maak projecten aan die nog niet bestaan (anders: rij afgekeurd).
+    :param dry_run: Enkel valideren en overlappen zoeken, niets wegschrijven.
+    :return: ImportResult met tellers, de eerste foutmeldingen en de doorvoer.
+    """
+    result = ImportResult()
+    started = time.perf_counter()
+    connection = db.connection
+    _create_staging_table(connection)
+    try:
+        _stage_rows(db, file_path, result, create_projects, dry_run, batch_size)
+        result.overlapping = _sweep_overlaps(db, result, batch_size)
+        if not dry_run:
+            result.imported = _insert_accepted(db, batch_size)
+    finally:
+        connection.execute(f"DROP TABLE IF EXISTS {_STAGING_TABLE}")
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importeer werksessies uit een CSV-export.")
+    parser.add_argument("file", help="CSV-bestand met de kolommen van de CSV-export")
+    parser.add_argument("--no-create-projects", action="store_true",
+                        help="Keur rijen van onbekende projecten af i.p.v. het project aan te maken")
+    parser.add_argument("--dry-run", action="store_true", help="Enkel controleren, niets importeren")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Rijen per transactie")
+    parser.add_argument("--db", help="Pad naar de database (default: DB_PATH uit de configuratie)")
+    args = parser.parse_args()
+
+    db = Database(args.db) if args.db else Database()
+    try:
+        result = import_sessions_from_csv(db, args.file, not args.no_create_projects, args.dry_run,
+                                          args.batch_size)
+    finally:
+        db.close()
+
+    for message in result.messages[:20]:
+        print(f"  {message}")
+    print(f"{result.rows} rij(en) gelezen in {result.seconds:.2f}s ({result.rows_per_second:,.0f} rijen/s): "
+          f"{result.imported} geïmporteerd, {result.invalid} ongeldig, {result.overlapping} overlappend, "
+          f"{result.projects_created} nieuw(e) project(en){' (proefrun)' if args.dry_run else ''}.")
+
+
+if __name__ == "__main__":
+    main()
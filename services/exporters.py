@@ -0,0 +1,280 @@
+# services/exporters.py
+
+import gzip
+import io
+import json
+import struct
+import sys
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from typing import IO, Dict, Iterator, List, Tuple
+
+from config import EXPORT_PATH
+from data.database import Database
+from data.timestamps import to_epoch
+from models.project import Project
+from models.work_session import duration_seconds
+from services.csv_export import _export_file_path, write_project_csv
+
+# === INTERFACE ===
+
+class Exporter(ABC):
+    """
+    Basisklasse voor een exportformaat. Een exporter schrijft de werksessies van één
+    project naar een bestand en streamt daarbij rechtstreeks uit de database.
+    Een subklasse zonder export() kan niet geïnstantieerd (en dus niet geregistreerd) worden.
+    """
+    name = ""
+    extension = ""
+
+    @abstractmethod
+    def export(self, db: Database, project: Project, file_path: str) -> int:
+        """Schrijft het project naar `file_path` en retourneert het aantal sessies."""
+
+    def check_available(self):
+        """Controleert vooraf of het formaat bruikbaar is; RuntimeError als er een optioneel pakket ontbreekt."""
+
+
+class CsvExporter(Exporter):
+    """Ongecomprimeerde CSV, identiek aan services.csv_export."""
+    name = "csv"
+    extension = "csv"
+
+    def export(self, db: Database, project: Project, file_path: str) -> int:
+        with open(file_path, "w", newline="") as csvfile:
+            return write_project_csv(db, project, csvfile)
+
+
+class GzipCsvExporter(Exporter):
+    """CSV gecomprimeerd met gzip (standaardbibliotheek)."""
+    name = "csv.gz"
+    extension = "csv.gz"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def export(self, db: Database, project: Project, file_path: str) -> int:
+        with gzip.open(file_path, "wt", compresslevel=self.level, encoding="utf-8", newline="") as csvfile:
+            return write_project_csv(db, project, csvfile)
+
+
+class ZstdCsvExporter(Exporter):
+    """CSV gecomprimeerd met zstd. Vereist het optionele pakket 'zstandard'."""
+    name = "csv.zst"
+    extension = "csv.zst"
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    def check_available(self):
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            raise RuntimeError("Voor zstd-export is het pakket 'zstandard' nodig (pip install zstandard).")
+
+    def export(self, db: Database, project: Project, file_path: str) -> int:
+        self.check_available()
+        import zstandard
+
+        with open(file_path, "wb") as raw:
+            with zstandard.ZstdCompressor(level=self.level).stream_writer(raw) as compressed:
+                with io.TextIOWrapper(compressed, encoding="utf-8", newline="") as csvfile:
+                    return write_project_csv(db, project, csvfile)
+
+
+# === KOLOMMAIR FORMAAT ===
+#
+# Bestand:  MAGIC | uint32 lengte | JSON-header | blok*
+# Blok:     b"BLK1" | uint32 rijen | uint32 kolommen | per kolom: uint32 lengte + zlib(bytes)
+# Kolommen: id, project_id, start, end, duration (int64, little-endian),
+#           description_index (int32) en description_values
+#           (uint32 aantal | uint32 lengtes | UTF-8-bytes).
+# Tijdstippen zijn epoch-seconden (zie data/timestamps.py); een lopende sessie heeft
+# end en duration gelijk aan NULL_VALUE. Beschrijvingen zijn per blok woordenboek-gecodeerd.
+
+COLUMNAR_MAGIC = b"PTCOL\x00\x01\x00"
+NULL_VALUE = -2 ** 63
+_BLOCK_MAGIC = b"BLK1"
+_INT_COLUMNS = ("id", "project_id", "start", "end", "duration")
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class ColumnarExporter(Exporter):
+    """Compact binair kolomformaat met epoch-tijdstippen en gehele duur in seconden."""
+    name = "columnar"
+    extension = "ptcol"
+
+    def __init__(self, block_size: int = 65536, level: int = 1):
+        self.block_size = block_size
+        self.level = level
+
+    def export(self, db: Database, project: Project, file_path: str) -> int:
+        header = json.dumps({
+            "version": 1,
+            "project_id": project.proj_id,
+            "project_name": project.name,
+            "columns": list(_INT_COLUMNS) + ["description"],
+            "null_value": NULL_VALUE,
+        }).encode("utf-8")
+
+        count = 0
+        with open(file_path, "wb") as f:
+            f.write(COLUMNAR_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+
+            columns = self._empty_columns()
+            descriptions: Dict[str, int] = {}
+            for session_id, start_time, end_time, description in db.iter_work_session_rows(project.proj_id):
+                start = to_epoch(start_time)
+                end = to_epoch(end_time) if end_time else NULL_VALUE
+                columns["id"].append(session_id)
+                columns["project_id"].append(project.proj_id)
+                columns["start"].append(start)
+                columns["end"].append(end)
+                # Zelfde duur als de kolom "Duur" van de CSV-export, niet het verschil van de afgekapte tijdstippen.
+                columns["duration"].append(duration_seconds(start_time, end_time) if end_time else NULL_VALUE)
+                columns["description_index"].append(descriptions.setdefault(description, len(descriptions)))
+                count += 1
+                if len(columns["id"]) >= self.block_size:
+                    self._write_block(f, columns, descriptions)
+                    columns = self._empty_columns()
+                    descriptions = {}
+            if columns["id"]:
+                self._write_block(f, columns, descriptions)
+        return count
+
+    @staticmethod
+    def _empty_columns() -> Dict[str, array]:
+        columns = {name: array("q") for name in _INT_COLUMNS}
+        columns["description_index"] = array("i")
+        return columns
+
+    def _write_block(self, f: IO[bytes], columns: Dict[str, array], descriptions: Dict[str, int]):
+        encoded = [text.encode("utf-8") for text in descriptions]  # dict behoudt de volgorde van de index
+        payloads = [_to_little_endian(columns[name]) for name in _INT_COLUMNS]
+        payloads.append(_to_little_endian(columns["description_index"]))
+        payloads.append(struct.pack("<I", len(encoded))
+                        + _to_little_endian(array("I", (len(e) for e in encoded))) + b"".join(encoded))
+
+        f.write(_BLOCK_MAGIC)
+        f.write(struct.pack("<II", len(columns["id"]), len(payloads)))
+        for payload in payloads:
+            compressed = zlib.compress(payload, self.level)
+            f.write(struct.pack("<I", len(compressed)))
+            f.write(compressed)
+
+
+def iter_columnar_blocks(file_path: str) -> Iterator[Dict[str, object]]:
+    """
+    Leest een kolommair exportbestand blok per blok.
+    Elk blok is een dict met int64-arrays per kolom en een lijst 'description'.
+    """
+    with open(file_path, "rb") as f:
+        read_columnar_header(f)
+        while True:
+            magic = f.read(len(_BLOCK_MAGIC))
+            if not magic:
+                return
+            if magic != _BLOCK_MAGIC:
+                raise ValueError(f"Beschadigd blok in {file_path}.")
+            rows, column_count = struct.unpack("<II", f.read(8))
+            payloads = []
+            for _ in range(column_count):
+                (length,) = struct.unpack("<I", f.read(4))
+                payloads.append(zlib.decompress(f.read(length)))
+
+            block: Dict[str, object] = {
+                name: _from_little_endian("q", payload) for name, payload in zip(_INT_COLUMNS, payloads)
+            }
+            indexes = _from_little_endian("i", payloads[5])
+            values = _decode_strings(payloads[6])
+            block["description"] = [values[i] for i in indexes]
+            block["rows"] = rows
+            yield block
+
+
+def read_columnar_header(f: IO[bytes]) -> Dict:
+    """Leest de magic en de JSON-header aan het begin van een kolommair bestand."""
+    if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Geen kolommair exportbestand (onbekende magic).")
+    (length,) = struct.unpack("<I", f.read(4))
+    return json.loads(f.read(length).decode("utf-8"))
+
+
+def read_columnar(file_path: str) -> Tuple[Dict, Dict[str, object]]:
+    """
+    Leest een volledig kolommair exportbestand.
+
+    :return: (header, kolommen) waarbij kolommen int64-arrays zijn voor
+             id/project_id/start/end/duration en een lijst voor description.
+    """
+    with open(file_path, "rb") as f:
+        header = read_columnar_header(f)
+    columns: Dict[str, object] = {name: array("q") for name in _INT_COLUMNS}
+    descriptions: List[str] = []
+    for block in iter_columnar_blocks(file_path):
+        for name in _INT_COLUMNS:
+            columns[name].extend(block[name])
+        descriptions.extend(block["description"])
+    columns["description"] = descriptions
+    return header, columns
+
+
+def _decode_strings(payload: bytes) -> List[str]:
+    """Decodeert de woordenboekwaarden van een blok."""
+    (count,) = struct.unpack_from("<I", payload)
+    lengths = _from_little_endian("I", payload[4:4 + 4 * count])
+    values, position = [], 4 + 4 * count
+    for length in lengths:
+        values.append(payload[position:position + length].decode("utf-8"))
+        position += length
+    return values
+
+
+# === REGISTER ===
+
+EXPORTERS: Dict[str, Exporter] = {
+    exporter.name: exporter
+    for exporter in (CsvExporter(), GzipCsvExporter(), ZstdCsvExporter(), ColumnarExporter())
+}
+
+
+def get_exporter(name: str) -> Exporter:
+    """Zoekt een exporter op naam (csv, csv.gz, csv.zst, columnar)."""
+    if name not in EXPORTERS:
+        raise ValueError(f"Onbekend exportformaat '{name}', kies uit: {', '.join(EXPORTERS)}.")
+    return EXPORTERS[name]
+
+
+def export_project(db: Database, project: Project, format_name: str = "csv",
+                   export_path: str = EXPORT_PATH) -> str:
+    """
+    Exporteert een project in het gevraagde formaat naar EXPORT_PATH.
+
+    :return: Het pad naar het exportbestand.
+    """
+    exporter = get_exporter(format_name)
+    exporter.check_available()
+    file_path = _export_file_path(project, export_path, exporter.extension)
+    try:
+        exporter.export(db, project, file_path)
+    except Exception as e:
+        raise RuntimeError(f"Fout bij exporteren naar {exporter.name}: {e}")
+    print(f"Project '{project.name}' succesvol geëxporteerd naar {file_path}")
+    return file_path
@@ -0,0 +1,90 @@
+# services/incremental_export.py
+
+import argparse
+import csv
+import os
+import time
+from typing import Tuple
+
+from config import EXPORT_PATH
+from data.database import Database
+from models.project import Project
+from services.bulk_export import BulkExportResult
+from services.csv_export import FIELDNAMES, _csv_row
+
+# Een sessie kan meermaals in het bestand staan (bv. eerst lopend, later afgesloten):
+# de laatste rij met dezelfde Sessie ID is de geldige.
+INCREMENTAL_FIELDNAMES = ["Sessie ID"] + FIELDNAMES
+
+
+def _incremental_file_path(project: Project, export_path: str) -> str:
+    """Vast pad per project: elke run voegt rijen toe aan hetzelfde bestand."""
+    return os.path.join(export_path, f"project_{project.proj_id}_incremental.csv")
+
+
+def export_project_incremental(db: Database, project: Project, export_path: str = EXPORT_PATH) -> Tuple[str, int]:
+    """
+    Voegt enkel de sessies toe die sinds de vorige run nieuw zijn of gewijzigd werden
+    (bv. afgesloten via update_work_session_in_db). De eerste run, of een run waarbij het
+    bestand verdwenen is, exporteert de volledige historiek.
+
+    :return: (pad naar het exportbestand, aantal toegevoegde rijen)
+    """
+    os.makedirs(export_path, exist_ok=True)
+    file_path = _incremental_file_path(project, export_path)
+    state = db.get_export_state(project.proj_id)
+    if state is None or state[2] != file_path or not os.path.exists(file_path):
+        after_id, after_revision, new_file = 0, 0, True
+    else:
+        after_id, after_revision, new_file = state[0], state[1], False
+
+    upto_id, upto_revision = db.get_change_marks()
+    count = 0
+    try:
+        with open(file_path, "w" if new_file else "a", newline="") as csvfile:
+            writer = csv.writer(csvfile)
+            if new_file:
+                writer.writerow(INCREMENTAL_FIELDNAMES)
+            for session_id, start_time, end_time, description in db.iter_changed_work_session_rows(
+                    project.proj_id, after_id, after_revision, upto_id, upto_revision):
+                writer.writerow([session_id] + _csv_row(project, start_time, end_time, description))
+                count += 1
+    except Exception as e:
+        raise RuntimeError(f"Fout bij incrementeel exporteren naar CSV: {e}")
+
+    # Pas na het wegschrijven bijwerken: bij een crash wordt hoogstens opnieuw geëxporteerd.
+    db.save_export_state(project.proj_id, upto_id, upto_revision, file_path)
+    return file_path, count
+
+
+def export_all_projects_incremental(db: Database, export_path: str = EXPORT_PATH) -> BulkExportResult:
+    """Incrementele export van alle projecten, ook de gearchiveerde (bv. als nachtelijke taak)."""
+    projects = db.get_all_projects_including_archived()
+    result = BulkExportResult(projects=len(projects))
+    started = time.perf_counter()
+    for project in projects:
+        file_path, rows = export_project_incremental(db, project, export_path)
+        result.files.append(file_path)
+        result.rows += rows
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Voeg nieuwe en gewijzigde sessies van alle projecten toe aan hun incrementele export."
+    )
+    parser.add_argument("--export-path", default=EXPORT_PATH, help=f"Doelmap (default: {EXPORT_PATH})")
+    args = parser.parse_args()
+
+    db = Database()
+    try:
+        result = export_all_projects_incremental(db, args.export_path)
+    finally:
+        db.close()
+    print(f"{result.projects} project(en), {result.rows} nieuwe of gewijzigde sessie(s) geëxporteerd "
+          f"in {result.seconds:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
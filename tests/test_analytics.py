@@ -0,0 +1,30 @@
+# tests/test_analytics.py
+"""Histogram van sessieduur (services/analytics.py), ook met eigen klassegrenzen."""
+
+import numpy as np
+
+from services.analytics import SessionFrame, session_length_histogram
+
+
+def _frame(durations) -> SessionFrame:
+    durations = np.asarray(durations, dtype=np.int64)
+    starts = np.arange(len(durations), dtype=np.int64) * 100_000
+    ids = np.arange(1, len(durations) + 1, dtype=np.int64)
+    return SessionFrame(ids, np.ones(len(durations), dtype=np.int64), starts, starts + durations)
+
+
+def test_custom_bins_above_zero_skip_shorter_sessions():
+    frame = _frame([0, 30, 59, 60, 299, 300, 3599, 3600, 7200])
+
+    counts, edges = session_length_histogram(frame, bins=[60, 300, 3600])
+
+    assert list(counts) == [2, 2]
+    assert list(edges) == [60, 300, 3600]
+
+
+def test_default_bins_count_every_closed_session():
+    frame = _frame([0, 14 * 60, 15 * 60, 9 * 3600])
+
+    counts, _ = session_length_histogram(frame)
+
+    assert list(counts) == [2, 1, 0, 0, 0, 0, 1]
@@ -0,0 +1,66 @@
+# tests/test_api_server.py
+"""Endpoints van de lokale API-server (ui/api_server.py), tegen een echte server op een vrije poort."""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from data.pool import DatabasePool
+from ui.api_server import ApiServer
+
+
+@pytest.fixture
+def api(tmp_path):
+    pool = DatabasePool(str(tmp_path / "api.db"), pragmas={})
+    server = ApiServer(("127.0.0.1", 0), pool, workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def request(method: str, path: str, body=None):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+        try:
+            data = json.dumps(body).encode() if body is not None else None
+            connection.request(method, path, body=data,
+                               headers={"Content-Type": "application/json"} if data else {})
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    yield request
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_project_and_session_lifecycle(api):
+    status, created = api("POST", "/projects", {"name": "API", "description": "Via de API"})
+    assert status == 201 and created["ok"]
+    project_id = created["project"]["id"]
+
+    status, started = api("POST", "/sessions/start", {"project": "API", "description": "Werk"})
+    assert status == 201 and started["session"]["project_id"] == project_id
+    assert api("POST", "/sessions/start", {"project": project_id})[0] == 409
+
+    status, active = api("GET", "/sessions/active")
+    assert status == 200 and active["session"]["description"] == "Werk"
+
+    status, stopped = api("POST", "/sessions/stop", {})
+    assert status == 200 and stopped["session"]["end_time"] is not None
+    status, page = api("GET", f"/projects/{project_id}/sessions?limit=10")
+    assert status == 200 and len(page["sessions"]) == 1
+
+
+def test_invalid_requests_get_json_errors(api):
+    assert api("GET", "/onbekend") == (404, {"ok": False, "error": "Onbekend pad '/onbekend'."})
+    assert api("GET", "/projects/999")[0] == 404
+    status, result = api("GET", "/sessions?from=gisteren&to=2024-01-02")
+    assert status == 400 and not result["ok"]
+
+
+def test_timezone_aware_datetime_is_rejected(api):
+    status, result = api("GET", "/sessions?from=2024-01-01T00:00:00%2B02:00&to=2024-01-02T00:00:00")
+    assert status == 400
+    assert "tijdzone" in result["error"]
@@ -0,0 +1,52 @@
+# tests/test_bulk_export.py
+"""Parallelle export van alle projecten (services/bulk_export.py)."""
+
+import csv
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+import services.bulk_export
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+from services.bulk_export import export_all_projects
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "bulk.db"), pragmas={})
+    for index in range(3):
+        project = Project(name=f"Project {index}")
+        db.add_project_to_db(project)
+        db.add_work_sessions_to_db([
+            WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, day, 9 + index),
+                        end_time=datetime(2024, 3, day, 10 + index), description=f"Dag {day}")
+            for day in range(1, index + 2)
+        ])
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize("combined", [False, True])
+def test_worker_connections_are_closed(db, tmp_path, monkeypatch, combined):
+    opened = []
+
+    def tracking_database(*args, **kwargs):
+        opened.append(Database(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(services.bulk_export, "Database", tracking_database)
+    result = export_all_projects(db, str(tmp_path / "export"), workers=2, combined=combined, progress=None)
+
+    assert (result.projects, result.rows) == (3, 6)
+    assert len(opened) == 3
+    for worker_db in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            worker_db.connection.execute("SELECT 1")
+    if combined:
+        with open(result.files[0], newline="") as csvfile:
+            assert len(list(csv.reader(csvfile))) == 1 + 6
+    else:
+        assert len(result.files) == 3
@@ -0,0 +1,50 @@
+# tests/test_cache.py
+"""CachedDatabase (data/cache.py): eigen schrijfacties en commits van andere verbindingen maken de cache ongeldig."""
+
+from datetime import datetime
+
+import pytest
+
+from data.cache import CachedDatabase
+from data.database import Database
+from models.project import Project
+
+
+@pytest.fixture
+def databases(tmp_path):
+    path = str(tmp_path / "cache.db")
+    own, other = Database(path, pragmas={}), Database(path, pragmas={})
+    yield CachedDatabase(own), other
+    own.close()
+    other.close()
+
+
+def test_repeated_reads_are_served_from_cache(databases):
+    cached, _ = databases
+    cached.add_project_to_db(Project(name="Eerste"))
+
+    assert [p.name for p in cached.get_active_projects()] == ["Eerste"]
+    assert [p.name for p in cached.get_active_projects()] == ["Eerste"]
+    assert cached.stats() == {"hits": 1, "misses": 1}
+
+
+def test_commit_by_other_connection_invalidates_cache(databases):
+    cached, other = databases
+    project = Project(name="Eerste")
+    cached.add_project_to_db(project)
+    assert cached.get_active_work_session() is None
+    assert len(cached.get_active_projects()) == 1
+
+    other.add_project_to_db(Project(name="Van elders"))
+    other.start_work_session(project.proj_id, "Elders gestart", start_time=datetime(2024, 3, 1, 9))
+
+    assert sorted(p.name for p in cached.get_active_projects()) == ["Eerste", "Van elders"]
+    assert cached.get_active_work_session().description == "Elders gestart"
+    assert cached.stats()["misses"] == 4
+
+
+def test_returned_objects_are_copies(databases):
+    cached, _ = databases
+    cached.add_project_to_db(Project(name="Origineel"))
+    cached.get_active_projects()[0].name = "Aangepast"
+    assert cached.get_active_projects()[0].name == "Origineel"
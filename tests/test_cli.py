@@ -0,0 +1,63 @@
+# tests/test_cli.py
+"""JSON-uitvoer en exitcodes van de niet-interactieve opdrachtregel (ui/cli.py)."""
+
+import json
+
+import pytest
+
+import ui.cli
+from data.database import Database
+from models.project import Project
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / "cli.db")
+    db = Database(path, pragmas={})
+    db.add_project_to_db(Project(name="CLI"))
+    db.close()
+    monkeypatch.setattr(ui.cli, "DB_PATH", path)
+    monkeypatch.setattr(ui.cli, "Database", lambda: Database(path, pragmas={}))
+
+    def run(*argv: str):
+        exit_code = ui.cli.main(list(argv))
+        out = capsys.readouterr().out
+        assert out.endswith("\n") and out.count("\n") == 1  # precies één JSON-object
+        return exit_code, json.loads(out)
+
+    return run
+
+
+def test_start_status_stop(run):
+    exit_code, started = run("start", "cli", "--description", "Via de shell")
+    assert exit_code == 0 and started["ok"]
+    assert started["session"]["project"] == "CLI"
+    assert started["session"]["end_time"] is None
+
+    assert run("status") == (0, {"ok": True, "active": True, "session": started["session"]})
+
+    exit_code, stopped = run("stop")
+    assert exit_code == 0 and stopped["session"]["id"] == started["session"]["id"]
+    assert stopped["session"]["end_time"] is not None
+    assert run("status") == (0, {"ok": True, "active": False, "session": None})
+
+
+def test_errors_are_reported_as_json(run):
+    assert run("stop") == (1, {"ok": False, "error": "Er loopt geen sessie."})
+    assert run("start", "Onbekend") == (1, {"ok": False, "error": "Project 'Onbekend' niet gevonden."})
+
+    run("start", "1")
+    exit_code, result = run("start", "CLI")
+    assert exit_code == 1 and result["error"].startswith("Er loopt al een sessie")
+
+
+def test_report_per_project(run):
+    assert run("report") == (0, {"ok": True, "projects": [
+        {"id": 1, "name": "CLI", "archived": False, "seconds": 0, "duration": ui.cli.format_duration(0)},
+    ]})
+
+
+def test_invalid_arguments_exit_with_2(run):
+    with pytest.raises(SystemExit) as exit_info:
+        ui.cli.main(["report", "--period", "jaar"])
+    assert exit_info.value.code == 2
@@ -0,0 +1,37 @@
+# tests/test_csv_export.py
+"""De streamende CSV-export moet byte voor byte gelijk zijn aan de export via Project.work_sessions."""
+
+from datetime import datetime
+
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+from services.csv_export import export_project_to_csv, stream_project_to_csv
+
+
+def test_streaming_export_matches_list_export(tmp_path):
+    db = Database(str(tmp_path / "export.db"), pragmas={})
+    try:
+        project = Project(name="Export")
+        db.add_project_to_db(project)
+        # Bewust niet in volgorde van starttijd toegevoegd, met twee sessies op hetzelfde tijdstip.
+        db.add_work_sessions_to_db([
+            WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, 2, 9),
+                        end_time=datetime(2024, 3, 2, 12, 15), description="Tweede dag"),
+            WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, 1, 9),
+                        end_time=datetime(2024, 3, 1, 9), description="Zelfde start, korter"),
+            WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, 1, 9),
+                        end_time=datetime(2024, 3, 1, 10, 30), description='Met "quotes", en komma'),
+        ])
+        db.start_work_session(project.proj_id, "Lopend")
+
+        project.work_sessions = db.get_work_sessions_for_project(project.proj_id)
+        list_path = export_project_to_csv(project, str(tmp_path / "list"))
+        stream_path = stream_project_to_csv(db, project, str(tmp_path / "stream"))
+    finally:
+        db.close()
+
+    with open(list_path, "rb") as listed, open(stream_path, "rb") as streamed:
+        list_bytes, stream_bytes = listed.read(), streamed.read()
+    assert list_bytes == stream_bytes
+    assert list_bytes.count(b"\n") == 5
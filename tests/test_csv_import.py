@@ -0,0 +1,79 @@
+# tests/test_csv_import.py
+"""Validatie en overlapcontrole van de CSV-import (services/csv_import.py)."""
+
+import csv
+from datetime import datetime
+
+import pytest
+
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+from services.csv_import import import_sessions_from_csv
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "import.db"), pragmas={})
+    yield db
+    db.close()
+
+
+def _write_csv(path, rows) -> str:
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Projectnaam", "Starttijd", "Eindtijd", "Beschrijving"])
+        writer.writerows(rows)
+    return str(path)
+
+
+def _descriptions(db: Database, project_id: int) -> list:
+    return sorted(s.description for s in db.get_work_sessions_for_project(project_id))
+
+
+def test_invalid_rows_are_counted_not_imported(db, tmp_path):
+    file_path = _write_csv(tmp_path / "invalid.csv", [
+        ["Import", "2024-02-01 09:00:00", "2024-02-01 10:00:00", "Geldig"],
+        ["Import", "2024-02-01 11:00:00+02:00", "2024-02-01 12:00:00+02:00", "Met tijdzone"],
+        ["Import", "2024-02-01 13:00:00", "2024-02-01 12:00:00", "Einde voor start"],
+        ["Import", "geen datum", "2024-02-01 14:00:00", "Ongeldig tijdstip"],
+        ["Import", "2024-02-01 15:00:00", "", "Lopend"],
+    ])
+
+    result = import_sessions_from_csv(db, file_path)
+
+    assert (result.rows, result.imported, result.invalid, result.overlapping) == (5, 1, 4, 0)
+    assert any("tijdzone" in message for message in result.messages)
+    project = db.get_all_projects_including_archived()[0]
+    assert _descriptions(db, project.proj_id) == ["Geldig"]
+
+
+def test_row_rejected_by_existing_session_does_not_reject_later_rows(db, tmp_path):
+    project = Project(name="Import")
+    db.add_project_to_db(project)
+    db.add_work_session_to_db(WorkSession(project_id=project.proj_id, start_time=datetime(2024, 2, 1, 10),
+                                          end_time=datetime(2024, 2, 1, 11), description="Bestaand"))
+    file_path = _write_csv(tmp_path / "overlap.csv", [
+        # Overlapt met de bestaande sessie en wordt afgekeurd ...
+        ["Import", "2024-02-01 09:00:00", "2024-02-01 10:30:00", "Over bestaande sessie"],
+        # ... en mag deze rij dus niet meer wegdrukken.
+        ["Import", "2024-02-01 09:30:00", "2024-02-01 09:50:00", "Binnen afgekeurde rij"],
+        ["Import", "2024-02-01 09:40:00", "2024-02-01 09:55:00", "Overlapt met vorige rij"],
+        ["Import", "2024-02-01 11:00:00", "2024-02-01 12:00:00", "Na bestaande sessie"],
+    ])
+
+    result = import_sessions_from_csv(db, file_path)
+
+    assert (result.imported, result.overlapping) == (2, 2)
+    assert _descriptions(db, project.proj_id) == ["Bestaand", "Binnen afgekeurde rij", "Na bestaande sessie"]
+
+
+def test_dry_run_writes_nothing(db, tmp_path):
+    file_path = _write_csv(tmp_path / "dry.csv", [
+        ["Nieuw", "2024-02-01 09:00:00", "2024-02-01 10:00:00", "Proef"],
+    ])
+
+    result = import_sessions_from_csv(db, file_path, dry_run=True)
+
+    assert (result.imported, result.projects_created) == (0, 1)
+    assert db.get_all_projects_including_archived() == []
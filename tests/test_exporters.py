@@ -0,0 +1,54 @@
+# tests/test_exporters.py
+"""Kolommair exportformaat (services/exporters.py): wat geschreven wordt, moet er ongewijzigd weer uit komen."""
+
+import os
+from datetime import datetime
+
+from data.database import Database
+from data.timestamps import to_epoch
+from models.project import Project
+from models.work_session import WorkSession
+from services.exporters import NULL_VALUE, ColumnarExporter, export_project, read_columnar
+
+
+def test_columnar_round_trip_over_several_blocks(tmp_path):
+    db = Database(str(tmp_path / "columnar.db"), pragmas={})
+    try:
+        project = Project(name="Kolommen")
+        db.add_project_to_db(project)
+        sessions = [
+            WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, day, 9),
+                        end_time=datetime(2024, 3, day, 9 + day, 30), description=description)
+            for day, description in ((1, "Herhaald"), (2, "Ünïcode ✓"), (3, "Herhaald"), (4, ""))
+        ]
+        db.add_work_sessions_to_db(sessions)
+        running = db.start_work_session(project.proj_id, "Lopend", start_time=datetime(2024, 3, 5, 9))
+        sessions.append(running)
+
+        file_path = str(tmp_path / "kolommen.ptcol")
+        # Blokken van twee rijen: de woordenboeken per blok moeten correct samengevoegd worden.
+        assert ColumnarExporter(block_size=2).export(db, project, file_path) == 5
+    finally:
+        db.close()
+
+    header, columns = read_columnar(file_path)
+    assert (header["project_id"], header["project_name"]) == (project.proj_id, "Kolommen")
+    assert list(columns["id"]) == [s.id for s in sessions]
+    assert set(columns["project_id"]) == {project.proj_id}
+    assert list(columns["start"]) == [to_epoch(s.start_time) for s in sessions]
+    assert list(columns["end"]) == [to_epoch(s.end_time) for s in sessions[:-1]] + [NULL_VALUE]
+    assert list(columns["duration"]) == [3600 * day + 1800 for day in (1, 2, 3, 4)] + [NULL_VALUE]
+    assert columns["description"] == ["Herhaald", "Ünïcode ✓", "Herhaald", "", "Lopend"]
+
+
+def test_export_project_uses_format_extension(tmp_path):
+    db = Database(str(tmp_path / "formats.db"), pragmas={})
+    try:
+        project = Project(name="Formaten")
+        db.add_project_to_db(project)
+        file_path = export_project(db, project, "csv.gz", str(tmp_path / "export"))
+    finally:
+        db.close()
+    assert os.path.dirname(file_path) == str(tmp_path / "export")
+    assert os.path.basename(file_path).startswith(f"project_{project.proj_id}_export_")
+    assert file_path.endswith(".csv.gz") and os.path.exists(file_path)
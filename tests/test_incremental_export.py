@@ -0,0 +1,63 @@
+# tests/test_incremental_export.py
+"""Incrementele export (services/incremental_export.py): elke run voegt enkel nieuwe en gewijzigde sessies toe."""
+
+import csv
+import os
+from datetime import datetime
+
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+from services.incremental_export import export_project_incremental
+
+
+def _rows(file_path: str) -> list:
+    with open(file_path, newline="") as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def test_second_run_appends_only_new_and_changed_sessions(tmp_path):
+    db = Database(str(tmp_path / "incremental.db"), pragmas={})
+    export_path = str(tmp_path / "export")
+    try:
+        project = Project(name="Incrementeel")
+        db.add_project_to_db(project)
+        db.add_work_session_to_db(WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, 1, 9),
+                                              end_time=datetime(2024, 3, 1, 10), description="Eerste"))
+        running = db.start_work_session(project.proj_id, "Lopend", start_time=datetime(2024, 3, 1, 11))
+
+        file_path, count = export_project_incremental(db, project, export_path)
+        assert count == 2
+        assert export_project_incremental(db, project, export_path) == (file_path, 0)
+
+        running.end_time = datetime(2024, 3, 1, 12)
+        db.update_work_session_in_db(running)
+        db.add_work_session_to_db(WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, 2, 9),
+                                              end_time=datetime(2024, 3, 2, 10), description="Nieuw"))
+
+        assert export_project_incremental(db, project, export_path) == (file_path, 2)
+    finally:
+        db.close()
+
+    rows = _rows(file_path)
+    assert [row["Beschrijving"] for row in rows] == ["Eerste", "Lopend", "Lopend", "Nieuw"]
+    # De laatste rij van een sessie is de geldige: nu met einde.
+    assert rows[1]["Sessie ID"] == rows[2]["Sessie ID"] == str(running.id)
+    assert (rows[1]["Eindtijd"], rows[2]["Eindtijd"]) == ("", "2024-03-01 12:00:00")
+
+
+def test_missing_file_triggers_full_export(tmp_path):
+    db = Database(str(tmp_path / "incremental.db"), pragmas={})
+    export_path = str(tmp_path / "export")
+    try:
+        project = Project(name="Opnieuw")
+        db.add_project_to_db(project)
+        db.add_work_session_to_db(WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, 1, 9),
+                                              end_time=datetime(2024, 3, 1, 10), description="Enige"))
+        file_path, _ = export_project_incremental(db, project, export_path)
+        os.remove(file_path)
+
+        assert export_project_incremental(db, project, export_path) == (file_path, 1)
+    finally:
+        db.close()
+    assert len(_rows(file_path)) == 1
@@ -0,0 +1,86 @@
+# tests/test_migrations.py
+"""
+Upgrade van een database met het oorspronkelijke schema (zonder migraties) naar de laatste
+versie, en controle dat de queries van Database de indexen uit de migraties gebruiken.
+"""
+
+import sqlite3
+
+import pytest
+
+from data.database import Database
+from data.migrations import SCHEMA_VERSION, get_schema_version
+
+# Het schema zoals het vóór de eerste migratie werd aangemaakt (user_version 0).
+BASELINE_SCHEMA = """
+    CREATE TABLE projects (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        description TEXT,
+        archived INTEGER DEFAULT 0 CHECK (archived IN (0, 1))
+    );
+    CREATE TABLE work_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        start_time TEXT NOT NULL,
+        end_time TEXT,
+        description TEXT,
+        FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE
+    );
+    INSERT INTO projects (name) VALUES ('Baseline');
+    INSERT INTO work_sessions (project_id, start_time, end_time, description)
+    VALUES (1, '2024-01-01T09:00:00', '2024-01-01T10:30:00', 'Afgesloten');
+    INSERT INTO work_sessions (project_id, start_time, description)
+    VALUES (1, '2024-01-02T09:00:00', 'Lopend');
+"""
+
+
+@pytest.fixture
+def upgraded_db(tmp_path):
+    path = str(tmp_path / "baseline.db")
+    connection = sqlite3.connect(path)
+    connection.executescript(BASELINE_SCHEMA)
+    connection.close()
+
+    db = Database(path, timestamp_storage="iso", pragmas={})
+    yield db
+    db.close()
+
+
+def _query_plans(db: Database, call) -> list:
+    """Voert `call` uit en geeft het EXPLAIN QUERY PLAN van elke uitgevoerde SELECT terug."""
+    statements = []
+    db.connection.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db.connection.set_trace_callback(None)
+    return [
+        " | ".join(row[3] for row in db.connection.execute("EXPLAIN QUERY PLAN " + sql))
+        for sql in statements if sql.lstrip().upper().startswith("SELECT")
+    ]
+
+
+def test_upgrade_reaches_latest_schema_version(upgraded_db):
+    assert get_schema_version(upgraded_db.connection) == SCHEMA_VERSION
+    sessions = upgraded_db.get_work_sessions_for_project(1)
+    assert [s.description for s in sessions] == ["Afgesloten", "Lopend"]
+
+
+def test_sessions_for_project_use_project_start_index(upgraded_db):
+    plans = _query_plans(upgraded_db, lambda: upgraded_db.get_work_sessions_for_project(1))
+    assert len(plans) == 1
+    assert "USING INDEX idx_work_sessions_project_start (project_id=?)" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+
+
+def test_session_count_uses_covering_index(upgraded_db):
+    plans = _query_plans(upgraded_db, lambda: upgraded_db.count_work_sessions(1))
+    assert plans == ["SEARCH work_sessions USING COVERING INDEX idx_work_sessions_project_start (project_id=?)"]
+
+
+def test_active_session_uses_partial_index(upgraded_db):
+    plans = _query_plans(upgraded_db, upgraded_db.get_active_work_session)
+    assert len(plans) == 1
+    assert "USING INDEX idx_work_sessions_single_open" in plans[0]
+    assert upgraded_db.get_active_work_session().description == "Lopend"
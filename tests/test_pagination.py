@@ -0,0 +1,60 @@
+# tests/test_pagination.py
+"""Keyset-paginering van Database.get_work_sessions_page, naar oudere en naar nieuwere sessies."""
+
+from datetime import datetime
+
+import pytest
+
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession
+
+
+@pytest.fixture
+def project_db(tmp_path):
+    db = Database(str(tmp_path / "pages.db"), pragmas={})
+    project = Project(name="Pagina's")
+    db.add_project_to_db(project)
+    # Vijf sessies, waarvan twee met dezelfde starttijd: de volgorde valt dan terug op het id.
+    starts = [datetime(2024, 3, day, 9) for day in (1, 2, 2, 3, 4)]
+    db.add_work_sessions_to_db([
+        WorkSession(project_id=project.proj_id, start_time=start, end_time=start.replace(hour=10),
+                    description=f"Sessie {index}")
+        for index, start in enumerate(starts)
+    ])
+    yield db, project.proj_id
+    db.close()
+
+
+def _descriptions(sessions) -> list:
+    return [s.description for s in sessions]
+
+
+def test_paging_older_visits_every_session_once(project_db):
+    db, project_id = project_db
+    first = db.get_work_sessions_page(project_id, limit=2)
+    second = db.get_work_sessions_page(project_id, limit=2, position=(first[-1].start_time, first[-1].id))
+    third = db.get_work_sessions_page(project_id, limit=2, position=(second[-1].start_time, second[-1].id))
+
+    assert _descriptions(first) == ["Sessie 4", "Sessie 3"]
+    assert _descriptions(second) == ["Sessie 2", "Sessie 1"]
+    assert _descriptions(third) == ["Sessie 0"]
+
+
+def test_paging_newer_returns_previous_page_newest_first(project_db):
+    db, project_id = project_db
+    oldest = db.get_work_sessions_page(project_id, limit=2, position=(datetime(2024, 3, 2, 9), 3))
+    assert _descriptions(oldest) == ["Sessie 1", "Sessie 0"]
+
+    newer = db.get_work_sessions_page(project_id, limit=2, position=(oldest[0].start_time, oldest[0].id),
+                                      older=False)
+    assert _descriptions(newer) == ["Sessie 3", "Sessie 2"]
+    newest = db.get_work_sessions_page(project_id, limit=2, position=(newer[0].start_time, newer[0].id),
+                                       older=False)
+    assert _descriptions(newest) == ["Sessie 4"]
+
+
+def test_page_respects_time_window(project_db):
+    db, project_id = project_db
+    page = db.get_work_sessions_page(project_id, limit=10, start=datetime(2024, 3, 2), end=datetime(2024, 3, 3))
+    assert _descriptions(page) == ["Sessie 2", "Sessie 1"]
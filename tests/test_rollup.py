@@ -0,0 +1,52 @@
+# tests/test_rollup.py
+"""Dagtotalen (daily_project_totals, data/rollup.py): sessies over middernacht worden per dag verdeeld."""
+
+from datetime import datetime
+
+import pytest
+
+from data.database import Database
+from data.rollup import check_rollup
+from models.project import Project
+from models.work_session import WorkSession
+
+
+@pytest.fixture(params=["iso", "epoch"])
+def db(request, tmp_path):
+    db = Database(str(tmp_path / "rollup.db"), timestamp_storage=request.param, pragmas={})
+    yield db
+    db.close()
+
+
+def test_session_over_midnight_is_split_per_day(db):
+    project = Project(name="Nachtwerk")
+    db.add_project_to_db(project)
+    session = WorkSession(project_id=project.proj_id, start_time=datetime(2024, 3, 1, 22),
+                          end_time=datetime(2024, 3, 2, 1, 30), description="Over middernacht")
+    db.add_work_session_to_db(session)
+
+    assert db.get_worked_seconds_per_period("day") == {"2024-03-01": 7200, "2024-03-02": 5400}
+    # Per startdag telt de volledige sessie nog op 1 maart.
+    assert db.get_total_seconds_per_period("day") == {"2024-03-01": 12600}
+
+    session.end_time = datetime(2024, 3, 3, 0, 15)
+    db.update_work_session_in_db(session)
+
+    assert db.get_worked_seconds_per_period("day") == {
+        "2024-03-01": 7200, "2024-03-02": 86400, "2024-03-03": 900,
+    }
+    assert check_rollup(db.connection, db.timestamp_storage) == []
+
+
+def test_running_session_counts_only_once_stopped(db):
+    project = Project(name="Lopend")
+    db.add_project_to_db(project)
+    db.start_work_session(project.proj_id, start_time=datetime(2024, 3, 1, 23, 30))
+    assert db.get_worked_seconds_per_period("day") == {}
+
+    session = db.get_active_work_session()
+    session.end_time = datetime(2024, 3, 2, 0, 30)
+    db.update_work_session_in_db(session)
+
+    assert db.get_worked_seconds_per_period("day") == {"2024-03-01": 1800, "2024-03-02": 1800}
+    assert db.get_total_seconds_per_project() == {project.proj_id: 3600}
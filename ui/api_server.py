@@ -0,0 +1,377 @@
+# ui/api_server.py
+"""
+Optionele lokale HTTP/JSON-API voor dashboards en editorplugins:
+
+    GET  /projects                  alle projecten met hun totale tijd (?archived=0 laat gearchiveerde weg)
+    POST /projects                  nieuw project: {"name": ..., "description": ...}
+    GET  /projects/<id>             één project met zijn totale tijd
+    GET  /projects/<id>/sessions    sessies, nieuwste eerst (?limit=50, volgende pagina met ?before_time=&before_id=)
+    GET  /sessions                  sessies die overlappen met ?from=...&to=... (ISO-datum of -tijdstip)
+    GET  /sessions/active           de lopende sessie
+    POST /sessions/start            {"project": <project-ID of naam>, "description": ...}
+    POST /sessions/stop             {"project": <project-ID of naam>} (optioneel)
+    GET  /reports                   ?period=day|week|month&project=...&from=JJJJ-MM-DD&to=JJJJ-MM-DD
+
+Elk antwoord is een JSON-object met "ok": true, of met "ok": false en "error" bij statuscode
+400 (ongeldig verzoek), 404 (onbekend pad of project), 409 (er loopt al / geen sessie) of 500.
+
+Verzoeken worden afgehandeld door een vaste pool van worker-threads. Leesverzoeken gebruiken de
+eigen leesverbinding van hun worker, schrijfverzoeken de gedeelde schrijfverbinding (data/pool.py).
+De server luistert standaard enkel op 127.0.0.1 en heeft geen authenticatie.
+
+Gebruik:
+    python -m ui.api_server [--host 127.0.0.1] [--port 8765] [--workers 16] [--verbose]
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from config import API_HOST, API_PORT, API_WORKERS, DB_PATH
+from data.database import Database
+from data.pool import DatabasePool
+from models.project import Project
+from models.work_session import format_duration
+from ui.cli import CliError, build_report, find_project, session_to_dict
+
+# Maximale grootte van een verzoek-body.
+_MAX_BODY_BYTES = 64 * 1024
+
+# Standaard en maximaal aantal sessies per pagina.
+_DEFAULT_PAGE_SIZE = 50
+_MAX_PAGE_SIZE = 1000
+
+Handler = Callable[[DatabasePool, re.Match, Dict[str, str], Dict], Tuple[int, Dict]]
+
+
+class ApiError(Exception):
+    """Fout die als {"ok": false, "error": ...} met de gegeven HTTP-status gemeld wordt."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# === HULPFUNCTIES ===
+def _project_to_dict(project: Project, seconds: int) -> Dict:
+    return {
+        "id": project.proj_id,
+        "name": project.name,
+        "description": project.description,
+        "archived": project.archived,
+        "seconds": seconds,
+        "duration": format_duration(seconds),
+    }
+
+
+def _lookup_project(db: Database, reference) -> Project:
+    """Project op ID of naam; een onbekend project geeft 404."""
+    try:
+        return find_project(db, str(reference))
+    except CliError as e:
+        raise ApiError(HTTPStatus.NOT_FOUND, str(e))
+
+
+def _get_project(db: Database, project_id: str) -> Project:
+    project = db.get_project(int(project_id))
+    if project is None:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"Project {project_id} niet gevonden.")
+    return project
+
+
+def _int_param(query: Dict[str, str], name: str, default: int, maximum: int) -> int:
+    try:
+        value = int(query.get(name, default))
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"'{name}' moet een geheel getal zijn.")
+    if not 1 <= value <= maximum:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"'{name}' moet tussen 1 en {maximum} liggen.")
+    return value
+
+
+def _datetime_param(query: Dict[str, str], name: str) -> Optional[datetime]:
+    if name not in query:
+        return None
+    try:
+        moment = datetime.fromisoformat(query[name])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Ongeldig tijdstip '{query[name]}' voor '{name}'.")
+    if moment.tzinfo is not None:
+        # De database bewaart lokale tijd zonder tijdzone; een offset kan niet vergeleken worden.
+        raise ApiError(HTTPStatus.BAD_REQUEST,
+                       f"Tijdstip '{query[name]}' voor '{name}' mag geen tijdzone bevatten, gebruik lokale tijd.")
+    return moment
+
+
+def _date_param(query: Dict[str, str], name: str) -> Optional[date]:
+    if name not in query:
+        return None
+    try:
+        return date.fromisoformat(query[name])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Ongeldige datum '{query[name]}' voor '{name}', verwacht JJJJ-MM-DD.")
+
+
+def _sessions_to_dicts(db: Database, sessions) -> List[Dict]:
+    projects = {p.proj_id: p for p in db.get_all_projects_including_archived()} if sessions else {}
+    return [session_to_dict(s, projects.get(s.project_id)) for s in sessions]
+
+
+# === ENDPOINTS ===
+def _list_projects(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    db = pool.reader()
+    archived = query.get("archived", "1") not in ("0", "false")
+    projects = db.get_all_projects_including_archived() if archived else db.get_active_projects()
+    totals = db.get_total_seconds_per_project()
+    return HTTPStatus.OK, {"projects": [_project_to_dict(p, totals.get(p.proj_id, 0)) for p in projects]}
+
+
+def _create_project(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    name = body.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ApiError(HTTPStatus.BAD_REQUEST, "'name' is verplicht.")
+    project = Project(name=name.strip(), description=str(body.get("description") or ""))
+    with pool.writer() as db:
+        db.add_project_to_db(project)
+    if project.proj_id is None:
+        raise ApiError(HTTPStatus.INTERNAL_SERVER_ERROR, "Project kon niet opgeslagen worden.")
+    return HTTPStatus.CREATED, {"project": _project_to_dict(project, 0)}
+
+
+def _show_project(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    db = pool.reader()
+    project = _get_project(db, match["id"])
+    seconds = db.get_total_seconds_per_project().get(project.proj_id, 0)
+    return HTTPStatus.OK, {"project": _project_to_dict(project, seconds)}
+
+
+def _project_sessions(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    db = pool.reader()
+    project = _get_project(db, match["id"])
+    limit = _int_param(query, "limit", _DEFAULT_PAGE_SIZE, _MAX_PAGE_SIZE)
+    before_time = _datetime_param(query, "before_time")
+    position = None
+    if before_time is not None:
+        position = (before_time, _int_param(query, "before_id", sys.maxsize, sys.maxsize))
+    sessions = db.get_work_sessions_page(project.proj_id, limit, position)
+    # Keyset-cursor voor de volgende (oudere) pagina, met het exacte starttijdstip.
+    next_page = None
+    if len(sessions) == limit:
+        last = sessions[-1]
+        next_page = {"before_time": last.start_time.isoformat(), "before_id": last.id}
+    return HTTPStatus.OK, {
+        "sessions": [session_to_dict(s, project) for s in sessions],
+        "next": next_page,
+    }
+
+
+def _overlapping_sessions(pool: DatabasePool, match: re.Match, query: Dict[str, str],
+                          body: Dict) -> Tuple[int, Dict]:
+    start, end = _datetime_param(query, "from"), _datetime_param(query, "to")
+    if start is None or end is None:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "'from' en 'to' zijn verplicht.")
+    db = pool.reader()
+    sessions = db.get_work_sessions_overlapping(start, end)
+    return HTTPStatus.OK, {"count": len(sessions), "sessions": _sessions_to_dicts(db, sessions)}
+
+
+def _active_session(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    db = pool.reader()
+    session = db.get_active_work_session()
+    if session is None:
+        return HTTPStatus.OK, {"active": False, "session": None}
+    return HTTPStatus.OK, {"active": True, "session": session_to_dict(session, db.get_project(session.project_id))}
+
+
+def _start_session(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    if body.get("project") in (None, ""):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "'project' is verplicht.")
+    with pool.writer() as db:
+        project = _lookup_project(db, body["project"])
+        if project.archived:
+            raise ApiError(HTTPStatus.CONFLICT, f"Project '{project.name}' is gearchiveerd.")
+        session = db.start_work_session(project.proj_id, str(body.get("description") or ""))
+        if session is None:
+            active = db.get_active_work_session()
+            raise ApiError(HTTPStatus.CONFLICT, "Er loopt al een sessie" + (f" (sessie {active.id})." if active else "."))
+    return HTTPStatus.CREATED, {"session": session_to_dict(session, project)}
+
+
+def _stop_session(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    with pool.writer() as db:
+        project = _lookup_project(db, body["project"]) if body.get("project") not in (None, "") else None
+        session = db.stop_active_work_session(project.proj_id if project else None)
+        if session is None:
+            raise ApiError(HTTPStatus.CONFLICT,
+                           "Er loopt geen sessie" + (f" voor project '{project.name}'." if project else "."))
+        project = project or db.get_project(session.project_id)
+    return HTTPStatus.OK, {"session": session_to_dict(session, project)}
+
+
+def _report(pool: DatabasePool, match: re.Match, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+    period = query.get("period")
+    if period not in (None, "day", "week", "month"):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "'period' moet day, week of month zijn.")
+    db = pool.reader()
+    project = _lookup_project(db, query["project"]) if query.get("project") else None
+    return HTTPStatus.OK, build_report(db, project, period, _date_param(query, "from"), _date_param(query, "to"))
+
+
+# (methode, pad, handler); het pad moet volledig overeenkomen.
+ROUTES: List[Tuple[str, re.Pattern, Handler]] = [
+    ("GET", re.compile(r"/projects"), _list_projects),
+    ("POST", re.compile(r"/projects"), _create_project),
+    ("GET", re.compile(r"/projects/(?P<id>\d{1,18})"), _show_project),
+    ("GET", re.compile(r"/projects/(?P<id>\d{1,18})/sessions"), _project_sessions),
+    ("GET", re.compile(r"/sessions"), _overlapping_sessions),
+    ("GET", re.compile(r"/sessions/active"), _active_session),
+    ("POST", re.compile(r"/sessions/start"), _start_session),
+    ("POST", re.compile(r"/sessions/stop"), _stop_session),
+    ("GET", re.compile(r"/reports"), _report),
+]
+
+
+# === SERVER ===
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """Zoekt de route bij een verzoek en schrijft het resultaat als JSON terug."""
+    server: "ApiServer"
+    server_version = "ProjectTracker"
+    timeout = 10  # een trage of hangende client houdt een worker niet onbeperkt bezet
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            routes = [(route_method, match, handler) for route_method, pattern, handler in ROUTES
+                      if (match := pattern.fullmatch(path))]
+            if not routes:
+                raise ApiError(HTTPStatus.NOT_FOUND, f"Onbekend pad '{path}'.")
+            route = next((route for route in routes if route[0] == method), None)
+            if route is None:
+                raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is niet toegestaan op '{path}'.")
+            _, match, handler = route
+            body = self._read_body() if method == "POST" else {}
+            status, result = handler(self.server.pool, match, query, body)
+            self._send_json(status, dict(ok=True, **result))
+        except ApiError as e:
+            self._send_json(e.status, {"ok": False, "error": str(e)})
+        except sqlite3.Error as e:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"ok": False, "error": f"Databasefout: {e}"})
+        except Exception as e:
+            # Elke andere fout toch als JSON beantwoorden in plaats van de verbinding te verbreken.
+            print(f"Fout bij {method} {self.path}:", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR,
+                            {"ok": False, "error": f"Interne fout: {type(e).__name__}: {e}"})
+
+    def _read_body(self) -> Dict:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Ongeldige Content-Length.")
+        if length > _MAX_BODY_BYTES:
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body groter dan {_MAX_BODY_BYTES} bytes.")
+        if length <= 0:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Body is geen geldige JSON.")
+        if not isinstance(body, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Body moet een JSON-object zijn.")
+        return body
+
+    def _send_json(self, status: int, result: Dict):
+        data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Eén regel per verzoek enkel met --verbose: onder belasting kost het loggen zelf te veel tijd.
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ApiServer(HTTPServer):
+    """
+    HTTPServer die verzoeken afhandelt in een vaste pool van worker-threads (in plaats van één
+    nieuwe thread per verzoek zoals ThreadingHTTPServer), zodat elke worker zijn leesverbinding
+    uit de DatabasePool over alle verzoeken heen hergebruikt.
+    """
+    # Listen-backlog: honderden gelijktijdige clients wachten in de wachtrij in plaats van geweigerd te worden.
+    request_queue_size = 1024
+
+    def __init__(self, address: Tuple[str, int], pool: DatabasePool, workers: int = API_WORKERS,
+                 verbose: bool = False):
+        super().__init__(address, ApiRequestHandler)
+        self.pool = pool
+        self.verbose = verbose
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-worker")
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_in_worker, request, client_address)
+
+    def _process_request_in_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Stopt met luisteren, wacht tot de lopende verzoeken klaar zijn en sluit de verbindingen."""
+        super().server_close()
+        self._executor.shutdown(wait=True)
+        self.pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokale HTTP/JSON-API voor de Project Tracker.")
+    parser.add_argument("--host", default=API_HOST, help=f"Adres om op te luisteren (default: {API_HOST})")
+    parser.add_argument("--port", type=int, default=API_PORT, help=f"Poort (default: {API_PORT})")
+    parser.add_argument("--workers", type=int, default=API_WORKERS,
+                        help=f"Aantal worker-threads, elk met een eigen leesverbinding (default: {API_WORKERS})")
+    parser.add_argument("--verbose", action="store_true", help="Log elk verzoek naar stderr")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+    pool = DatabasePool()
+    try:
+        server = ApiServer((args.host, args.port), pool, args.workers, args.verbose)
+    except OSError as e:
+        pool.close()
+        print(f"Fout bij starten van de API-server op {args.host}:{args.port}: {e}")
+        sys.exit(1)
+
+    print(f"API-server luistert op http://{args.host}:{server.server_port} "
+          f"({args.workers} workers, database {DB_PATH})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nAPI-server gestopt.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
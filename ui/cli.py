@@ -0,0 +1,271 @@
+# ui/cli.py
+"""
+Niet-interactieve opdrachtregel voor scripts, shell-hooks en editorintegraties.
+Elk subcommando voert één bewerking uit, schrijft één JSON-object naar stdout en stopt:
+
+    python main.py start <project> [--description TEKST]
+    python main.py stop [--project <project>]
+    python main.py status
+    python main.py report [--period day|week|month] [--project <project>] [--from JJJJ-MM-DD] [--to JJJJ-MM-DD]
+    python main.py export [<project>] [--format csv|csv.gz|csv.zst|columnar] [--export-path MAP]
+    python main.py overlaps [--limit N]
+
+<project> is een project-ID of een projectnaam. Exitcode 0 bij succes, 1 bij een fout
+(het JSON-object bevat dan "ok": false en "error"), 2 bij ongeldige argumenten.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from config import DB_PATH, EXPORT_PATH
+from data.database import Database
+from models.project import Project
+from models.work_session import WorkSession, format_duration
+
+
+class CliError(Exception):
+    """Fout die als {"ok": false, "error": ...} gemeld wordt."""
+
+
+def _timestamp(moment: Optional[datetime]) -> Optional[str]:
+    return moment.isoformat(timespec="seconds") if moment else None
+
+
+def session_to_dict(session: WorkSession, project: Optional[Project]) -> Dict:
+    seconds = int(session.duration.total_seconds())
+    return {
+        "id": session.id,
+        "project_id": session.project_id,
+        "project": project.name if project else None,
+        "description": session.description or "",
+        "start_time": _timestamp(session.start_time),
+        "end_time": _timestamp(session.end_time),
+        "seconds": seconds,
+        "duration": format_duration(seconds),
+    }
+
+
+def find_project(db: Database, reference: str) -> Project:
+    """Zoekt een project op ID of (hoofdletterongevoelig) op naam."""
+    if reference.isdigit():
+        project = db.get_project(int(reference))
+        if project:
+            return project
+    matches = [p for p in db.get_all_projects_including_archived() if p.name.lower() == reference.lower()]
+    if not matches:
+        raise CliError(f"Project '{reference}' niet gevonden.")
+    if len(matches) > 1:
+        raise CliError(f"Meerdere projecten heten '{reference}', gebruik het project-ID.")
+    return matches[0]
+
+
+# === SUBCOMMANDO'S ===
+def _start(db: Database, args: argparse.Namespace) -> Dict:
+    project = find_project(db, args.project)
+    if project.archived:
+        raise CliError(f"Project '{project.name}' is gearchiveerd.")
+    session = db.start_work_session(project.proj_id, args.description)
+    if session is None:
+        active = db.get_active_work_session()
+        raise CliError("Er loopt al een sessie" + (f" (sessie {active.id})." if active else "."))
+    return {"session": session_to_dict(session, project)}
+
+
+def _stop(db: Database, args: argparse.Namespace) -> Dict:
+    project = find_project(db, args.project) if args.project else None
+    session = db.stop_active_work_session(project.proj_id if project else None)
+    if session is None:
+        raise CliError("Er loopt geen sessie" + (f" voor project '{project.name}'." if project else "."))
+    return {"session": session_to_dict(session, project or db.get_project(session.project_id))}
+
+
+def _status(db: Database, args: argparse.Namespace) -> Dict:
+    session = db.get_active_work_session()
+    if session is None:
+        return {"active": False, "session": None}
+    return {"active": True, "session": session_to_dict(session, db.get_project(session.project_id))}
+
+
+def build_report(db: Database, project: Optional[Project] = None, period: Optional[str] = None,
+                 start: Optional[date] = None, end: Optional[date] = None) -> Dict:
+    """Gewerkte tijd per project, of met `period` per dag/week/maand (ook gebruikt door de API-server)."""
+    if period:
+        totals = db.get_worked_seconds_per_period(period, project.proj_id if project else None, start, end)
+        return {
+            "period": period,
+            "project_id": project.proj_id if project else None,
+            "totals": [{"period": key, "seconds": seconds, "duration": format_duration(seconds)}
+                       for key, seconds in totals.items()],
+        }
+
+    totals = db.get_total_seconds_per_project()
+    projects = [project] if project else db.get_all_projects_including_archived()
+    return {
+        "projects": [
+            {
+                "id": p.proj_id,
+                "name": p.name,
+                "archived": p.archived,
+                "seconds": totals.get(p.proj_id, 0),
+                "duration": format_duration(totals.get(p.proj_id, 0)),
+            }
+            for p in projects
+        ],
+    }
+
+
+def _report(db: Database, args: argparse.Namespace) -> Dict:
+    project = find_project(db, args.project) if args.project else None
+    return build_report(db, project, args.period, args.start, args.end)
+
+
+def _export(db: Database, args: argparse.Namespace) -> Dict:
+    # Pas hier importeren: start/stop/status hebben de exportmodules niet nodig.
+    from services.bulk_export import export_all_projects
+    from services.exporters import export_project, get_exporter
+
+    # Formaat en optionele pakketten controleren vóór er iets geëxporteerd wordt.
+    try:
+        get_exporter(args.format).check_available()
+    except RuntimeError as e:
+        raise CliError(str(e))
+
+    if args.project:
+        project = find_project(db, args.project)
+        try:
+            file_path = export_project(db, project, args.format, args.export_path)
+        except RuntimeError as e:
+            raise CliError(str(e))
+        return {"files": [file_path], "projects": 1}
+
+    try:
+        result = export_all_projects(db, args.export_path, format_name=args.format, progress=None)
+    except RuntimeError as e:
+        raise CliError(str(e))
+    return {
+        "files": result.files,
+        "projects": result.projects,
+        "rows": result.rows,
+        "seconds": round(result.seconds, 3),
+    }
+
+
+def _overlaps(db: Database, args: argparse.Namespace) -> Dict:
+    pairs = db.get_overlapping_session_pairs(args.limit)
+    projects = {p.proj_id: p for p in db.get_all_projects_including_archived()}
+    overlaps = []
+    now = datetime.now()
+    for first, second in pairs:
+        overlap_end = min(first.end_time or now, second.end_time or now)
+        overlap_start = max(first.start_time, second.start_time)
+        overlaps.append({
+            "first": session_to_dict(first, projects.get(first.project_id)),
+            "second": session_to_dict(second, projects.get(second.project_id)),
+            "overlap_seconds": max(int((overlap_end - overlap_start).total_seconds()), 0),
+        })
+    return {"count": len(overlaps), "overlaps": overlaps}
+
+
+def _parse_date(text: str) -> date:
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ongeldige datum '{text}', verwacht JJJJ-MM-DD")
+
+
+COMMANDS = ("start", "stop", "status", "report", "export", "overlaps")
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Bouwt de argumentparser. Met `command` wordt enkel dat subcommando opgebouwd: elke
+    subparser kost enkele ms (argparse-formatters), en een shell-hook heeft er maar één nodig.
+    Zonder `command` (of bij een onbekend commando, voor de foutmelding en --help) alle.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py", description="Project Time Tracker zonder menu's; uitvoer als JSON."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def wanted(name: str) -> bool:
+        return command is None or command == name
+
+    if wanted("start"):
+        start = commands.add_parser("start", help="Start een werksessie")
+        start.add_argument("project", help="Project-ID of projectnaam")
+        start.add_argument("--description", "-d", default="", help="Beschrijving van de sessie")
+        start.set_defaults(handler=_start)
+
+    if wanted("stop"):
+        stop = commands.add_parser("stop", help="Stop de lopende werksessie")
+        stop.add_argument("--project", help="Stop enkel als de sessie bij dit project hoort")
+        stop.set_defaults(handler=_stop)
+
+    if wanted("status"):
+        status = commands.add_parser("status", help="Toon de lopende werksessie")
+        status.set_defaults(handler=_status)
+
+    if wanted("report"):
+        report = commands.add_parser("report", help="Gewerkte tijd per project of per periode")
+        report.add_argument("--period", choices=("day", "week", "month"), help="Groepeer per dag, week of maand")
+        report.add_argument("--project", help="Beperk tot één project")
+        report.add_argument("--from", dest="start", type=_parse_date, help="Eerste dag (JJJJ-MM-DD), met --period")
+        report.add_argument("--to", dest="end", type=_parse_date, help="Laatste dag, niet inbegrepen, met --period")
+        report.set_defaults(handler=_report)
+
+    if wanted("export"):
+        export = commands.add_parser("export", help="Exporteer één project of alle projecten")
+        export.add_argument("project", nargs="?", help="Project-ID of projectnaam (default: alle projecten)")
+        export.add_argument("--format", default="csv", help="csv, csv.gz, csv.zst of columnar")
+        export.add_argument("--export-path", default=EXPORT_PATH, help=f"Doelmap (default: {EXPORT_PATH})")
+        export.set_defaults(handler=_export)
+
+    if wanted("overlaps"):
+        overlaps = commands.add_parser("overlaps", help="Auditrapport: sessies die elkaar in de tijd overlappen")
+        overlaps.add_argument("--limit", type=int, help="Maximaal aantal paren")
+        overlaps.set_defaults(handler=_overlaps)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv and argv[0] in COMMANDS else None
+    if argv == ["status"]:
+        # Zonder argumenten valt er niets te parsen; de parser opbouwen (gettext, terminalbreedte
+        # van de help-formatter) kostte ~9 ms van een prompt- of hook-aanroep.
+        args = argparse.Namespace(command="status", handler=_status)
+    else:
+        args = build_parser(command).parse_args(argv)
+
+    # Meldingen van de database- en exportlaag gaan naar stderr, zodat stdout enkel JSON bevat.
+    stdout = sys.stdout
+    db = None
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+            db = Database()
+            result = dict(ok=True, **args.handler(db, args))
+        exit_code = 0
+    except (CliError, ValueError) as e:
+        result, exit_code = {"ok": False, "error": str(e)}, 1
+    except sqlite3.Error as e:
+        result, exit_code = {"ok": False, "error": f"Databasefout: {e}"}, 1
+    except OSError as e:
+        result, exit_code = {"ok": False, "error": str(e)}, 1
+    finally:
+        if db is not None:
+            db.close()
+
+    json.dump(result, stdout, ensure_ascii=False)
+    stdout.write("\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,12 @@
 # ui/main_menu.py
 
 import sys
-from data.database import Database
+from typing import List
+from data.cache import CachedDatabase
 from ui.project_menu import ProjectMenu
-from models.work_session import WorkSession
+from models.work_session import WorkSession, format_duration
 from models.project import Project
+from models.project_summary import ProjectSummary
 
 
 class MainMenu:
@@ -12,18 +14,19 @@ class MainMenu:
     Hoofdmenu van de Project Time Tracker applicatie.
     Toont alleen actieve (niet-gearchiveerde) projecten en huidige actieve werksessie.
     """
-    def __init__(self, db: Database):
+    def __init__(self, db: CachedDatabase):
         self.header = "\n=== Project Time Tracker ==="
         self.options = [
             "1. Toon actieve projecten",
             "2. Open project",
             "3. Maak nieuw project",
             "4. Stop actieve werksessie",
-            "5. Afsluiten"
+            "5. Zoeken in sessies en projecten",
+            "6. Afsluiten"
         ]
         self.db = db
         self.active_session: WorkSession | None = None
-        self.active_projects: list[Project] = []
+        self.active_projects: List[Project] = []
 
     def run(self):
         """Hoofdloop van de applicatie – blijft draaien tot afsluiten."""
@@ -33,7 +36,7 @@ class MainMenu:
             self._print_header_and_status(active_session)
             self._print_options()
 
-            choice = input("Selecteer een optie (1-5): ").strip()
+            choice = input("Selecteer een optie (1-6): ").strip()
 
             if choice == "1":
                 self._show_active_projects()
@@ -47,6 +50,8 @@ class MainMenu:
                 self._stop_active_session()
                 active_session = None  # Sessie is gestopt
             elif choice == "5":
+                self._search()
+            elif choice == "6":
                 print("Tot ziens!")
                 sys.exit(0)
             else:
@@ -64,8 +69,7 @@ class MainMenu:
         print("-" * 50)
 
         if active_session:
-            project = next((p for p in self.db.get_active_projects()
-                           if p.proj_id == active_session.project_id), None)
+            project = self.db.get_project(active_session.project_id)
             proj_name = project.name if project else "Onbekend project"
             print(f"*** ACTIEVE SESSIE: {proj_name} ***")
             print(f"    Gestart om: {active_session.start_time.strftime('%H:%M:%S')}")
@@ -83,31 +87,35 @@ class MainMenu:
         print()
 
     def _show_active_projects(self):
+        """Toont de actieve projecten met hun kerncijfers."""
+        self._print_project_summaries(self.db.get_active_project_summaries())
+
+    def _print_project_summaries(self, summaries: List[ProjectSummary]):
+        """Print het overzicht van projecten met aantal sessies en totale duur."""
         print("\nActieve projecten:")
         print("-" * 50)
-        projects = self.db.get_active_projects()
-        if not projects:
+        if not summaries:
             print("  → Nog geen projecten aangemaakt.")
         else:
-            for p in projects:
-                sessie_count = len(self.db.get_work_sessions_for_project(p.proj_id))
-                print(f"  [{p.proj_id}] {p.name} – {sessie_count} sessie(s)"
+            for summary in summaries:
+                p = summary.project
+                print(f"  [{p.proj_id}] {p.name} – {summary.session_count} sessie(s), "
+                      f"{format_duration(summary.total_seconds)}"
                       f"{' (gearchiveerd)' if p.archived else ''}")
         print()
 
     def _open_existing_project(self):
         """Opent een bestaand project."""
-        projects = self.db.get_active_projects()
-        if not projects:
+        summaries = self.db.get_active_project_summaries()
+        if not summaries:
             print("Geen actieve projecten om te openen.")
             return
 
-        self._show_active_projects()
+        self._print_project_summaries(summaries)
         try:
             proj_id = int(input("Voer project-ID in: ").strip())
-            project = next((p for p in projects if p.proj_id == proj_id), None)
+            project = next((s.project for s in summaries if s.project.proj_id == proj_id), None)
             if project:
-                project.work_sessions = self.db.get_work_sessions_for_project(project.proj_id)
                 self._open_project(project)
             else:
                 print("Project niet gevonden.")
@@ -131,22 +139,45 @@ class MainMenu:
         return project
 
     def _open_project(self, project):
-        """Opent het projectmenu voor een specifiek project """
-        project.work_sessions = self.db.get_work_sessions_for_project(project.proj_id)
+        """Opent het projectmenu voor een specifiek project (dat zelf de sessies laadt)."""
         project_menu = ProjectMenu(project, self.db)
         project_menu.run()
 
+    def _search(self):
+        """Zoekt op trefwoorden in projecten en sessiebeschrijvingen en toont de beste resultaten."""
+        text = input("Zoekterm: ").strip()
+        if not text:
+            print("Geen zoekterm opgegeven.")
+            return
+
+        projects = self.db.search_projects(text, limit=5)
+        sessions = self.db.search_work_sessions(text, limit=20)
+        if not projects and not sessions:
+            print(f"Niets gevonden voor '{text}'.")
+            return
+
+        if projects:
+            print("\nProjecten:")
+            print("-" * 80)
+            for result in projects:
+                p = result.project
+                print(f"  [{p.proj_id}] {p.name}{' (gearchiveerd)' if p.archived else ''} – {result.snippet}")
+        if sessions:
+            print("\nWerksessies:")
+            print("-" * 80)
+            for result in sessions:
+                s = result.session
+                duur = s.duration_str() if s.end_time else "lopend"
+                print(f"  {s.start_time.strftime('%d/%m/%Y %H:%M')}  {duur:<12} "
+                      f"[{result.project.proj_id}] {result.project.name}: {result.snippet}")
+        print()
+
     def _stop_active_session(self):
         """Stopt de huidige actieve werksessie, indien aanwezig."""
-        active = self.db.get_active_work_session()
-        if not active:
+        stopped = self.db.stop_active_work_session()
+        if not stopped:
             print("Er loopt geen actieve sessie.")
             return
 
-        # Stop de sessie
-        from datetime import datetime
-        active.end_time = datetime.now()
-        self.db.update_work_session_in_db(active)
-
-        duur = active.duration_str()
-        print(f"Sessie gestopt! Totale duur: {duur}")
\ No newline at end of file
+        duur = stopped.duration_str()
+        print(f"Sessie gestopt! Totale duur: {duur}")
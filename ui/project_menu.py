@@ -1,11 +1,15 @@
 # ui/project_menu.py
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional
 from models.project import Project
 from models.work_session import WorkSession
-from data.database import Database
+from data.cache import CachedDatabase
 import services.csv_export
 
+# Aantal werksessies per pagina in "Toon alle werksessies".
+PAGE_SIZE = 15
+
 
 class ProjectMenu:
     """
@@ -13,11 +17,10 @@ class ProjectMenu:
     Beheert werksessies, bewerken, archiveren en exporteren.
     """
 
-    def __init__(self, project: Project, db: Database):
+    def __init__(self, project: Project, db: CachedDatabase):
         self.project = project
         self.db = db
-        # Zorg dat de sessies altijd up-to-date zijn
-        self.project.work_sessions = self.db.get_work_sessions_for_project(project.proj_id)
+        # De sessies worden niet allemaal geladen: telling, actieve sessie en pagina's komen uit de database.
 
         self.options = [
             "1. Start nieuwe werksessie",
@@ -49,7 +52,7 @@ class ProjectMenu:
             elif choice == "4":
                 self._edit_project()
             elif choice == "5":
-                services.csv_export.export_project_to_csv(self.project)
+                services.csv_export.stream_project_to_csv(self.db, self.project)
             elif choice == "6":
                 self._archive_project()
             elif choice == "7":
@@ -88,12 +91,12 @@ class ProjectMenu:
         print(f" ID: {self.project.proj_id}")
         if self.project.description:
             print(f" Omschrijving: {self.project.description}")
-        print(f" Aantal sessies: {len(self.project.work_sessions)}")
+        print(f" Aantal sessies: {self.db.count_work_sessions(self.project.proj_id)}")
         print(f"{'='*60}")
 
     def _print_active_session_status(self):
         """Print de status van de actieve werksessie, indien aanwezig."""
-        active = next((s for s in self.project.work_sessions if s.is_active), None)
+        active = self._active_session()
         if active:
             duur = datetime.now() - active.start_time
             uren, rest = divmod(duur.seconds, 3600)
@@ -112,43 +115,87 @@ class ProjectMenu:
             print(opt)
         print()
 
+    def _active_session(self) -> Optional[WorkSession]:
+        """De actieve werksessie, als die bij dit project hoort."""
+        active = self.db.get_active_work_session()
+        return active if active and active.project_id == self.project.proj_id else None
+
     # ===*** Actie methoden ***===
 
     def _start_session(self):
         """Start een nieuwe werksessie voor het project."""
         if not self.check_for_active_session(): # Controleer op lopende sessie
             desc = input("Beschrijving sessie (optioneel): ").strip()
-            session = WorkSession(
-                project_id=self.project.proj_id,
-                start_time=datetime.now(),
-                description=desc or None
-            )
-            self.db.add_work_session_to_db(session)
-            self.project.work_sessions.append(session)
+            # Atomair: als intussen een ander proces een sessie startte, wordt er geen tweede gestart.
+            session = self.db.start_work_session(self.project.proj_id, desc)
+            if session is None:
+                print("Er werd intussen al een andere sessie gestart.")
+                return
             print(f"Nieuwe sessie gestart om {session.start_time.strftime('%H:%M:%S')}")
 
     def _stop_session(self):
         """Stopt de actieve werksessie voor het project."""
-        active = next((s for s in self.project.work_sessions if s.is_active), None)
-        if not active:
+        stopped = self.db.stop_active_work_session(project_id=self.project.proj_id)
+        if not stopped:
             print("Geen actieve sessie om te stoppen.")
             return
 
-        active.end_time = datetime.now()
-        self.db.update_work_session_in_db(active)
-        print(f"Sessie gestopt → Totale duur: {active.duration_str()}")
+        print(f"Sessie gestopt → Totale duur: {stopped.duration_str()}")
 
     def _show_sessions(self):
-        """Toont alle werksessies voor het project in een lijst."""
-        if not self.project.work_sessions:
-            print("Nog geen werksessies geregistreerd.")
+        """
+        Toont de werksessies van het project per pagina, nieuwste eerst, optioneel beperkt
+        tot een periode. Er wordt telkens maar één pagina uit de database geladen.
+        """
+        try:
+            start = self._ask_date("Vanaf datum (dd/mm/jjjj, leeg = geen grens): ")
+            until = self._ask_date("Tot en met datum (dd/mm/jjjj, leeg = geen grens): ")
+        except ValueError:
+            print("Ongeldige datum. Gebruik het formaat dd/mm/jjjj.")
             return
+        end = until + timedelta(days=1) if until else None
 
-        print(f"\nWerksessies voor '{self.project.name}':")
+        page_number = 1
+        position, older = None, True
+        while True:
+            # Eén sessie extra ophalen om te weten of er nog een pagina volgt in die richting.
+            sessions = self.db.get_work_sessions_page(self.project.proj_id, PAGE_SIZE + 1, position, older,
+                                                      start, end)
+            if older:
+                has_older = len(sessions) > PAGE_SIZE
+                sessions = sessions[:PAGE_SIZE]
+            else:
+                has_older = True  # we komen van een oudere pagina
+                sessions = sessions[-PAGE_SIZE:]
+            if not sessions:
+                print("Geen werksessies gevonden.")
+                return
+
+            self._print_sessions_page(sessions, page_number)
+            choices = []
+            if has_older:
+                choices.append("[v]olgende")
+            if page_number > 1:
+                choices.append("[p] vorige")
+            choices.append("[t]erug")
+            choice = input(f"{', '.join(choices)}: ").strip().lower()
+
+            if choice.startswith("v") and has_older:
+                position, older = (sessions[-1].start_time, sessions[-1].id), True
+                page_number += 1
+            elif choice.startswith("p") and page_number > 1:
+                position, older = (sessions[0].start_time, sessions[0].id), False
+                page_number -= 1
+            else:
+                return
+
+    def _print_sessions_page(self, sessions: List[WorkSession], page_number: int):
+        """Print één pagina werksessies in een tabel."""
+        print(f"\nWerksessies voor '{self.project.name}' (pagina {page_number}):")
         print("-" * 80)
         print(f"{'Start':<19} {'Einde':<19} {'Duur':<12} Beschrijving")
         print("-" * 80)
-        for s in sorted(self.project.work_sessions, key=lambda x: x.start_time, reverse=True):
+        for s in sessions:
             start = s.start_time.strftime("%d/%m/%Y %H:%M")
             end = s.end_time.strftime("%H:%M") if s.end_time else "Lopend"
             duur = s.duration_str() if s.end_time else "← lopend"
@@ -156,6 +203,12 @@ class ProjectMenu:
             print(f"{start}  {end:<19} {duur:<12} {desc}")
         print()
 
+    @staticmethod
+    def _ask_date(prompt: str) -> Optional[datetime]:
+        """Vraagt een datum (dd/mm/jjjj); leeg = None. Gooit ValueError bij een ongeldige datum."""
+        text = input(prompt).strip()
+        return datetime.strptime(text, "%d/%m/%Y") if text else None
+
     def _edit_project(self):
         """Bewerkt de naam en omschrijving van het project."""
         print(f"Huidige naam: {self.project.name}")